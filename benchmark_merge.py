@@ -0,0 +1,67 @@
+"""
+Script to compare the sequential and parallel merges on a set of PDF files.
+
+Usage: python benchmark_merge.py [--workers N] [--batch-size N] file1.pdf [file2.pdf ...]
+       python benchmark_merge.py [--workers N] [--batch-size N] path/to/folder
+"""
+import argparse
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Make the core package importable when run from the project root
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "src"))
+
+from core.pdf_merger import PDFMerger, DEFAULT_BATCH_SIZE
+
+
+def collect_pdfs(paths):
+    """Expand folders into the PDF files they contain."""
+    pdfs = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            pdfs.extend(sorted(path.rglob("*.pdf")))
+        else:
+            pdfs.append(path)
+    return pdfs
+
+
+def print_report(report):
+    """Print the benchmark report as a table."""
+    print(f"{'mode':<12}{'pages':>8}{'seconds':>10}{'combine s':>11}{'speedup':>9}{'MiB':>9}")
+    baseline = report["sequential"]["seconds"]
+    for mode, stats in report.items():
+        print(f"{mode:<12}{stats['pages']:>8}{stats['seconds']:>10.2f}"
+              f"{stats.get('combine_seconds', 0.0):>11.2f}{baseline / stats['seconds']:>9.2f}"
+              f"{stats['size'] / 2 ** 20:>9.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark sequential and parallel PDF merges")
+    parser.add_argument("paths", nargs="+", help="PDF files or folders")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Documents per batch")
+    args = parser.parse_args()
+
+    pdfs = collect_pdfs(args.paths)
+    if not pdfs:
+        print("Error: no PDF files given")
+        sys.exit(1)
+
+    print(f"Merging {len(pdfs)} file(s)...")
+    report = {}
+    with tempfile.TemporaryDirectory(prefix="pdf-merge-bench-") as work_dir:
+        sequential_path = os.path.join(work_dir, "sequential.pdf")
+        parallel_path = os.path.join(work_dir, "parallel.pdf")
+        report["sequential"] = PDFMerger.merge_pdfs_streaming(pdfs, sequential_path)
+        report["parallel"] = PDFMerger.merge_pdfs_parallel(
+            pdfs, parallel_path, workers=args.workers, batch_size=args.batch_size
+        )
+        if report["sequential"] is None or report["parallel"] is None:
+            print("Error: merge failed")
+            sys.exit(1)
+        report["sequential"]["size"] = os.path.getsize(sequential_path)
+        report["parallel"]["size"] = os.path.getsize(parallel_path)
+
+    print_report(report)
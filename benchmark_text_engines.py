@@ -0,0 +1,45 @@
+"""
+Script to compare the text extraction engines on a corpus of PDF files.
+
+Usage: python benchmark_text_engines.py file1.pdf [file2.pdf ...]
+       python benchmark_text_engines.py path/to/folder
+"""
+import os
+import sys
+from pathlib import Path
+
+# Make the core package importable when run from the project root
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "src"))
+
+from core.text_extractor import TextExtractor
+
+
+def collect_pdfs(paths):
+    """Expand folders into the PDF files they contain."""
+    pdfs = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            pdfs.extend(sorted(path.rglob("*.pdf")))
+        else:
+            pdfs.append(path)
+    return pdfs
+
+
+def print_report(report):
+    """Print the benchmark report as a table."""
+    print(f"{'engine':<12}{'pages':>8}{'seconds':>10}{'pages/s':>10}{'chars':>12}"
+          f"{'similarity':>12}{'differing':>11}")
+    for engine, stats in report.items():
+        print(f"{engine:<12}{stats['pages']:>8}{stats['seconds']:>10.2f}"
+              f"{stats['pages_per_second']:>10.1f}{stats['chars']:>12}"
+              f"{stats['similarity']:>12.3f}{stats['pages_differing']:>11}")
+
+
+if __name__ == "__main__":
+    pdfs = collect_pdfs(sys.argv[1:])
+    if not pdfs:
+        print("Error: no PDF files given")
+        sys.exit(1)
+    
+    print(f"Benchmarking {len(pdfs)} file(s)...")
+    print_report(TextExtractor.benchmark_engines(pdfs))
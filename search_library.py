@@ -0,0 +1,52 @@
+"""
+Script to index a folder of PDF files and search their text.
+
+Usage: python search_library.py index path/to/folder [path/to/other/folder ...]
+       python search_library.py search "words to find" [--limit N]
+"""
+import argparse
+import os
+import sys
+import time
+
+# Make the core package importable when run from the project root
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "src"))
+
+from core.library_index import LibraryIndex
+from core.text_extractor import TextCache
+
+
+def parse_args(argv):
+    """Parse the command line."""
+    parser = argparse.ArgumentParser(description="Full-text search over a PDF library")
+    parser.add_argument("--index-file", help="SQLite index file (defaults to the user cache dir)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    index_parser = commands.add_parser("index", help="index or re-index folders")
+    index_parser.add_argument("folders", nargs="+")
+
+    search_parser = commands.add_parser("search", help="search the indexed pages")
+    search_parser.add_argument("query")
+    search_parser.add_argument("--limit", type=int, default=20)
+    search_parser.add_argument("--raw", action="store_true", help="use FTS5 query syntax")
+
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args(sys.argv[1:])
+    index = LibraryIndex(args.index_file, text_cache=TextCache())
+
+    if args.command == "index":
+        for folder in args.folders:
+            summary = index.update(folder)
+            print(f"{folder}: {summary['indexed']} indexed, {summary['unchanged']} unchanged, "
+                  f"{summary['removed']} removed, {summary['failed']} failed "
+                  f"({summary['pages']} pages)")
+    else:
+        start = time.perf_counter()
+        hits = index.search(args.query, limit=args.limit, raw=args.raw)
+        elapsed = (time.perf_counter() - start) * 1000
+        for hit in hits:
+            print(f"{hit.file}  p.{hit.page + 1}  {hit.snippet}")
+        print(f"{len(hits)} hit(s) in {elapsed:.1f} ms")
@@ -4,15 +4,21 @@ Core package for PDF processing functionality.
 from .pdf_merger import PDFMerger
 from .pdf_splitter import PDFSplitter
 from .text_extractor import TextExtractor
+from .table_extractor import TableExtractor
 from .page_reorganizer import PageReorganizer
 from .security import PDFSecurity
 from .thumbnail import ThumbnailGenerator
+from .library_index import LibraryIndex
+from .document_pool import DocumentPool
 
 __all__ = [
     'PDFMerger',
     'PDFSplitter',
     'TextExtractor',
+    'TableExtractor',
     'PageReorganizer',
     'PDFSecurity',
     'ThumbnailGenerator',
+    'LibraryIndex',
+    'DocumentPool',
 ] 
\ No newline at end of file
@@ -0,0 +1,143 @@
+"""
+Module for sharing parsed PDF documents between operations.
+"""
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Union, Dict, Optional
+
+from pypdf import PdfReader
+
+
+class DocumentPool:
+    """
+    Process-wide LRU pool of parsed PDF documents.
+
+    Readers are keyed on the absolute path and reused while the file's size
+    and modification time are unchanged, so loading a file, counting its
+    pages and then splitting it parses the cross-reference table once.
+    Documents are read fully into memory, so pooled readers hold no open
+    file handle; the pool is bounded both by document count and by the
+    total size of the pooled files.
+
+    Pooled readers are shared objects: use a reader from one thread at a
+    time and do not modify it (e.g. by decrypting it). page_count is safe
+    to call from any thread.
+    """
+
+    def __init__(self, max_documents: int = 16, max_bytes: int = 256 * 1024 * 1024):
+        """
+        Initialize the document pool.
+
+        Args:
+            max_documents: Maximum number of parsed documents kept
+            max_bytes: Maximum total size of the pooled files
+        """
+        self.max_documents = max_documents
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # path -> (size, mtime_ns, reader, page count)
+        self._total_bytes = 0
+        self._lock = threading.RLock()
+
+    def _entry(self, input_path: Union[str, Path]) -> list:
+        """Return the up-to-date pool entry of a file, parsing it if needed."""
+        path = os.path.abspath(str(input_path))
+        stat = os.stat(path)
+
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry[:2] == [stat.st_size, stat.st_mtime_ns]:
+                self._entries.move_to_end(path)
+                self.hits += 1
+                return entry
+            self._discard(path)
+            self.misses += 1
+
+            entry = [stat.st_size, stat.st_mtime_ns, PdfReader(path), None]
+            if stat.st_size <= self.max_bytes:
+                self._entries[path] = entry
+                self._total_bytes += stat.st_size
+                while (len(self._entries) > self.max_documents
+                       or self._total_bytes > self.max_bytes):
+                    self._discard(next(iter(self._entries)))
+            return entry
+
+    def _discard(self, path: str) -> None:
+        """Drop a pooled document, if present."""
+        entry = self._entries.pop(path, None)
+        if entry is not None:
+            self._total_bytes -= entry[0]
+
+    def get_reader(self, input_path: Union[str, Path]) -> PdfReader:
+        """
+        Return a parsed reader for a PDF file.
+
+        Args:
+            input_path: Path to the PDF file
+
+        Returns:
+            PdfReader: Shared reader of the current file contents
+        """
+        return self._entry(input_path)[2]
+
+    def page_count(self, input_path: Union[str, Path]) -> int:
+        """
+        Return the number of pages of a PDF file.
+
+        Args:
+            input_path: Path to the PDF file
+
+        Returns:
+            int: Page count
+        """
+        with self._lock:
+            entry = self._entry(input_path)
+            if entry[3] is None:
+                entry[3] = len(entry[2].pages)
+            return entry[3]
+
+    def invalidate(self, input_path: Optional[Union[str, Path]] = None) -> None:
+        """
+        Forget a pooled document, or all of them.
+
+        Args:
+            input_path: Path of the document to drop (None drops everything)
+        """
+        with self._lock:
+            if input_path is None:
+                self._entries.clear()
+                self._total_bytes = 0
+            else:
+                self._discard(os.path.abspath(str(input_path)))
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return pool statistics.
+
+        Returns:
+            Dict[str, int]: hits, misses, documents and bytes
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "documents": len(self._entries),
+                "bytes": self._total_bytes,
+            }
+
+
+# Pool shared by the core operations of this process
+default_pool = DocumentPool()
+
+
+def get_reader(input_path: Union[str, Path]) -> PdfReader:
+    """Return a reader for a PDF file from the shared pool."""
+    return default_pool.get_reader(input_path)
+
+
+def page_count(input_path: Union[str, Path]) -> int:
+    """Return the page count of a PDF file using the shared pool."""
+    return default_pool.page_count(input_path)
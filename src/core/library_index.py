@@ -0,0 +1,270 @@
+"""
+Module for full-text search over a library of PDF files.
+"""
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Union, List, Dict, Optional, Callable, Iterator, NamedTuple
+
+from .text_extractor import TextExtractor, TextCache
+from .utils import default_cache_dir
+
+# Number of words of context shown around a match in search snippets
+SNIPPET_TOKENS = 12
+
+# Bump when the table layout changes; older index files are rebuilt
+INDEX_SCHEMA_VERSION = 2
+
+
+class LibraryHit(NamedTuple):
+    """A page matching a library search."""
+    file: str
+    page: int
+    snippet: str
+    score: float
+
+
+class LibraryIndex:
+    """
+    On-disk full-text index of page-level text across directory trees.
+
+    Page text is stored in an SQLite FTS5 table, so queries are ranked with
+    BM25 and answered without opening any PDF. The pages of a file occupy a
+    contiguous rowid range recorded with the file, so its pages are dropped
+    without scanning the text table. Updating the index only re-extracts
+    files whose size or modification time changed. The index can be shared
+    between threads.
+    """
+
+    def __init__(self,
+                 index_path: Optional[Union[str, Path]] = None,
+                 engine: str = "auto",
+                 text_cache: Optional[TextCache] = None):
+        """
+        Initialize the library index.
+
+        Args:
+            index_path: SQLite file to use (defaults to the user cache dir)
+            engine: Text extraction engine used while indexing
+            text_cache: Optional TextCache shared with text extraction
+        """
+        self.index_path = (Path(index_path) if index_path
+                           else default_cache_dir("library") / "library_index.sqlite3")
+        self.engine = engine
+        self.text_cache = text_cache
+        self._conn = None
+        self._lock = threading.RLock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use and create its tables."""
+        if self._conn is None:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.index_path), check_same_thread=False)
+            version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != INDEX_SCHEMA_VERSION:
+                # The index can always be rebuilt, so old layouts are dropped
+                self._conn.executescript("""
+                    DROP TABLE IF EXISTS files;
+                    DROP TABLE IF EXISTS pages;
+                """)
+            self._conn.executescript(f"""
+                CREATE TABLE IF NOT EXISTS files (
+                    path TEXT PRIMARY KEY,
+                    size INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    pages INTEGER NOT NULL,
+                    first_rowid INTEGER NOT NULL,
+                    indexed_at REAL NOT NULL
+                );
+                CREATE VIRTUAL TABLE IF NOT EXISTS pages USING fts5(
+                    path UNINDEXED,
+                    page UNINDEXED,
+                    text,
+                    tokenize = 'unicode61 remove_diacritics 2'
+                );
+                PRAGMA user_version = {INDEX_SCHEMA_VERSION};
+            """)
+        return self._conn
+
+    @staticmethod
+    def find_pdfs(root: Union[str, Path]) -> Iterator[str]:
+        """
+        Find the PDF files in a directory tree.
+
+        Args:
+            root: Directory to search
+
+        Yields:
+            str: Absolute path of each PDF file, in a stable order
+        """
+        for dirpath, dirnames, filenames in os.walk(os.path.abspath(str(root))):
+            dirnames.sort()
+            for filename in sorted(filenames):
+                if filename.lower().endswith(".pdf"):
+                    yield os.path.join(dirpath, filename)
+
+    def update(self,
+               root: Union[str, Path],
+               progress: Optional[Callable[[int, int, str], None]] = None,
+               cancel: Optional[threading.Event] = None) -> Dict[str, int]:
+        """
+        Bring the index up to date with the PDF files under a directory.
+
+        New and changed files are (re-)extracted, unchanged files are kept
+        and files that disappeared from the tree are dropped.
+
+        Args:
+            root: Directory tree to index
+            progress: Optional callback receiving (files done, total files, path)
+            cancel: Optional event that stops the update between files
+
+        Returns:
+            Dict[str, int]: Counts of "indexed", "unchanged", "removed" and
+            "failed" files and of "pages" indexed
+        """
+        summary = {"indexed": 0, "unchanged": 0, "removed": 0, "failed": 0, "pages": 0}
+        root = os.path.abspath(str(root))
+        paths = list(self.find_pdfs(root))
+
+        with self._lock:
+            known = {
+                path: (size, mtime_ns)
+                for path, size, mtime_ns in self._connect().execute(
+                    "SELECT path, size, mtime_ns FROM files"
+                )
+            }
+
+        for done, path in enumerate(paths, 1):
+            if cancel is not None and cancel.is_set():
+                return summary
+
+            try:
+                stat = os.stat(path)
+                if known.get(path) == (stat.st_size, stat.st_mtime_ns):
+                    summary["unchanged"] += 1
+                else:
+                    summary["pages"] += self._index_file(path, stat)
+                    summary["indexed"] += 1
+            except Exception as e:
+                print(f"Error indexing {path}: {str(e)}")
+                summary["failed"] += 1
+
+            if progress is not None:
+                progress(done, len(paths), path)
+
+        # Drop files under this root that no longer exist
+        prefix = root.rstrip(os.sep) + os.sep
+        seen = set(paths)
+        removed = [path for path in known if path.startswith(prefix) and path not in seen]
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                for path in removed:
+                    self._delete_pages(conn, path)
+                    conn.execute("DELETE FROM files WHERE path = ?", (path,))
+        summary["removed"] = len(removed)
+
+        return summary
+
+    @staticmethod
+    def _delete_pages(conn: sqlite3.Connection, path: str) -> None:
+        """Delete the indexed pages of a file by their rowid range, if it has any."""
+        row = conn.execute(
+            "SELECT first_rowid, pages FROM files WHERE path = ?", (path,)
+        ).fetchone()
+        if row is not None and row[1]:
+            conn.execute(
+                "DELETE FROM pages WHERE rowid BETWEEN ? AND ?", (row[0], row[0] + row[1] - 1)
+            )
+
+    def _index_file(self, path: str, stat: os.stat_result) -> int:
+        """
+        Replace the indexed text of one file.
+
+        Text is extracted before the database is touched, so a file that
+        fails to extract keeps its previous entries and is retried later.
+
+        Returns:
+            int: Number of pages indexed
+        """
+        texts = list(TextExtractor.iter_text(path, engine=self.engine, cache=self.text_cache))
+
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                self._delete_pages(conn, path)
+                # Give the pages consecutive rowids past the current end
+                first_rowid = conn.execute(
+                    "SELECT COALESCE(MAX(rowid), 0) + 1 FROM pages"
+                ).fetchone()[0]
+                conn.executemany(
+                    "INSERT INTO pages (rowid, path, page, text) VALUES (?, ?, ?, ?)",
+                    [(first_rowid + i, path, page_num, text)
+                     for i, (page_num, text) in enumerate(texts)],
+                )
+                conn.execute(
+                    "INSERT OR REPLACE INTO files "
+                    "(path, size, mtime_ns, pages, first_rowid, indexed_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (path, stat.st_size, stat.st_mtime_ns, len(texts), first_rowid, time.time()),
+                )
+        return len(texts)
+
+    @staticmethod
+    def _to_match_query(query: str) -> str:
+        """Quote each word of a plain query so FTS5 operators are taken literally."""
+        return " ".join('"' + word.replace('"', '""') + '"' for word in query.split())
+
+    def search(self, query: str, limit: int = 50, raw: bool = False) -> List[LibraryHit]:
+        """
+        Find the pages containing every word of a query, best matches first.
+
+        Args:
+            query: Words to look for
+            limit: Maximum number of hits to return
+            raw: Pass the query to FTS5 unchanged (enables OR, NEAR, prefix*)
+
+        Returns:
+            List[LibraryHit]: Matching pages with a highlighted snippet
+        """
+        match = query if raw else self._to_match_query(query)
+        if not match.strip():
+            return []
+
+        try:
+            with self._lock:
+                rows = self._connect().execute(
+                    "SELECT path, page, snippet(pages, 2, '[', ']', '...', ?), bm25(pages) "
+                    "FROM pages WHERE pages MATCH ? ORDER BY bm25(pages) LIMIT ?",
+                    (SNIPPET_TOKENS, match, limit),
+                ).fetchall()
+            # bm25() is lower for better matches; flip it so higher is better
+            return [LibraryHit(path, page, snippet, -score) for path, page, snippet, score in rows]
+        except sqlite3.OperationalError as e:
+            print(f"Error searching library: {str(e)}")
+            return []
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return index statistics.
+
+        Returns:
+            Dict[str, int]: Number of indexed "files" and "pages"
+        """
+        with self._lock:
+            # Do not create the database just to report that it is empty
+            if self._conn is None and not self.index_path.exists():
+                return {"files": 0, "pages": 0}
+            files, pages = self._connect().execute(
+                "SELECT COUNT(*), COALESCE(SUM(pages), 0) FROM files"
+            ).fetchone()
+            return {"files": files, "pages": pages}
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -4,7 +4,9 @@ PDF Page Reorganizer module for rearranging pages in PDF files.
 from pathlib import Path
 from typing import Union, List
 
-from pypdf import PdfReader, PdfWriter
+from pypdf import PdfWriter
+
+from .document_pool import get_reader
 
 
 class PageReorganizer:
@@ -31,7 +33,7 @@ class PageReorganizer:
             return False
 
         try:
-            reader = PdfReader(str(input_path))
+            reader = get_reader(input_path)
             writer = PdfWriter()
             
             # Check if all requested pages are within bounds
@@ -1,10 +1,74 @@
 """
 PDF Merger module for combining multiple PDF files into a single document.
 """
+import hashlib
+import io
+import os
+import tempfile
+import time
+from array import array
+from concurrent.futures import CancelledError, ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Union
+from typing import Any, Iterable, List, Union, Dict, Optional, Tuple
 
-from pypdf import PdfMerger
+from pypdf import PageObject, PdfReader, PdfWriter
+from pypdf.generic import (
+    ArrayObject, DictionaryObject, IndirectObject, NameObject, NullObject, StreamObject
+)
+
+from .utils import chunked, default_workers, file_fingerprint, open_handle_count, peak_rss
+
+# Default number of documents merged into one part by a parallel merge
+DEFAULT_BATCH_SIZE = 32
+
+# Catalog entries a parallel merge can combine; parts with other entries
+# (forms, named destinations, page labels...) need a sequential merge
+PART_CATALOG_KEYS = {"/Type", "/Pages", "/Outlines"}
+
+# Input catalog entries that a merge carries into its own catalog (form
+# fields and named destinations); inputs holding them are merged sequentially
+SEQUENTIAL_CATALOG_KEYS = {"/AcroForm", "/Names", "/Dests"}
+
+# Object numbers reserved by _combine_parts for the objects it writes itself
+CATALOG_ID, PAGES_ID, INFO_ID, OUTLINES_ID = 1, 2, 3, 4
+
+# Dictionary types shared between documents built from the same template;
+# streams (font files, images, form XObjects, ICC profiles) are always shared
+SHAREABLE_TYPES = {"/Font", "/FontDescriptor", "/XObject", "/ExtGState", "/Encoding"}
+
+
+class _PartReference(IndirectObject):
+    """Reference written as a placeholder that _combine_parts renumbers."""
+
+    def write_to_stream(self, stream, encryption_key=None) -> None:
+        stream.add_reference(self.idnum)
+
+
+class _PartBuffer:
+    """Byte buffer recording where reference placeholders were written."""
+
+    def __init__(self):
+        self.data = bytearray()
+        self.positions = []
+        self.targets = []
+
+    def write(self, data: bytes) -> None:
+        self.data += data
+
+    def add_reference(self, idnum: int) -> None:
+        self.positions.append(len(self.data))
+        self.targets.append(idnum)
+
+
+def _merge_part(input_paths: List[str], part_path: str) -> Dict[str, Any]:
+    """
+    Process pool worker merging one batch into a part file.
+
+    Returns:
+        Dict[str, Any]: Part description for _combine_parts (see _write_part)
+    """
+    writer, stats = PDFMerger._merge_into_writer(input_paths)
+    return PDFMerger._write_part(writer, part_path, stats)
 
 
 class PDFMerger:
@@ -22,22 +86,619 @@ class PDFMerger:
         Returns:
             bool: True if the merge was successful, False otherwise
         """
-        if not input_paths:
+        return PDFMerger.merge_pdfs_streaming(input_paths, output_path) is not None
+
+    @staticmethod
+    def _replace_references(obj, remap: Dict[int, IndirectObject]):
+        """Point references inside a direct object at their replacements."""
+        if isinstance(obj, IndirectObject):
+            return remap.get(obj.idnum, obj)
+        if isinstance(obj, DictionaryObject):
+            for key, value in obj.items():
+                replaced = PDFMerger._replace_references(value, remap)
+                if replaced is not value:
+                    obj[key] = replaced
+        elif isinstance(obj, ArrayObject):
+            for index, value in enumerate(obj):
+                replaced = PDFMerger._replace_references(value, remap)
+                if replaced is not value:
+                    obj[index] = replaced
+        return obj
+
+    @staticmethod
+    def _iter_references(obj):
+        """Yield the object numbers referenced from inside a direct object."""
+        if isinstance(obj, IndirectObject):
+            yield obj.idnum
+        elif isinstance(obj, DictionaryObject):
+            for value in obj.values():
+                yield from PDFMerger._iter_references(value)
+        elif isinstance(obj, ArrayObject):
+            for value in obj:
+                yield from PDFMerger._iter_references(value)
+
+    @staticmethod
+    def deduplicate_resources(writer: PdfWriter,
+                              first_object: int = 0,
+                              digests: Optional[Dict[bytes, int]] = None) -> Dict[str, int]:
+        """
+        Share identical resources of a document being written.
+
+        Stream objects and font, XObject and graphics state dictionaries
+        added after first_object are hashed by their serialized form, once
+        each. Resources they refer to are handled first, so a font becomes
+        shared in the same pass as its font file. References to duplicates
+        are pointed at the first copy and the duplicates are emptied. Page
+        content streams, including those listed in a /Contents array, are
+        left alone.
+
+        Calling this after each input is appended, with the same digests,
+        drops duplicates as the merge goes instead of keeping them all
+        until the end.
+
+        Args:
+            writer: PdfWriter holding the merged document, before writing
+            first_object: Number of leading objects already deduplicated
+            digests: Hash of each shared object mapped to its object number;
+                     pass the same dictionary to every call of a merge
+
+        Returns:
+            Dict[str, int]: Number of "duplicates_removed" and "bytes_saved"
+        """
+        objects = writer._objects
+        if digests is None:
+            digests = {}
+        new_objects = range(first_object + 1, len(objects) + 1)
+
+        page_contents = set()
+        for idnum in new_objects:
+            page = objects[idnum - 1]
+            if not (isinstance(page, DictionaryObject) and page.get("/Type") == "/Page"):
+                continue
+            contents = page.raw_get("/Contents") if "/Contents" in page else None
+            if isinstance(contents, IndirectObject):
+                page_contents.add(contents.idnum)
+                contents = contents.get_object()
+            if isinstance(contents, ArrayObject):
+                page_contents.update(ref.idnum for ref in contents if isinstance(ref, IndirectObject))
+
+        def shareable(idnum: int) -> bool:
+            obj = objects[idnum - 1]
+            if isinstance(obj, StreamObject):
+                return idnum not in page_contents
+            return isinstance(obj, DictionaryObject) and obj.get("/Type") in SHAREABLE_TYPES
+
+        summary = {"duplicates_removed": 0, "bytes_saved": 0}
+        remap = {}
+        visited = set()
+
+        def share(idnum: int) -> None:
+            visited.add(idnum)
+            obj = objects[idnum - 1]
+            children = list(PDFMerger._iter_references(obj))
+            for child in children:
+                if child > first_object and child not in visited and shareable(child):
+                    share(child)
+            if any(child in remap for child in children):
+                PDFMerger._replace_references(obj, remap)
+
+            buffer = io.BytesIO()
+            obj.write_to_stream(buffer)
+            data = buffer.getvalue()
+            key = hashlib.sha256(data).digest()
+            if key in digests:
+                remap[idnum] = IndirectObject(digests[key], 0, writer)
+                objects[idnum - 1] = NullObject()
+                summary["duplicates_removed"] += 1
+                summary["bytes_saved"] += len(data)
+            else:
+                digests[key] = idnum
+
+        for idnum in new_objects:
+            if idnum not in visited and shareable(idnum):
+                share(idnum)
+
+        # Objects of earlier inputs never refer to new ones, so only the
+        # new objects need their references updated
+        if remap:
+            for idnum in new_objects:
+                if idnum not in visited:
+                    PDFMerger._replace_references(objects[idnum - 1], remap)
+        return summary
+
+    @staticmethod
+    def _share_pages(writer: PdfWriter, first_page: int, end_page: int) -> bool:
+        """
+        Append new pages sharing the contents and resources of earlier pages.
+
+        Pages with annotations are not shared, since annotations point back
+        at the single page they belong to.
+
+        Args:
+            writer: PdfWriter holding the merged document
+            first_page: Index of the first page to repeat
+            end_page: Index after the last page to repeat
+
+        Returns:
+            bool: True if the pages were appended, False if they cannot be shared
+        """
+        pages = [writer.pages[index] for index in range(first_page, end_page)]
+        if any("/Annots" in page for page in pages):
             return False
 
+        for page in pages:
+            resources = page.raw_get("/Resources") if "/Resources" in page else None
+            if isinstance(resources, DictionaryObject):
+                # Make inline resources an object of their own so copies can refer to it
+                page[NameObject("/Resources")] = writer._add_object(resources)
+
+            # References are kept as they are; only the page dictionary is new
+            repeat = PageObject()
+            for key, value in page.items():
+                if key != "/Parent":
+                    repeat[NameObject(key)] = value
+            writer.add_page(repeat)
+        return True
+
+    @staticmethod
+    def _merge_into_writer(input_paths: List[Union[str, Path]],
+                           deduplicate: bool = True) -> Tuple[PdfWriter, Dict[str, float]]:
+        """
+        Copy PDF files into a new writer one input at a time.
+
+        Errors are propagated to the caller.
+
+        Returns:
+            Tuple[PdfWriter, Dict[str, float]]: The writer, and the "inputs",
+            "pages", "repeated_inputs", "duplicates_removed", "bytes_saved"
+            and "max_open_handles" statistics
+        """
+        writer = PdfWriter()
+        max_handles = open_handle_count()
+        paths = [os.path.abspath(str(pdf_path)) for pdf_path in input_paths]
+        sizes = {path: os.stat(path).st_size for path in paths}
+        same_size = {}
+        for path, size in sizes.items():
+            same_size.setdefault(size, []).append(path)
+        # Repeats of a path are caught by the path alone; only distinct
+        # files of equal size can be copies and need their content hashed
+        identities = {
+            path: file_fingerprint(path)[2] if len(same_size[sizes[path]]) > 1 else path
+            for path in sizes
+        }
+        copies = {}  # identity -> output page range of the first copy
+        repeated = 0
+        resource_digests = {}
+        dedup = {"duplicates_removed": 0, "bytes_saved": 0}
+
+        for path in paths:
+            identity = identities[path]
+            if identity in copies and PDFMerger._share_pages(writer, *copies[identity]):
+                repeated += 1
+                continue
+
+            with open(path, 'rb') as input_file:
+                reader = PdfReader(input_file)
+                first_page = len(writer.pages)
+                first_object = len(writer._objects)
+                writer.append(reader)
+
+                # The writer keeps links to every reader it copied from
+                # (for late cloning, and from each copied page to its
+                # source page); drop them so the reader can be freed
+                writer.reset_translation(reader)
+                for page_index in range(first_page, len(writer.pages)):
+                    writer.pages[page_index].__dict__.pop("original_page", None)
+                copies.setdefault(identity, (first_page, len(writer.pages)))
+
+                if deduplicate:
+                    found = PDFMerger.deduplicate_resources(writer, first_object, resource_digests)
+                    for key, value in found.items():
+                        dedup[key] += value
+
+                handles = open_handle_count()
+                if handles is not None:
+                    max_handles = max(max_handles, handles)
+            del reader
+
+        return writer, {
+            "inputs": len(input_paths),
+            "pages": len(writer.pages),
+            "repeated_inputs": repeated,
+            "duplicates_removed": dedup["duplicates_removed"],
+            "bytes_saved": dedup["bytes_saved"],
+            "max_open_handles": max_handles,
+        }
+
+    @staticmethod
+    def merge_pdfs_streaming(input_paths: List[Union[str, Path]],
+                             output_path: Union[str, Path],
+                             deduplicate: bool = True) -> Optional[Dict[str, float]]:
+        """
+        Merge PDF files one input at a time with bounded memory.
+
+        Each input is opened, its pages, resources and outline are copied
+        into the output, and its reader and file handle are released before
+        the next input is opened. Memory therefore follows the size of the
+        output document rather than the sum of all inputs.
+
+        Inputs repeated in the list (by path or by identical content) are
+        parsed once: later occurrences add pages that share the contents and
+        resources of the first copy, and do not repeat its outline. Only
+        files whose size matches another input's are read to compare their
+        content.
+
+        Args:
+            input_paths: List of paths to the PDF files to merge
+            output_path: Path where the merged PDF will be saved
+            deduplicate: Share identical fonts, images and other resources
+                         between the inputs as each one is added (see
+                         deduplicate_resources)
+
+        Returns:
+            Optional[Dict[str, float]]: Merge statistics ("inputs", "pages",
+            "seconds", "repeated_inputs", "duplicates_removed", "bytes_saved",
+            "peak_rss" in bytes and "max_open_handles"; the last two are None
+            where the platform cannot report them), or None if the merge failed
+        """
+        if not input_paths:
+            return None
+
         try:
-            merger = PdfMerger()
-            
-            # Add each PDF to the merger
-            for pdf_path in input_paths:
-                merger.append(str(pdf_path))
-            
-            # Write the merged PDF to the output path
+            start = time.perf_counter()
+            writer, stats = PDFMerger._merge_into_writer(input_paths, deduplicate)
+
             with open(str(output_path), 'wb') as output_file:
-                merger.write(output_file)
-            
-            merger.close()
-            return True
+                writer.write(output_file)
+
+            stats.update(seconds=time.perf_counter() - start, peak_rss=peak_rss())
+            return stats
         except Exception as e:
             print(f"Error merging PDFs: {str(e)}")
-            return False 
\ No newline at end of file
+            return None
+
+    @staticmethod
+    def _open_references(obj, writer: PdfWriter):
+        """Replace the references inside a direct object with placeholders."""
+        if isinstance(obj, IndirectObject):
+            if isinstance(obj, _PartReference):
+                return obj
+            if obj.pdf is not writer:
+                raise ValueError(f"Unresolved reference to object {obj.idnum} of another document")
+            return _PartReference(obj.idnum, obj.generation, writer)
+        if isinstance(obj, DictionaryObject):
+            for key, value in list(obj.items()):
+                opened = PDFMerger._open_references(value, writer)
+                if opened is not value:
+                    obj[key] = opened
+        elif isinstance(obj, ArrayObject):
+            for index, value in enumerate(obj):
+                opened = PDFMerger._open_references(value, writer)
+                if opened is not value:
+                    obj[index] = opened
+        return obj
+
+    @staticmethod
+    def _write_part(writer: PdfWriter, part_path: str, stats: Dict[str, float]) -> Dict[str, Any]:
+        """
+        Serialize a merged batch so another process can append it cheaply.
+
+        The objects are written to part_path back to back, as they would
+        appear in a PDF body, except that every reference is left out and
+        its position and target recorded. The catalog, page tree root,
+        document info and outline root are not written; _combine_parts
+        writes its own. The writer is consumed.
+
+        Returns:
+            Dict[str, Any]: Part description: "path", "header", "info"
+            (serialized document info), "objects" (object count), the
+            special object numbers ("root_id", "pages_id", "info_id" and
+            "outline_id", None without an outline root), "kids" (page
+            object numbers), "outline" (None if empty, else "first", "last"
+            and "count" of the outline root), "unsupported" catalog
+            keys, per-object "lengths" and "ref_counts", the flattened
+            "ref_positions" and "ref_targets", and the merge "stats"
+        """
+        root = writer._root_object
+        pages = writer._pages.get_object()
+        info = io.BytesIO()
+        writer._info.get_object().write_to_stream(info)
+
+        special = {writer._root.idnum, writer._pages.idnum, writer._info.idnum}
+        outline_id = outline = None
+        outline_ref = root.raw_get("/Outlines") if "/Outlines" in root else None
+        if isinstance(outline_ref, IndirectObject):
+            # Kept out of the part even when empty; the combined output
+            # writes its own outline root under OUTLINES_ID
+            outline_id = outline_ref.idnum
+            special.add(outline_id)
+            tree = outline_ref.get_object()
+            if "/First" in tree:
+                outline = {
+                    "first": tree.raw_get("/First").idnum,
+                    "last": tree.raw_get("/Last").idnum,
+                    "count": int(tree.get("/Count", 0)),
+                }
+
+        part = {
+            "path": part_path,
+            "header": writer.pdf_header,
+            "info": info.getvalue(),
+            "objects": len(writer._objects),
+            "root_id": writer._root.idnum,
+            "pages_id": writer._pages.idnum,
+            "info_id": writer._info.idnum,
+            "outline_id": outline_id,
+            "kids": array("I", (kid.idnum for kid in pages.raw_get("/Kids"))),
+            "outline": outline,
+            "unsupported": sorted(set(root) - PART_CATALOG_KEYS),
+            "lengths": array("Q"),
+            "ref_counts": array("I"),
+            "ref_positions": array("Q"),
+            "ref_targets": array("I"),
+            "stats": stats,
+        }
+        if part["unsupported"]:
+            return part
+
+        with open(part_path, 'wb') as part_file:
+            for idnum, obj in enumerate(writer._objects, 1):
+                if idnum in special:
+                    part["lengths"].append(0)
+                    part["ref_counts"].append(0)
+                    continue
+
+                buffer = _PartBuffer()
+                PDFMerger._open_references(obj, writer).write_to_stream(buffer)
+                part_file.write(buffer.data)
+                part["lengths"].append(len(buffer.data))
+                part["ref_counts"].append(len(buffer.positions))
+                part["ref_positions"].extend(buffer.positions)
+                part["ref_targets"].extend(buffer.targets)
+        return part
+
+    @staticmethod
+    def _needs_sequential_merge(input_paths: List[Union[str, Path]]) -> bool:
+        """
+        Check whether any input has catalog entries a parallel merge cannot join.
+
+        Only the cross-reference table and the catalog of each input are
+        read. An input that cannot be read also needs the sequential merge,
+        which reports the error.
+        """
+        try:
+            for pdf_path in input_paths:
+                with open(str(pdf_path), 'rb') as input_file:
+                    catalog = PdfReader(input_file).trailer["/Root"]
+                    if SEQUENTIAL_CATALOG_KEYS.intersection(catalog):
+                        return True
+            return False
+        except Exception:
+            return True
+
+    @staticmethod
+    def _combine_parts(parts: Iterable[Dict[str, Any]], output_path: Union[str, Path]) -> Optional[Dict[str, int]]:
+        """
+        Write the parts of a parallel merge, in order, as one PDF.
+
+        Part objects are copied byte for byte with their references
+        renumbered, so no object is parsed again. The pages of all parts
+        hang off one page tree root and their outlines are chained under
+        one outline root. Each part file is deleted once copied.
+
+        Args:
+            parts: Part descriptions from _write_part, in document order
+            output_path: Path where the merged PDF will be saved
+
+        Returns:
+            Optional[Dict[str, int]]: Number of "pages", or None if a part
+            holds catalog entries that cannot be combined (the output is
+            then incomplete)
+        """
+        positions = array("Q", [0] * (OUTLINES_ID + 1))
+        next_id = OUTLINES_ID + 1
+        kids = array("I")
+        info = b"<<\n>>"
+        outline_first = outline_last = None
+        outline_count = 0
+        held = None  # last top-level outline item, waiting for its /Next
+
+        with open(str(output_path), 'wb') as output:
+            def write_object(idnum: int, body: bytes) -> None:
+                positions[idnum] = output.tell()
+                output.write(b"%d 0 obj\n" % idnum)
+                output.write(body)
+                output.write(b"\nendobj\n")
+
+            for index, part in enumerate(parts):
+                if part["unsupported"]:
+                    return None
+                if index == 0:
+                    output.write(part["header"] + b"\n%\xE2\xE3\xCF\xD3\n")
+                    info = part["info"]
+
+                outline = part["outline"]
+                numbers = array("I", [0]) * (part["objects"] + 1)
+                numbers[part["root_id"]] = CATALOG_ID
+                numbers[part["pages_id"]] = PAGES_ID
+                numbers[part["info_id"]] = INFO_ID
+                if part["outline_id"] is not None:
+                    numbers[part["outline_id"]] = OUTLINES_ID
+                for local in range(1, part["objects"] + 1):
+                    if numbers[local] == 0:
+                        numbers[local] = next_id
+                        next_id += 1
+                positions.extend([0] * (next_id - len(positions)))
+
+                lengths, ref_counts = part["lengths"], part["ref_counts"]
+                ref_positions, ref_targets = part["ref_positions"], part["ref_targets"]
+                ref_index = 0
+                with open(part["path"], 'rb') as part_file:
+                    for local in range(1, part["objects"] + 1):
+                        if numbers[local] <= OUTLINES_ID:
+                            continue
+                        data = part_file.read(lengths[local - 1])
+                        pieces = []
+                        cursor = 0
+                        for ref in range(ref_index, ref_index + ref_counts[local - 1]):
+                            pieces.append(data[cursor:ref_positions[ref]])
+                            pieces.append(b"%d 0 R" % numbers[ref_targets[ref]])
+                            cursor = ref_positions[ref]
+                        pieces.append(data[cursor:])
+                        ref_index += ref_counts[local - 1]
+                        body = b"".join(pieces)
+
+                        # Chain this part's top-level outline items to the previous part's
+                        if outline is not None and local == outline["first"] and outline_last is not None:
+                            body = body[:3] + b"/Prev %d 0 R\n" % outline_last + body[3:]
+                        if outline is not None and local == outline["last"]:
+                            last_item = (numbers[local], body)
+                            continue
+                        write_object(numbers[local], body)
+                os.remove(part["path"])
+
+                if outline is not None:
+                    if held is not None:
+                        write_object(held[0], held[1][:3] + b"/Next %d 0 R\n" % numbers[outline["first"]]
+                                     + held[1][3:])
+                    held = last_item
+                    if outline_first is None:
+                        outline_first = numbers[outline["first"]]
+                    outline_last = numbers[outline["last"]]
+                    outline_count += outline["count"]
+                kids.extend(numbers[kid] for kid in part["kids"])
+
+            if held is not None:
+                write_object(*held)
+
+            catalog = b"<<\n/Type /Catalog\n/Pages %d 0 R\n" % PAGES_ID
+            if outline_first is not None:
+                catalog += b"/Outlines %d 0 R\n" % OUTLINES_ID
+                write_object(OUTLINES_ID, b"<<\n/Type /Outlines\n/First %d 0 R\n/Last %d 0 R\n/Count %d\n>>"
+                             % (outline_first, outline_last, outline_count))
+            else:
+                write_object(OUTLINES_ID, b"null")
+            write_object(CATALOG_ID, catalog + b">>")
+            write_object(PAGES_ID, b"<<\n/Type /Pages\n/Count %d\n/Kids [ %s ]\n>>"
+                         % (len(kids), b" ".join(b"%d 0 R" % kid for kid in kids)))
+            write_object(INFO_ID, info)
+
+            xref_location = output.tell()
+            output.write(b"xref\n0 %d\n0000000000 65535 f \n" % next_id)
+            output.writelines(b"%010d 00000 n \n" % offset for offset in positions[1:])
+            output.write(b"trailer\n<<\n/Size %d\n/Root %d 0 R\n/Info %d 0 R\n>>\nstartxref\n%d\n%%%%EOF\n"
+                         % (next_id, CATALOG_ID, INFO_ID, xref_location))
+
+        return {"pages": len(kids)}
+
+    @staticmethod
+    def merge_pdfs_parallel(input_paths: List[Union[str, Path]],
+                            output_path: Union[str, Path],
+                            workers: Optional[int] = None,
+                            batch_size: int = DEFAULT_BATCH_SIZE,
+                            temp_dir: Optional[Union[str, Path]] = None) -> Optional[Dict[str, float]]:
+        """
+        Merge PDF files in batches across processes.
+
+        The inputs are split into consecutive batches of batch_size
+        documents. Each batch is merged by a worker process into a part
+        file holding its serialized objects, and the parts are appended to
+        the output in order as they complete, with their object numbers
+        shifted; nothing is parsed twice. Page order and outlines are those
+        of a sequential merge, but identical resources and repeated inputs
+        are only shared within a batch. If any input's catalog holds form
+        fields or named destinations, which the parts cannot carry, all
+        inputs are merged sequentially instead; this is checked before any
+        batch is started. A batch whose merged catalog still holds such
+        entries stops the parallel merge as soon as it completes. Part
+        files live in a temporary directory that is removed when the merge
+        ends.
+
+        Args:
+            input_paths: List of paths to the PDF files to merge
+            output_path: Path where the merged PDF will be saved
+            workers: Number of worker processes (defaults to the CPU count)
+            batch_size: Number of documents merged per part
+            temp_dir: Directory for part files (defaults to the system
+                      temporary directory)
+
+        Returns:
+            Optional[Dict[str, float]]: Merge statistics ("inputs", "pages",
+            "batches" merged in parallel (1 for a sequential merge),
+            "seconds", "combine_seconds" spent writing the output, and
+            "repeated_inputs", "duplicates_removed" and "bytes_saved" summed
+            over the batches), or None if the merge failed
+        """
+        if not input_paths:
+            return None
+
+        batch_size = max(1, int(batch_size))
+        workers = default_workers(workers)
+        start = time.perf_counter()
+        if (workers > 1 and len(input_paths) > batch_size
+                and not PDFMerger._needs_sequential_merge(input_paths)):
+            try:
+                batches = list(chunked([str(path) for path in input_paths], batch_size))
+                totals = {"repeated_inputs": 0, "duplicates_removed": 0, "bytes_saved": 0}
+                waited = 0.0
+                rejected = []
+
+                def reject_unsupported(future):
+                    # Runs as each batch completes, in any order
+                    if future.cancelled() or future.exception() is not None:
+                        return
+                    if future.result()["unsupported"] and not rejected:
+                        rejected.append(future.result())
+                        for pending in futures:
+                            pending.cancel()
+
+                def completed_parts(futures):
+                    nonlocal waited
+                    for future in futures:
+                        wait_start = time.perf_counter()
+                        try:
+                            part = future.result()
+                        except CancelledError:
+                            part = None
+                        waited += time.perf_counter() - wait_start
+                        if rejected:
+                            # A later batch cannot be combined; stop writing now
+                            yield rejected[0]
+                            return
+                        for key in totals:
+                            totals[key] += part["stats"][key]
+                        yield part
+
+                with tempfile.TemporaryDirectory(prefix="pdf-merge-", dir=temp_dir) as work_dir:
+                    executor = ProcessPoolExecutor(max_workers=workers)
+                    try:
+                        futures = [
+                            executor.submit(_merge_part, batch, os.path.join(work_dir, f"part-{index:06d}.bin"))
+                            for index, batch in enumerate(batches)
+                        ]
+                        for future in futures:
+                            future.add_done_callback(reject_unsupported)
+                        combine_start = time.perf_counter()
+                        combined = PDFMerger._combine_parts(completed_parts(futures), output_path)
+                        # Time the output took to write, not counting waits for workers
+                        combine_seconds = time.perf_counter() - combine_start - waited
+                    finally:
+                        executor.shutdown(wait=True, cancel_futures=True)
+
+                if combined is not None:
+                    return {
+                        "inputs": len(input_paths),
+                        "pages": combined["pages"],
+                        "batches": len(batches),
+                        "seconds": time.perf_counter() - start,
+                        "combine_seconds": combine_seconds,
+                        **totals,
+                    }
+            except Exception as e:
+                print(f"Error merging PDFs: {str(e)}")
+                return None
+
+        stats = PDFMerger.merge_pdfs_streaming(input_paths, output_path)
+        if stats is not None:
+            stats.update(batches=1, seconds=time.perf_counter() - start, combine_seconds=0.0)
+        return stats
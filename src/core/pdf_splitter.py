@@ -4,7 +4,9 @@ PDF Splitter module for extracting specific pages or page ranges from PDF files.
 from pathlib import Path
 from typing import List, Union, Tuple
 
-from pypdf import PdfReader, PdfWriter
+from pypdf import PdfWriter
+
+from .document_pool import get_reader
 
 
 class PDFSplitter:
@@ -31,7 +33,7 @@ class PDFSplitter:
             return False
 
         try:
-            reader = PdfReader(str(input_path))
+            reader = get_reader(input_path)
             writer = PdfWriter()
             
             # Process each page range
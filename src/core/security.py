@@ -6,6 +6,8 @@ from typing import Union
 
 from pypdf import PdfReader, PdfWriter
 
+from .document_pool import get_reader
+
 
 class PDFSecurity:
     """Class to handle encryption and decryption of PDF files."""
@@ -28,7 +30,7 @@ class PDFSecurity:
             bool: True if encryption was successful, False otherwise
         """
         try:
-            reader = PdfReader(str(input_path))
+            reader = get_reader(input_path)
             writer = PdfWriter()
             
             # Add all pages to the writer
@@ -69,6 +71,7 @@ class PDFSecurity:
             bool: True if decryption was successful, False otherwise
         """
         try:
+            # Decrypting changes the reader's state, so it is not taken from the pool
             reader = PdfReader(str(input_path))
             writer = PdfWriter()
             
@@ -0,0 +1,212 @@
+"""
+Module for extracting tables from PDF files.
+"""
+import csv
+import json
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Union, List, Dict, Optional, Iterator, Tuple, TextIO, Any
+
+import pdfplumber
+from pypdf import PdfReader
+
+from .text_extractor import _release_page
+from .utils import chunked, default_workers
+
+# Export formats supported by write_tables
+TABLE_FORMATS = ("csv", "ndjson")
+
+# Chunks handed to the pool ahead of the one being written, per worker
+CHUNKS_IN_FLIGHT_PER_WORKER = 2
+
+Table = List[List[Optional[str]]]
+
+# Document of the current pool worker process, opened by _init_worker
+_worker_pdf = None
+
+
+def _init_worker(input_path: str) -> None:
+    """
+    Process pool initializer opening the document once per worker.
+
+    Opening a document and building its page list take time proportional to
+    the page count, so every chunk a worker is given reads from this handle
+    instead of opening the file again.
+
+    Args:
+        input_path: Path to the PDF file
+    """
+    global _worker_pdf
+    _worker_pdf = pdfplumber.open(input_path)
+
+
+def _extract_tables_chunk(page_numbers: List[int],
+                          table_settings: Optional[Dict[str, Any]] = None) -> List[Tuple[int, List[Table]]]:
+    """
+    Process pool worker extracting the tables of a run of pages.
+
+    Args:
+        page_numbers: Page numbers to extract tables from (0-indexed)
+        table_settings: pdfplumber table finder settings
+
+    Returns:
+        List[Tuple[int, List[Table]]]: (page number, tables) for every valid page
+    """
+    return list(TableExtractor._iter_document_pages(_worker_pdf, page_numbers, table_settings))
+
+
+class TableExtractor:
+    """Class to handle extraction of tables from PDF files."""
+
+    @staticmethod
+    def _iter_pages(input_path: Union[str, Path],
+                    page_numbers: Optional[List[int]] = None,
+                    table_settings: Optional[Dict[str, Any]] = None) -> Iterator[Tuple[int, List[Table]]]:
+        """
+        Yield (page number, tables) pairs, flushing per-page caches as it goes.
+
+        Errors are propagated to the caller.
+        """
+        with pdfplumber.open(str(input_path)) as pdf:
+            yield from TableExtractor._iter_document_pages(pdf, page_numbers, table_settings)
+
+    @staticmethod
+    def _iter_document_pages(pdf: pdfplumber.PDF,
+                             page_numbers: Optional[List[int]] = None,
+                             table_settings: Optional[Dict[str, Any]] = None) -> Iterator[Tuple[int, List[Table]]]:
+        """Yield (page number, tables) pairs from an open document."""
+        if page_numbers is None:
+            page_numbers = range(len(pdf.pages))
+
+        for page_num in page_numbers:
+            if not 0 <= page_num < len(pdf.pages):
+                continue
+            page = pdf.pages[page_num]
+            try:
+                tables = page.extract_tables(table_settings)
+            finally:
+                _release_page(page)
+            yield page_num, tables
+
+    @staticmethod
+    def iter_tables(input_path: Union[str, Path],
+                    page_numbers: Optional[List[int]] = None,
+                    table_settings: Optional[Dict[str, Any]] = None,
+                    workers: Optional[int] = 1,
+                    chunk_size: int = 16) -> Iterator[Tuple[int, List[Table]]]:
+        """
+        Lazily extract tables, yielding the tables of one page at a time.
+
+        With several workers, chunks of pages are processed in a process pool.
+        Each worker opens the document once and reads all of its chunks from
+        that handle. Only a few chunks per worker are in flight at once and
+        results are yielded in page order, so memory stays bounded for any
+        page count.
+
+        Args:
+            input_path: Path to the PDF file
+            page_numbers: List of page numbers to extract tables from (0-indexed)
+                          If None, extract tables from all pages
+            table_settings: pdfplumber table finder settings (e.g.
+                            {"vertical_strategy": "text"}); None uses the defaults
+            workers: Number of worker processes (None for the CPU count,
+                     1 extracts in this process)
+            chunk_size: Number of pages handed to a worker at a time
+
+        Yields:
+            Tuple[int, List[Table]]: (page number, tables on the page, each a
+            list of rows of cell strings)
+        """
+        workers = default_workers(workers)
+        if workers == 1:
+            yield from TableExtractor._iter_pages(input_path, page_numbers, table_settings)
+            return
+
+        if page_numbers is None:
+            # Counting pages with pypdf avoids a full pdfplumber parse
+            page_numbers = list(range(len(PdfReader(str(input_path)).pages)))
+        chunks = list(chunked(list(dict.fromkeys(page_numbers)), chunk_size))
+        if not chunks:
+            return
+
+        workers = min(workers, len(chunks))
+        executor = ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(str(input_path),)
+        )
+        pending = deque()
+        try:
+            for chunk in chunks:
+                pending.append(
+                    executor.submit(_extract_tables_chunk, chunk, table_settings)
+                )
+                # Wait for the oldest chunk before queueing more work
+                if len(pending) >= workers * CHUNKS_IN_FLIGHT_PER_WORKER:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            # Drop chunks that have not started when the caller stops early
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def write_tables(input_path: Union[str, Path],
+                     output: Union[str, Path, TextIO],
+                     page_numbers: Optional[List[int]] = None,
+                     fmt: str = "csv",
+                     table_settings: Optional[Dict[str, Any]] = None,
+                     workers: Optional[int] = None,
+                     chunk_size: int = 16) -> Dict[int, Dict[str, int]]:
+        """
+        Stream the tables of a PDF to a CSV or NDJSON file as they are found.
+
+        CSV rows are prefixed with the page number (0-indexed) and the index
+        of the table on its page. NDJSON holds one object per table with
+        "page", "table" and "rows" keys.
+
+        Args:
+            input_path: Path to the PDF file
+            output: Path of the file to write, or an open text stream
+            page_numbers: List of page numbers to extract tables from (0-indexed)
+                          If None, extract tables from all pages
+            fmt: "csv" or "ndjson"
+            table_settings: pdfplumber table finder settings
+            workers: Number of worker processes (defaults to the CPU count)
+            chunk_size: Number of pages handed to a worker at a time
+
+        Returns:
+            Dict[int, Dict[str, int]]: Per processed page, the number of
+            "tables" and "rows" written
+        """
+        summary = {}
+
+        try:
+            if fmt not in TABLE_FORMATS:
+                raise ValueError(f"Unknown table format: {fmt}")
+
+            if isinstance(output, (str, Path)):
+                with open(str(output), 'w', encoding='utf-8', newline='') as f:
+                    return TableExtractor.write_tables(
+                        input_path, f, page_numbers, fmt, table_settings, workers, chunk_size
+                    )
+
+            writer = csv.writer(output) if fmt == "csv" else None
+            for page_num, tables in TableExtractor.iter_tables(
+                input_path, page_numbers, table_settings, workers, chunk_size
+            ):
+                rows = 0
+                for table_index, table in enumerate(tables):
+                    if writer is not None:
+                        writer.writerows([page_num, table_index] + row for row in table)
+                    else:
+                        output.write(json.dumps(
+                            {"page": page_num, "table": table_index, "rows": table},
+                            ensure_ascii=False,
+                        ) + "\n")
+                    rows += len(table)
+                summary[page_num] = {"tables": len(tables), "rows": rows}
+
+            return summary
+        except Exception as e:
+            print(f"Error writing tables: {str(e)}")
+            return summary
@@ -1,18 +1,906 @@
 """
 PDF Text Extractor module for extracting text content from PDF files.
 """
+from collections import deque
+from contextlib import ExitStack, contextmanager
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.connection import wait
+from difflib import SequenceMatcher
 from pathlib import Path
-from typing import Union, List, Dict, Optional
+from typing import Union, List, Dict, Optional, Iterator, Tuple, TextIO, BinaryIO, Sequence, NamedTuple
+import multiprocessing
+import re
+import sqlite3
+import threading
+import time
 
 import pdfplumber
+import pypdf
+from pypdf import PdfReader
+
+from .word_table import BinaryWordWriter, WordTable
+from .utils import chunked, default_cache_dir, default_workers, file_fingerprint, limit_memory
+
+# Available extraction engines. "pdfplumber" reproduces the visual layout
+# most faithfully; "pypdf" is several times faster for plain text; "auto"
+# picks one per document (see TextExtractor.choose_engine).
+ENGINES = ("pdfplumber", "pypdf", "auto")
+
+# Pages sampled by the "auto" engine heuristic
+AUTO_SAMPLE_PAGES = 3
+
+# Minimum share of printable characters and of spaces in the pypdf sample
+# text for "auto" to trust it; garbled or run-together words fall back to
+# pdfplumber
+AUTO_MIN_PRINTABLE_RATIO = 0.98
+AUTO_MIN_SPACE_RATIO = 0.05
+
+# Word attributes kept by extract_words and write_words
+WORD_EXTRA_ATTRS = ["fontname", "size"]
+
+# Export formats supported by write_words
+WORD_FORMATS = ("ndjson", "binary")
+
+# Bump when extraction output changes so stale cached text is not reused
+TEXT_CACHE_VERSION = 1
+
+# Number of extracted pages written to the text cache per transaction
+TEXT_CACHE_BATCH = 32
+
+# Seconds an isolated extraction worker may spend opening the document
+DEFAULT_OPEN_TIMEOUT = 120.0
+
+# Document of the current pool worker process, opened by _init_worker
+_worker_document = None
+
+
+class TextCache:
+    """
+    Persistent, size-bounded store of extracted page text.
+
+    Text is kept in an SQLite file keyed on the document content hash, the
+    page index and the extraction parameters (engine and library versions).
+    The least recently used pages are evicted once the stored text exceeds
+    the byte budget. The store can be shared between threads; instances
+    (or processes) using the same file share one budget.
+    """
+
+    def __init__(self,
+                 cache_path: Optional[Union[str, Path]] = None,
+                 max_bytes: int = 64 * 1024 * 1024):
+        """
+        Initialize the text cache.
+
+        Args:
+            cache_path: SQLite file to use (defaults to the user cache dir)
+            max_bytes: Byte budget for stored text
+        """
+        self.cache_path = (Path(cache_path) if cache_path
+                           else default_cache_dir("text") / "text_cache.sqlite3")
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._conn = None
+        self._total_bytes = 0
+        self._lock = threading.RLock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use and create its tables."""
+        if self._conn is None:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.cache_path), check_same_thread=False)
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS page_text (
+                    doc TEXT NOT NULL,
+                    params TEXT NOT NULL,
+                    page INTEGER NOT NULL,
+                    text TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    accessed REAL NOT NULL,
+                    PRIMARY KEY (doc, params, page)
+                );
+                CREATE INDEX IF NOT EXISTS page_text_accessed ON page_text (accessed);
+                CREATE TABLE IF NOT EXISTS documents (
+                    doc TEXT PRIMARY KEY,
+                    page_count INTEGER NOT NULL
+                );
+            """)
+            row = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM page_text").fetchone()
+            self._total_bytes = row[0]
+        return self._conn
+
+    @staticmethod
+    def make_params(engine: str) -> str:
+        """
+        Describe the extraction parameters that influence the cached text.
+
+        Args:
+            engine: Resolved engine name ("pdfplumber" or "pypdf")
+
+        Returns:
+            str: Parameter key including the library versions
+        """
+        library = pdfplumber.__version__ if engine == "pdfplumber" else pypdf.__version__
+        return f"{engine}-{library}-v{TEXT_CACHE_VERSION}"
+
+    def get_page_count(self, doc: str) -> Optional[int]:
+        """Return the remembered page count of a document, if known."""
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT page_count FROM documents WHERE doc = ?", (doc,)
+            ).fetchone()
+            return row[0] if row else None
+
+    def set_page_count(self, doc: str, page_count: int) -> None:
+        """Remember the page count of a document."""
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO documents (doc, page_count) VALUES (?, ?)",
+                (doc, page_count),
+            )
+            conn.commit()
+
+    def get_many(self, doc: str, params: str, page_numbers: Sequence[int]) -> Dict[int, str]:
+        """
+        Look up the cached text of several pages.
+
+        Args:
+            doc: Document content hash
+            params: Parameter key from make_params
+            page_numbers: Pages to look up (0-indexed)
+
+        Returns:
+            Dict[int, str]: Text of the pages found in the cache
+        """
+        wanted = set(page_numbers)
+        with self._lock:
+            conn = self._connect()
+            rows = conn.execute(
+                "SELECT page, text FROM page_text WHERE doc = ? AND params = ?",
+                (doc, params),
+            ).fetchall()
+            found = {page: text for page, text in rows if page in wanted}
+
+            if found:
+                now = time.time()
+                conn.executemany(
+                    "UPDATE page_text SET accessed = ? WHERE doc = ? AND params = ? AND page = ?",
+                    [(now, doc, params, page) for page in found],
+                )
+                conn.commit()
+            self.hits += len(found)
+            self.misses += len(wanted) - len(found)
+            return found
+
+    def put_many(self, doc: str, params: str, texts: Dict[int, str]) -> None:
+        """
+        Store the text of several pages and evict old pages if over budget.
+
+        Args:
+            doc: Document content hash
+            params: Parameter key from make_params
+            texts: Mapping of page numbers to extracted text
+        """
+        if not texts:
+            return
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            conn.executemany(
+                "INSERT OR REPLACE INTO page_text (doc, params, page, text, size, accessed) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [(doc, params, page, text, len(text.encode("utf-8")), now)
+                 for page, text in texts.items()],
+            )
+            self._evict(conn)
+            conn.commit()
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Delete least recently used pages until within the byte budget."""
+        # Other connections may have written to the file since we last looked
+        self._total_bytes = conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM page_text"
+        ).fetchone()[0]
+        while self._total_bytes > self.max_bytes:
+            rows = conn.execute(
+                "SELECT rowid, size FROM page_text ORDER BY accessed LIMIT 256"
+            ).fetchall()
+            if not rows:
+                self._total_bytes = 0
+                return
+            for rowid, size in rows:
+                if self._total_bytes <= self.max_bytes:
+                    break
+                conn.execute("DELETE FROM page_text WHERE rowid = ?", (rowid,))
+                self._total_bytes -= size
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Remove all cached text."""
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM page_text")
+            conn.execute("DELETE FROM documents")
+            conn.commit()
+            self._total_bytes = 0
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return cache statistics.
+
+        Returns:
+            Dict[str, int]: hits, misses (in pages), evictions, entries and bytes
+        """
+        with self._lock:
+            entries = self._connect().execute("SELECT COUNT(*) FROM page_text").fetchone()[0]
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": entries,
+                "bytes": self._total_bytes,
+            }
+
+
+def _release_page(page: pdfplumber.page.Page) -> None:
+    """Drop the parsed objects and text layout pdfplumber keeps for a page."""
+    page.flush_cache()
+    page.get_textmap.cache_clear()
+
+
+class SearchHit(NamedTuple):
+    """A match found by TextExtractor.search."""
+    page: int
+    offset: int
+    text: str
+    bbox: Tuple[float, float, float, float]
+
+
+def _search_chunk(page_numbers: List[int],
+                  pattern: str,
+                  flags: int,
+                  max_hits: Optional[int] = None) -> List[SearchHit]:
+    """
+    Process pool worker searching a run of pages of the worker's document.
+
+    Args:
+        page_numbers: Page numbers to search (0-indexed)
+        pattern: Regular expression source
+        flags: Regular expression flags
+        max_hits: Stop after this many hits in the chunk
+
+    Returns:
+        List[SearchHit]: Hits in page order
+    """
+    hits = []
+    regex = re.compile(pattern, flags)
+    for hit in TextExtractor._iter_document_hits(_worker_document, page_numbers, regex):
+        hits.append(hit)
+        if max_hits is not None and len(hits) >= max_hits:
+            break
+    return hits
+
+
+def _init_worker(input_path: str, engine: str = "pdfplumber") -> None:
+    """
+    Process pool initializer opening the document once per worker.
+
+    Opening a document and building its page list take time proportional to
+    the page count, so every chunk a worker is given reads from this handle
+    instead of opening the file again.
+
+    Args:
+        input_path: Path to the PDF file
+        engine: Extraction engine the chunks use ("pdfplumber" or "pypdf")
+    """
+    global _worker_document
+    _worker_document = PdfReader(input_path) if engine == "pypdf" else pdfplumber.open(input_path)
+
+
+def _extract_chunk(page_numbers: List[int], engine: str = "pdfplumber") -> List[Tuple[int, str]]:
+    """
+    Process pool worker extracting a run of pages from the worker's document.
+
+    Args:
+        page_numbers: Page numbers to extract (0-indexed)
+        engine: Extraction engine the worker was initialized with
+
+    Returns:
+        List[Tuple[int, str]]: (page number, text) for every valid page
+    """
+    return list(TextExtractor._iter_document_pages(_worker_document, page_numbers, engine))
+
+
+def _isolated_worker(conn, input_path: str, engine: str, memory_limit: Optional[int]) -> None:
+    """
+    Worker process extracting the pages it is sent over a pipe.
+
+    The document is opened once and ("ready", None) is sent before the
+    first page is requested. For every page number received, a ("ok", text),
+    ("memory", message) or ("error", message) reply is sent back; None ends
+    the worker. The worker exits after a failed page or a failed open.
+    """
+    limit_memory(memory_limit)
+
+    def requests():
+        # _iter_pages asks for the first page once the document is open
+        conn.send(("ready", None))
+        while True:
+            page_num = conn.recv()
+            if page_num is None:
+                return
+            yield page_num
+
+    try:
+        for _, text in TextExtractor._iter_pages(input_path, requests(), engine):
+            conn.send(("ok", text))
+    except MemoryError:
+        conn.send(("memory", "memory limit exceeded"))
+    except Exception as e:
+        conn.send(("error", str(e)))
+    finally:
+        conn.close()
+
+
+class _PageWorker:
+    """Parent-side handle of an isolated extraction process."""
+
+    def __init__(self, input_path: str, engine: str, memory_limit: Optional[int], timeout: float):
+        """Start a worker; it has timeout seconds to open the document."""
+        self.conn, child_conn = multiprocessing.Pipe()
+        self.process = multiprocessing.Process(
+            target=_isolated_worker,
+            args=(child_conn, input_path, engine, memory_limit),
+            daemon=True,
+        )
+        self.process.start()
+        child_conn.close()
+        self.ready = False
+        self.page = None
+        self.deadline = time.monotonic() + timeout
+
+    def assign(self, page_num: int, timeout: float) -> None:
+        """Send a page to the ready worker and start its clock."""
+        self.page = page_num
+        self.deadline = time.monotonic() + timeout
+        self.conn.send(page_num)
+
+    def stop(self) -> None:
+        """Ask an idle worker to exit, killing it if it does not."""
+        try:
+            self.conn.send(None)
+            self.process.join(1)
+        except (OSError, ValueError):
+            pass
+        self.kill()
+
+    def kill(self) -> None:
+        """Terminate the worker immediately."""
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+
+def _run_page_workers(input_path: str,
+                      page_numbers: List[int],
+                      engine: str,
+                      workers: int,
+                      page_timeout: float,
+                      memory_limit: Optional[int],
+                      open_timeout: float = DEFAULT_OPEN_TIMEOUT) -> Tuple[Dict[int, str], Dict[int, str]]:
+    """
+    Extract pages in isolated worker processes, each page on its own budget.
+
+    A worker gets open_timeout seconds to open the document before its
+    first page is assigned, so the open time does not count against any
+    page. A worker that fails to open the document fails all pages not yet
+    assigned.
+
+    Returns:
+        Tuple[Dict[int, str], Dict[int, str]]: Extracted page texts, and the
+        failed pages mapped to the reason ("timeout", "memory", "error" or
+        "crashed")
+    """
+    extracted = {}
+    failed = {}
+    todo = deque(page_numbers)
+    max_workers = min(workers, len(page_numbers))
+    pool = []
+
+    try:
+        while True:
+            for worker in pool:
+                if worker.ready and worker.page is None and todo:
+                    worker.assign(todo.popleft(), page_timeout)
+            while todo and len(pool) < max_workers:
+                pool.append(_PageWorker(input_path, engine, memory_limit, open_timeout))
+
+            # Workers still opening the document only matter while pages are left
+            busy = [worker for worker in pool
+                    if worker.page is not None or (not worker.ready and todo)]
+            if not busy:
+                break
+
+            timeout = max(0.0, min(worker.deadline for worker in busy) - time.monotonic())
+            ready = wait([worker.conn for worker in busy], timeout)
+
+            for worker in busy:
+                if worker.conn in ready:
+                    try:
+                        status, payload = worker.conn.recv()
+                    except EOFError:
+                        status, payload = "crashed", "worker exited"
+                elif time.monotonic() >= worker.deadline:
+                    limit = page_timeout if worker.ready else open_timeout
+                    status, payload = "timeout", f"took over {limit}s"
+                else:
+                    continue
+
+                if not worker.ready:
+                    if status == "ready":
+                        worker.ready = True
+                        continue
+                    print(f"Error opening {input_path} with {engine}: {payload}")
+                    failed.update((page_num, status) for page_num in todo)
+                    todo.clear()
+                elif status == "ok":
+                    page_num, worker.page = worker.page, None
+                    extracted[page_num] = payload
+                    continue
+                else:
+                    page_num, worker.page = worker.page, None
+                    print(f"Error extracting page {page_num + 1} with {engine}: {payload}")
+                    failed[page_num] = status
+
+                # The worker is stuck, dead or exiting; replace it
+                worker.kill()
+                pool.remove(worker)
+    finally:
+        for worker in pool:
+            worker.stop()
+
+    return extracted, failed
 
 
 class TextExtractor:
     """Class to handle extraction of text from PDF files."""
 
     @staticmethod
-    def extract_text_from_pages(input_path: Union[str, Path], 
-                               page_numbers: Optional[List[int]] = None) -> Dict[int, str]:
+    def choose_engine(input_path: Union[str, Path], engine: str = "auto") -> str:
+        """
+        Resolve an engine name, picking one for "auto".
+
+        The "auto" heuristic extracts a few sample pages (first, middle and
+        last) with pypdf. If the sample text looks clean (printable, with
+        normal word spacing) the fast pypdf engine is used; if it is empty or
+        looks garbled, pdfplumber's layout analysis is used instead.
+
+        Args:
+            input_path: Path to the PDF file
+            engine: "pdfplumber", "pypdf" or "auto"
+
+        Returns:
+            str: "pdfplumber" or "pypdf"
+        """
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown text extraction engine: {engine}")
+        if engine != "auto":
+            return engine
+
+        try:
+            reader = PdfReader(str(input_path))
+            page_count = len(reader.pages)
+            samples = sorted({0, page_count // 2, page_count - 1})[:AUTO_SAMPLE_PAGES]
+            sample = "".join(
+                reader.pages[i].extract_text() or "" for i in samples if 0 <= i < page_count
+            )
+        except Exception as e:
+            print(f"Error sampling text: {str(e)}")
+            return "pdfplumber"
+
+        if not sample.strip():
+            return "pdfplumber"
+        printable = sum(ch.isprintable() or ch.isspace() for ch in sample) / len(sample)
+        spaces = sample.count(" ") / len(sample)
+        if printable < AUTO_MIN_PRINTABLE_RATIO or spaces < AUTO_MIN_SPACE_RATIO:
+            return "pdfplumber"
+        return "pypdf"
+
+    @staticmethod
+    def _iter_pages(input_path: Union[str, Path],
+                    page_numbers: Optional[List[int]] = None,
+                    engine: str = "pdfplumber") -> Iterator[Tuple[int, str]]:
+        """
+        Yield (page number, text) pairs, flushing per-page caches as it goes.
+
+        Errors are propagated to the caller.
+        """
+        engine = TextExtractor.choose_engine(input_path, engine)
+        with TextExtractor._open_document(input_path, engine) as document:
+            yield from TextExtractor._iter_document_pages(document, page_numbers, engine)
+
+    @staticmethod
+    @contextmanager
+    def _open_document(input_path: Union[str, Path], engine: str) -> Iterator[Union[pdfplumber.PDF, PdfReader]]:
+        """Open a document for a resolved engine: a PdfReader for pypdf, else a pdfplumber PDF."""
+        if engine == "pypdf":
+            yield PdfReader(str(input_path))
+            return
+        with pdfplumber.open(str(input_path)) as pdf:
+            yield pdf
+
+    @staticmethod
+    def _iter_document_pages(document: Union[pdfplumber.PDF, PdfReader],
+                             page_numbers: Optional[List[int]],
+                             engine: str) -> Iterator[Tuple[int, str]]:
+        """Yield (page number, text) pairs from a document opened for engine."""
+        # The page list is built before the first page number is requested
+        page_count = len(document.pages)
+        # If no page numbers provided, extract from all pages
+        if page_numbers is None:
+            page_numbers = range(page_count)
+
+        for page_num in page_numbers:
+            if not 0 <= page_num < page_count:
+                continue
+            page = document.pages[page_num]
+            if engine == "pypdf":
+                yield page_num, page.extract_text() or ""
+                continue
+            try:
+                text = page.extract_text() or ""
+            finally:
+                _release_page(page)
+            yield page_num, text
+
+    @staticmethod
+    def iter_text(input_path: Union[str, Path],
+                  page_numbers: Optional[List[int]] = None,
+                  engine: str = "pdfplumber",
+                  cache: Optional[TextCache] = None) -> Iterator[Tuple[int, str]]:
+        """
+        Lazily extract text, raising errors instead of reporting them.
+
+        Pages are served from the text cache when possible; only the pages
+        missing from it are extracted, and they are written back in batches.
+        The document is opened at most once, and only if a page is missing
+        or its page count is not cached yet.
+
+        Args:
+            input_path: Path to the PDF file
+            page_numbers: List of page numbers to extract text from (0-indexed)
+                          If None, extract text from all pages
+            engine: "pdfplumber", "pypdf" or "auto"
+            cache: Optional TextCache; only pages missing from it are extracted
+
+        Yields:
+            Tuple[int, str]: (page number, extracted text)
+
+        Raises:
+            Exception: Any error opening or parsing the document
+        """
+        if cache is None:
+            yield from TextExtractor._iter_pages(input_path, page_numbers, engine)
+            return
+
+        engine = TextExtractor.choose_engine(input_path, engine)
+        params = cache.make_params(engine)
+        doc = file_fingerprint(input_path)[2]
+
+        with ExitStack() as stack:
+            document = None
+            if page_numbers is None:
+                page_count = cache.get_page_count(doc)
+                if page_count is None:
+                    # Count the pages of the document the extractor reads anyway
+                    document = stack.enter_context(TextExtractor._open_document(input_path, engine))
+                    page_count = len(document.pages)
+                    cache.set_page_count(doc, page_count)
+                page_numbers = range(page_count)
+
+            known = cache.get_many(doc, params, page_numbers)
+            missing = [p for p in dict.fromkeys(page_numbers) if p not in known]
+            if missing and document is None:
+                document = stack.enter_context(TextExtractor._open_document(input_path, engine))
+            extracted = (TextExtractor._iter_document_pages(document, missing, engine)
+                         if missing else iter(()))
+            pending = None
+            batch = {}
+
+            try:
+                for page_num in page_numbers:
+                    if page_num in known:
+                        yield page_num, known[page_num]
+                        continue
+                    # Missing pages come out of the extractor in request order;
+                    # invalid page numbers are skipped by it
+                    if pending is None:
+                        pending = next(extracted, None)
+                    if pending is None or pending[0] != page_num:
+                        continue
+                    known[page_num] = pending[1]
+                    batch[page_num] = pending[1]
+                    pending = None
+                    if len(batch) >= TEXT_CACHE_BATCH:
+                        cache.put_many(doc, params, batch)
+                        batch = {}
+                    yield page_num, known[page_num]
+            finally:
+                cache.put_many(doc, params, batch)
+
+    @staticmethod
+    def iter_page_text(input_path: Union[str, Path],
+                       page_numbers: Optional[List[int]] = None,
+                       engine: str = "pdfplumber",
+                       cache: Optional[TextCache] = None) -> Iterator[Tuple[int, str]]:
+        """
+        Lazily extract text, yielding one page at a time.
+
+        pdfplumber's per-page caches (layout and parsed objects) are flushed
+        as soon as a page has been extracted, so memory stays bounded by a
+        single page regardless of the document size. Errors are printed and
+        end the iteration; use iter_text to handle them yourself.
+
+        Args:
+            input_path: Path to the PDF file
+            page_numbers: List of page numbers to extract text from (0-indexed)
+                          If None, extract text from all pages
+            engine: "pdfplumber", "pypdf" or "auto"
+            cache: Optional TextCache; only pages missing from it are extracted
+
+        Yields:
+            Tuple[int, str]: (page number, extracted text)
+        """
+        try:
+            yield from TextExtractor.iter_text(input_path, page_numbers, engine, cache)
+        except Exception as e:
+            print(f"Error extracting text: {str(e)}")
+
+    @staticmethod
+    def _compile_search(pattern: str, regex: bool = False, case_sensitive: bool = False) -> re.Pattern:
+        """
+        Turn a search string into a regular expression.
+
+        Plain phrases match their words separated by any whitespace, so a
+        phrase broken across lines is still found.
+        """
+        if not regex:
+            pattern = r"\s+".join(re.escape(word) for word in pattern.split())
+            if not pattern:
+                raise ValueError("Empty search pattern")
+        return re.compile(pattern, 0 if case_sensitive else re.IGNORECASE)
+
+    @staticmethod
+    def _iter_hits(input_path: Union[str, Path],
+                   page_numbers: Optional[List[int]],
+                   regex: re.Pattern) -> Iterator[SearchHit]:
+        """
+        Yield the matches of a compiled pattern page by page.
+
+        Offsets index into the page text as returned by the pdfplumber
+        engine. Errors are propagated to the caller.
+        """
+        with pdfplumber.open(str(input_path)) as pdf:
+            yield from TextExtractor._iter_document_hits(pdf, page_numbers, regex)
+
+    @staticmethod
+    def _iter_document_hits(pdf: pdfplumber.PDF,
+                            page_numbers: Optional[List[int]],
+                            regex: re.Pattern) -> Iterator[SearchHit]:
+        """Yield the matches of a compiled pattern in an open document."""
+        if page_numbers is None:
+            page_numbers = range(len(pdf.pages))
+
+        for page_num in page_numbers:
+            if not 0 <= page_num < len(pdf.pages):
+                continue
+            page = pdf.pages[page_num]
+            try:
+                textmap = page.get_textmap()
+                matches = [
+                    (match, textmap.match_to_dict(match, return_groups=False, return_chars=False))
+                    for match in regex.finditer(textmap.as_string)
+                ]
+            finally:
+                _release_page(page)
+            for match, found in matches:
+                yield SearchHit(
+                    page_num,
+                    match.start(),
+                    match.group(0),
+                    (found["x0"], found["top"], found["x1"], found["bottom"]),
+                )
+
+    @staticmethod
+    def search(input_path: Union[str, Path],
+               pattern: str,
+               page_numbers: Optional[List[int]] = None,
+               regex: bool = False,
+               case_sensitive: bool = False,
+               max_hits: Optional[int] = None,
+               workers: int = 1,
+               chunk_size: int = 16) -> Iterator[SearchHit]:
+        """
+        Lazily find the occurrences of a phrase or pattern in a PDF.
+
+        Pages are scanned one at a time and hits are yielded as soon as they
+        are found, so stopping early (or passing max_hits) avoids reading the
+        rest of the document. With several workers, chunks of pages are
+        searched in parallel processes, each opening the document once for
+        all of its chunks; hits are still yielded in page order and
+        outstanding chunks are cancelled once max_hits is reached.
+
+        Args:
+            input_path: Path to the PDF file
+            pattern: Phrase to find, or a regular expression if regex is True
+            page_numbers: List of page numbers to search (0-indexed)
+                          If None, search all pages
+            regex: Treat pattern as a regular expression
+            case_sensitive: Match letter case exactly
+            max_hits: Stop after this many hits (None for all)
+            workers: Number of worker processes (1 searches in this process)
+            chunk_size: Number of pages handed to a worker at a time
+
+        Yields:
+            SearchHit: (page, offset in the page text, matched text,
+            bounding box as (x0, top, x1, bottom))
+        """
+        if max_hits is not None and max_hits <= 0:
+            return
+
+        try:
+            compiled = TextExtractor._compile_search(pattern, regex, case_sensitive)
+            found = 0
+
+            if default_workers(workers) == 1:
+                for hit in TextExtractor._iter_hits(input_path, page_numbers, compiled):
+                    yield hit
+                    found += 1
+                    if found == max_hits:
+                        return
+                return
+
+            if page_numbers is None:
+                # Counting pages with pypdf avoids a full pdfplumber parse
+                page_numbers = range(len(PdfReader(str(input_path)).pages))
+            chunks = list(chunked(list(dict.fromkeys(page_numbers)), chunk_size))
+            if not chunks:
+                return
+
+            executor = ProcessPoolExecutor(
+                max_workers=min(default_workers(workers), len(chunks)),
+                initializer=_init_worker,
+                initargs=(str(input_path), "pdfplumber"),
+            )
+            try:
+                futures = [
+                    executor.submit(_search_chunk, chunk, compiled.pattern, compiled.flags, max_hits)
+                    for chunk in chunks
+                ]
+                # Futures are consumed in submission order, keeping page order
+                for future in futures:
+                    for hit in future.result():
+                        yield hit
+                        found += 1
+                        if found == max_hits:
+                            return
+            finally:
+                # Drop chunks that have not started; running ones are not waited for
+                executor.shutdown(wait=False, cancel_futures=True)
+        except Exception as e:
+            print(f"Error searching text: {str(e)}")
+
+    @staticmethod
+    def _iter_page_words(input_path: Union[str, Path],
+                         page_numbers: Optional[List[int]] = None) -> Iterator[Tuple[int, WordTable]]:
+        """
+        Yield a WordTable per page, releasing pdfplumber's objects as it goes.
+
+        Errors are propagated to the caller.
+        """
+        with pdfplumber.open(str(input_path)) as pdf:
+            if page_numbers is None:
+                page_numbers = range(len(pdf.pages))
+
+            for page_num in page_numbers:
+                if not 0 <= page_num < len(pdf.pages):
+                    continue
+                page = pdf.pages[page_num]
+                table = WordTable()
+                try:
+                    table.extend_words(page_num, page.extract_words(extra_attrs=WORD_EXTRA_ATTRS))
+                finally:
+                    _release_page(page)
+                yield page_num, table
+
+    @staticmethod
+    def extract_words(input_path: Union[str, Path],
+                      page_numbers: Optional[List[int]] = None) -> WordTable:
+        """
+        Extract the words of a PDF with their bounding boxes and fonts.
+
+        Words are collected into a columnar WordTable rather than a
+        dictionary per word, so whole large documents fit in memory.
+
+        Args:
+            input_path: Path to the PDF file
+            page_numbers: List of page numbers to extract words from (0-indexed)
+                          If None, extract words from all pages
+
+        Returns:
+            WordTable: Words of the pages in the requested order
+        """
+        words = WordTable()
+
+        try:
+            for _, table in TextExtractor._iter_page_words(input_path, page_numbers):
+                for word in table:
+                    words.append(*word)
+            return words
+        except Exception as e:
+            print(f"Error extracting words: {str(e)}")
+            return words
+
+    @staticmethod
+    def write_words(input_path: Union[str, Path],
+                    output: Union[str, Path, TextIO, BinaryIO],
+                    page_numbers: Optional[List[int]] = None,
+                    fmt: str = "ndjson") -> bool:
+        """
+        Stream word positions to a file, one page at a time.
+
+        "ndjson" writes one JSON object per word; "binary" writes the compact
+        format read by WordTable.read_binary. Only one page of words is held
+        in memory at a time.
+
+        Args:
+            input_path: Path to the PDF file
+            output: Path of the file to write, or an open stream (text for
+                    "ndjson", binary for "binary")
+            page_numbers: List of page numbers to extract words from (0-indexed)
+                          If None, extract words from all pages
+            fmt: "ndjson" or "binary"
+
+        Returns:
+            bool: True if the words were written successfully, False otherwise
+        """
+        try:
+            if fmt not in WORD_FORMATS:
+                raise ValueError(f"Unknown word format: {fmt}")
+
+            if isinstance(output, (str, Path)):
+                if fmt == "binary":
+                    with open(str(output), 'wb') as f:
+                        return TextExtractor.write_words(input_path, f, page_numbers, fmt)
+                with open(str(output), 'w', encoding='utf-8') as f:
+                    return TextExtractor.write_words(input_path, f, page_numbers, fmt)
+
+            writer = BinaryWordWriter(output) if fmt == "binary" else None
+            for _, table in TextExtractor._iter_page_words(input_path, page_numbers):
+                if writer is not None:
+                    writer.write(table)
+                else:
+                    table.write_ndjson(output)
+            return True
+        except Exception as e:
+            print(f"Error writing words: {str(e)}")
+            return False
+
+    @staticmethod
+    def extract_text_from_pages(input_path: Union[str, Path],
+                               page_numbers: Optional[List[int]] = None,
+                               engine: str = "pdfplumber",
+                               cache: Optional[TextCache] = None) -> Dict[int, str]:
         """
         Extract text content from specified pages of a PDF file.
 
@@ -20,6 +908,8 @@ class TextExtractor:
             input_path: Path to the PDF file
             page_numbers: List of page numbers to extract text from (0-indexed)
                           If None, extract text from all pages
+            engine: "pdfplumber", "pypdf" or "auto"
+            cache: Optional TextCache; only pages missing from it are extracted
 
         Returns:
             Dict[int, str]: Dictionary mapping page numbers to extracted text
@@ -27,16 +917,8 @@ class TextExtractor:
         result = {}
         
         try:
-            with pdfplumber.open(str(input_path)) as pdf:
-                # If no page numbers provided, extract from all pages
-                if page_numbers is None:
-                    page_numbers = list(range(len(pdf.pages)))
-                
-                # Extract text from each specified page
-                for page_num in page_numbers:
-                    if 0 <= page_num < len(pdf.pages):
-                        page = pdf.pages[page_num]
-                        result[page_num] = page.extract_text() or ""
+            for page_num, text in TextExtractor.iter_text(input_path, page_numbers, engine, cache):
+                result[page_num] = text
             
             return result
         except Exception as e:
@@ -44,22 +926,273 @@ class TextExtractor:
             return result
 
     @staticmethod
-    def extract_all_text(input_path: Union[str, Path]) -> str:
+    def extract_text_parallel(input_path: Union[str, Path],
+                              page_numbers: Optional[List[int]] = None,
+                              workers: Optional[int] = None,
+                              chunk_size: int = 32,
+                              engine: str = "pdfplumber",
+                              cache: Optional[TextCache] = None) -> Dict[int, str]:
+        """
+        Extract text from pages using a pool of worker processes.
+
+        The page list is split into chunks. Each worker opens the document
+        once and extracts all of its chunks from that handle. Results are
+        merged back in the requested page order, with the same contract as
+        extract_text_from_pages.
+
+        Args:
+            input_path: Path to the PDF file
+            page_numbers: List of page numbers to extract text from (0-indexed)
+                          If None, extract text from all pages
+            workers: Number of worker processes (defaults to the CPU count)
+            chunk_size: Number of pages handed to a worker at a time
+            engine: "pdfplumber", "pypdf" or "auto"
+            cache: Optional TextCache; only pages missing from it are sent
+                   to the workers
+
+        Returns:
+            Dict[int, str]: Dictionary mapping page numbers to extracted text
+        """
+        workers = default_workers(workers)
+        if workers == 1:
+            return TextExtractor.extract_text_from_pages(input_path, page_numbers, engine, cache)
+
+        result = {}
+
+        try:
+            # Decide once rather than in every worker
+            engine = TextExtractor.choose_engine(input_path, engine)
+
+            if page_numbers is None:
+                # Counting pages with pypdf avoids a full pdfplumber parse
+                page_numbers = range(len(PdfReader(str(input_path)).pages))
+            page_numbers = list(dict.fromkeys(page_numbers))
+
+            known = {}
+            if cache is not None:
+                params = cache.make_params(engine)
+                doc = file_fingerprint(input_path)[2]
+                known = cache.get_many(doc, params, page_numbers)
+
+            missing = [p for p in page_numbers if p not in known]
+            chunks = list(chunked(missing, chunk_size))
+            extracted = {}
+
+            if chunks:
+                with ProcessPoolExecutor(max_workers=min(workers, len(chunks)),
+                                         initializer=_init_worker,
+                                         initargs=(str(input_path), engine)) as executor:
+                    futures = [executor.submit(_extract_chunk, chunk, engine) for chunk in chunks]
+                    for future in futures:
+                        extracted.update(future.result())
+                if cache is not None:
+                    cache.put_many(doc, params, extracted)
+
+            # Merge cached and fresh text back in the requested page order
+            for page_num in page_numbers:
+                if page_num in known:
+                    result[page_num] = known[page_num]
+                elif page_num in extracted:
+                    result[page_num] = extracted[page_num]
+
+            return result
+        except Exception as e:
+            print(f"Error extracting text: {str(e)}")
+            return result
+
+    @staticmethod
+    def extract_text_isolated(input_path: Union[str, Path],
+                              page_numbers: Optional[List[int]] = None,
+                              engine: str = "pdfplumber",
+                              workers: Optional[int] = None,
+                              page_timeout: float = 30.0,
+                              memory_limit: Optional[int] = None,
+                              fallback: Optional[str] = "pypdf",
+                              open_timeout: float = DEFAULT_OPEN_TIMEOUT) -> Tuple[Dict[int, str], Dict[int, str]]:
+        """
+        Extract text with every page held to a time and memory budget.
+
+        Pages are handed one at a time to worker processes. A worker that
+        exceeds page_timeout on a page is killed and replaced, as is one that
+        runs out of memory or crashes, so a single pathological page cannot
+        stall the rest of the document. A worker opens the document before
+        its first page is assigned, so opening is not charged to any page.
+        Pages that blew their budget are extracted again with the fallback
+        engine, in worker processes held to the same budgets. They are left
+        out if fallback is None or resolves to the engine that already
+        failed.
+
+        Args:
+            input_path: Path to the PDF file
+            page_numbers: List of page numbers to extract text from (0-indexed)
+                          If None, extract text from all pages
+            engine: "pdfplumber", "pypdf" or "auto"
+            workers: Number of worker processes (defaults to the CPU count)
+            page_timeout: Seconds a worker may spend on one page
+            memory_limit: Address space limit per worker in bytes (POSIX only)
+            fallback: Engine used for degraded pages, or None to skip them
+            open_timeout: Seconds a worker may spend opening the document
+
+        Returns:
+            Tuple[Dict[int, str], Dict[int, str]]: Page texts in the requested
+            order, and the degraded pages mapped to the reason ("timeout",
+            "memory", "error" or "crashed")
+        """
+        result = {}
+        degraded = {}
+
+        try:
+            engine = TextExtractor.choose_engine(input_path, engine)
+
+            # A private reader: the shared pool is not for worker threads
+            page_count = len(PdfReader(str(input_path)).pages)
+            if page_numbers is None:
+                page_numbers = range(page_count)
+            page_numbers = [p for p in dict.fromkeys(page_numbers) if 0 <= p < page_count]
+            workers = default_workers(workers)
+
+            extracted, degraded = _run_page_workers(
+                str(input_path), page_numbers, engine, workers, page_timeout, memory_limit,
+                open_timeout
+            )
+
+            if degraded and fallback is not None:
+                fallback = TextExtractor.choose_engine(input_path, fallback)
+                # Retrying with the engine that just failed would only fail again
+                if fallback != engine:
+                    recovered, _ = _run_page_workers(
+                        str(input_path), sorted(degraded), fallback, workers,
+                        page_timeout, memory_limit, open_timeout
+                    )
+                    extracted.update(recovered)
+
+            # Merge the pages back in the requested order
+            for page_num in page_numbers:
+                if page_num in extracted:
+                    result[page_num] = extracted[page_num]
+
+            return result, degraded
+        except Exception as e:
+            print(f"Error extracting text: {str(e)}")
+            return result, degraded
+
+    @staticmethod
+    def write_text(input_path: Union[str, Path],
+                   output: Union[str, Path, TextIO],
+                   page_numbers: Optional[List[int]] = None,
+                   engine: str = "pdfplumber",
+                   cache: Optional[TextCache] = None) -> bool:
+        """
+        Stream extracted text straight to a file or text stream.
+
+        Pages are written as they are extracted, each followed by a blank
+        line, so the full text is never held in memory.
+
+        Args:
+            input_path: Path to the PDF file
+            output: Path of the text file to write, or an open text stream
+            page_numbers: List of page numbers to extract text from (0-indexed)
+                          If None, extract text from all pages
+            engine: "pdfplumber", "pypdf" or "auto"
+            cache: Optional TextCache; only pages missing from it are extracted
+
+        Returns:
+            bool: True if the text was written successfully, False otherwise
+        """
+        try:
+            if isinstance(output, (str, Path)):
+                with open(str(output), 'w', encoding='utf-8') as f:
+                    return TextExtractor.write_text(input_path, f, page_numbers, engine, cache)
+
+            for _, text in TextExtractor.iter_text(input_path, page_numbers, engine, cache):
+                output.write(text)
+                output.write("\n\n")
+            return True
+        except Exception as e:
+            print(f"Error writing text: {str(e)}")
+            return False
+
+    @staticmethod
+    def extract_all_text(input_path: Union[str, Path],
+                         engine: str = "pdfplumber",
+                         cache: Optional[TextCache] = None) -> str:
         """
         Extract all text content from a PDF file and return as a single string.
 
         Args:
             input_path: Path to the PDF file
+            engine: "pdfplumber", "pypdf" or "auto"
+            cache: Optional TextCache; only pages missing from it are extracted
 
         Returns:
             str: Extracted text from all pages
         """
         try:
-            with pdfplumber.open(str(input_path)) as pdf:
-                text = ""
-                for page in pdf.pages:
-                    text += (page.extract_text() or "") + "\n\n"
-                return text
+            # Collect the pieces and join once instead of growing a string
+            parts = []
+            for _, text in TextExtractor.iter_text(input_path, engine=engine, cache=cache):
+                parts.append(text)
+                parts.append("\n\n")
+            return "".join(parts)
         except Exception as e:
             print(f"Error extracting text: {str(e)}")
-            return "" 
\ No newline at end of file
+            return ""
+
+    @staticmethod
+    def benchmark_engines(input_paths: Sequence[Union[str, Path]],
+                          engines: Sequence[str] = ("pdfplumber", "pypdf"),
+                          baseline: str = "pdfplumber") -> Dict[str, Dict[str, float]]:
+        """
+        Compare the throughput and output of extraction engines on a corpus.
+
+        Every document is extracted with every engine. Output differences
+        are measured per page against the baseline engine with difflib's
+        similarity ratio (1.0 means identical text).
+
+        Args:
+            input_paths: PDF files making up the corpus
+            engines: Engines to compare
+            baseline: Engine whose output the others are compared against
+
+        Returns:
+            Dict[str, Dict[str, float]]: Per engine: "pages", "seconds",
+            "pages_per_second", "chars", "similarity" (mean ratio against the
+            baseline) and "pages_differing"
+        """
+        report = {
+            engine: {"pages": 0, "seconds": 0.0, "chars": 0,
+                     "similarity_total": 0.0, "pages_compared": 0, "pages_differing": 0}
+            for engine in engines
+        }
+
+        for input_path in input_paths:
+            outputs = {}
+            for engine in engines:
+                start = time.perf_counter()
+                outputs[engine] = TextExtractor.extract_text_from_pages(input_path, engine=engine)
+                stats = report[engine]
+                stats["seconds"] += time.perf_counter() - start
+                stats["pages"] += len(outputs[engine])
+                stats["chars"] += sum(len(text) for text in outputs[engine].values())
+
+            reference = outputs.get(baseline)
+            if reference is None:
+                reference = TextExtractor.extract_text_from_pages(input_path, engine=baseline)
+            for engine in engines:
+                for page_num, expected in reference.items():
+                    actual = outputs[engine].get(page_num, "")
+                    ratio = 1.0 if actual == expected else SequenceMatcher(
+                        None, expected, actual, autojunk=False
+                    ).ratio()
+                    report[engine]["similarity_total"] += ratio
+                    report[engine]["pages_compared"] += 1
+                    if actual != expected:
+                        report[engine]["pages_differing"] += 1
+
+        for engine, stats in report.items():
+            compared = stats.pop("pages_compared") or 1
+            stats["similarity"] = stats.pop("similarity_total") / compared
+            stats["pages_per_second"] = (
+                stats["pages"] / stats["seconds"] if stats["seconds"] else 0.0
+            )
+        return report
@@ -1,21 +1,335 @@
 """
 Thumbnail generator for creating image previews of PDF pages.
 """
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Union, List, Tuple, Optional
+from typing import Union, List, Tuple, Optional, Dict, Iterable, Iterator, Callable
+import hashlib
 import io
+import os
+import threading
 
 from PIL import Image
-import pdfplumber
+from pypdf import PdfReader
+import pypdfium2
+
+from .utils import chunked, default_cache_dir, default_workers, file_fingerprint
+
+
+# Rendering presets: (resampling filter, antialiasing, oversampling factor).
+# Pages are rasterized at roughly the thumbnail size; the filter only has to
+# absorb rounding (and the oversampling for "high").
+QUALITY_PRESETS = {
+    "fast": (Image.NEAREST, False, 1.0),
+    "balanced": (Image.BILINEAR, True, 1.0),
+    "high": (Image.LANCZOS, True, 2.0),
+}
+
+# Bump when rendering output changes so stale cache entries are not reused
+RENDERER_VERSION = f"pdfium-{pypdfium2.V_LIBPDFIUM}-r1"
+
+# Values of image.info["thumbnail_source"], telling how a thumbnail was produced
+SOURCE_CACHE = "cache"
+SOURCE_EMBEDDED = "embedded"
+SOURCE_RENDERED = "rendered"
+
+# Default resolution pyramid: a very cheap preview pass followed by the
+# full thumbnail. Each level is a (size, quality) pair.
+PYRAMID_LEVELS = (
+    ((48, 48), "fast"),
+    ((200, 200), "balanced"),
+)
+
+# PIL modes for the colour spaces allowed in embedded /Thumb images
+_THUMB_MODES = {"/DeviceRGB": "RGB", "/DeviceGray": "L"}
+
+
+class ThumbnailCache:
+    """
+    Persistent, content-addressed store of rendered thumbnails.
+
+    Entries are PNG files keyed on the source file identity (size, mtime and
+    content hash), the page index, the render size/quality and the renderer
+    version. The least recently used entries are evicted once the cache
+    exceeds its byte budget.
+    """
+
+    def __init__(self,
+                 cache_dir: Optional[Union[str, Path]] = None,
+                 max_bytes: int = 256 * 1024 * 1024):
+        """
+        Initialize the thumbnail cache.
+
+        Args:
+            cache_dir: Directory for cached images (defaults to the user cache dir)
+            max_bytes: Byte budget; least recently used entries are evicted beyond it
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else default_cache_dir("thumbnails")
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = None  # OrderedDict of key -> size, oldest first
+        self._total_bytes = 0
+        self._lock = threading.RLock()
+
+    def _load_index(self):
+        """Scan the cache directory once, ordering entries by last access."""
+        if self._entries is not None:
+            return
+        found = []
+        if self.cache_dir.is_dir():
+            for entry_path in self.cache_dir.glob("*/*.png"):
+                try:
+                    stat = entry_path.stat()
+                except OSError:
+                    continue
+                found.append((stat.st_mtime_ns, entry_path.stem, stat.st_size))
+        found.sort()
+        self._entries = OrderedDict((key, size) for _, key, size in found)
+        self._total_bytes = sum(self._entries.values())
+
+    def _entry_path(self, key: str) -> Path:
+        """Return the file path of a cache entry."""
+        return self.cache_dir / key[:2] / f"{key}.png"
+
+    @staticmethod
+    def make_key(input_path: Union[str, Path],
+                 page_number: int,
+                 size: Tuple[int, int],
+                 quality: str = "balanced") -> str:
+        """
+        Build the cache key for a rendered page.
+
+        Args:
+            input_path: Path to the PDF file
+            page_number: Page number (0-indexed)
+            size: Tuple of (width, height) for the thumbnail size
+            quality: Render quality preset
+
+        Returns:
+            str: Hex key identifying the rendered thumbnail
+        """
+        file_size, mtime_ns, digest = file_fingerprint(input_path)
+        raw = (f"{digest}:{file_size}:{mtime_ns}:{page_number}:"
+               f"{size[0]}x{size[1]}:{quality}:{RENDERER_VERSION}")
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Image.Image]:
+        """
+        Look up a cached thumbnail.
+
+        Args:
+            key: Key returned by make_key
+
+        Returns:
+            PIL.Image or None: Cached image, or None on a miss
+        """
+        with self._lock:
+            self._load_index()
+            if key not in self._entries:
+                self.misses += 1
+                return None
+            entry_path = self._entry_path(key)
+            try:
+                with Image.open(entry_path) as img:
+                    img.load()
+                    image = img.convert("RGB")
+                # Record the access so LRU order survives restarts
+                os.utime(entry_path)
+            except (OSError, ValueError):
+                self._total_bytes -= self._entries.pop(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return image
+
+    def put(self, key: str, image: Image.Image) -> None:
+        """
+        Store a thumbnail and evict old entries if over budget.
+
+        Args:
+            key: Key returned by make_key
+            image: Thumbnail image to store
+        """
+        data = io.BytesIO()
+        image.save(data, format="PNG")
+        payload = data.getvalue()
+
+        with self._lock:
+            self._load_index()
+            entry_path = self._entry_path(key)
+            try:
+                entry_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = entry_path.with_suffix(f".{os.getpid()}.tmp")
+                with open(tmp_path, 'wb') as f:
+                    f.write(payload)
+                os.replace(tmp_path, entry_path)
+            except OSError as e:
+                print(f"Error writing thumbnail cache: {str(e)}")
+                return
+
+            self._total_bytes -= self._entries.pop(key, 0)
+            self._entries[key] = len(payload)
+            self._total_bytes += len(payload)
+            self._evict()
+
+    def _evict(self):
+        """Remove least recently used entries until within the byte budget."""
+        while self._total_bytes > self.max_bytes and self._entries:
+            key, size = self._entries.popitem(last=False)
+            self._total_bytes -= size
+            self.evictions += 1
+            try:
+                self._entry_path(key).unlink()
+            except OSError:
+                pass
+
+    def clear(self) -> None:
+        """Remove every cached thumbnail."""
+        with self._lock:
+            self._load_index()
+            for key in list(self._entries):
+                try:
+                    self._entry_path(key).unlink()
+                except OSError:
+                    pass
+            self._entries.clear()
+            self._total_bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return cache statistics.
+
+        Returns:
+            Dict[str, int]: hits, misses, evictions, entries and bytes
+        """
+        with self._lock:
+            self._load_index()
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._total_bytes,
+            }
+
+
+def _render_chunk(input_path: str,
+                  page_numbers: List[int],
+                  size: Tuple[int, int],
+                  quality: str,
+                  use_embedded: bool = False) -> List[Tuple[int, Optional[bytes], Optional[str]]]:
+    """
+    Process pool worker rendering a run of pages from one document handle.
+
+    Images are returned PNG-encoded (fast compression) to keep the data
+    pickled back to the parent process small.
+
+    Args:
+        input_path: Path to the PDF file
+        page_numbers: Page numbers to render (0-indexed)
+        size: Tuple of (width, height) for the thumbnail size
+        quality: Render quality preset
+        use_embedded: Try embedded /Thumb images before rendering
+
+    Returns:
+        List[Tuple[int, Optional[bytes], Optional[str]]]: (page number,
+        PNG bytes or None on failure, thumbnail source)
+    """
+    results = []
+    page_numbers = list(page_numbers)
+    thumbnails = dict(ThumbnailGenerator.iter_thumbnails(
+        input_path, page_numbers, size, quality, use_embedded=use_embedded
+    ))
+    for page_num in page_numbers:
+        image = thumbnails.get(page_num)
+        if image is None:
+            results.append((page_num, None, None))
+            continue
+        data = io.BytesIO()
+        image.save(data, format="PNG", compress_level=1)
+        results.append((page_num, data.getvalue(), image.info.get("thumbnail_source")))
+    return results
 
 
 class ThumbnailGenerator:
     """Class to handle generation of thumbnail images from PDF pages."""
 
     @staticmethod
-    def generate_thumbnail(input_path: Union[str, Path], 
+    def _render_scale(page_size: Tuple[float, float],
+                      size: Tuple[int, int],
+                      oversample: float = 1.0) -> float:
+        """
+        Compute the pdfium render scale that fits a page into the thumbnail box.
+
+        Args:
+            page_size: Page (width, height) in points, rotation applied
+            size: Tuple of (width, height) for the thumbnail size
+            oversample: Factor to render above the target size
+
+        Returns:
+            float: Scale factor (1.0 renders at 72 DPI)
+        """
+        width, height = page_size
+        if width <= 0 or height <= 0:
+            return 1.0
+        return min(size[0] / width, size[1] / height) * oversample
+
+    @staticmethod
+    def _render_page(pdf: pypdfium2.PdfDocument,
+                     page_number: int,
+                     size: Tuple[int, int],
+                     quality: str = "balanced") -> Image.Image:
+        """
+        Render a single page from an already opened document.
+
+        The render DPI is derived from the requested size and the page
+        dimensions, so the page is rasterized at about the thumbnail size
+        instead of full size. The page handle is closed as soon as the bitmap
+        has been produced so that batch rendering does not keep every parsed
+        page alive.
+
+        Args:
+            pdf: Open pdfium document
+            page_number: Page number to render (0-indexed)
+            size: Tuple of (width, height) for the thumbnail size
+            quality: One of the QUALITY_PRESETS keys ("fast", "balanced", "high")
+
+        Returns:
+            PIL.Image: Thumbnail image
+        """
+        if quality not in QUALITY_PRESETS:
+            raise ValueError(f"Unknown thumbnail quality: {quality}")
+        resample, antialias, oversample = QUALITY_PRESETS[quality]
+
+        page = pdf[page_number]
+        try:
+            scale = ThumbnailGenerator._render_scale(page.get_size(), size, oversample)
+            bitmap = page.render(
+                scale=scale,
+                no_smoothtext=not antialias,
+                no_smoothpath=not antialias,
+                no_smoothimage=not antialias,
+                prefer_bgrx=True,
+            )
+            pil_img = bitmap.to_pil().convert("RGB")
+        finally:
+            page.close()
+
+        # Trim rounding overshoot while maintaining aspect ratio
+        pil_img.thumbnail(size, resample)
+        return pil_img
+
+    @staticmethod
+    def generate_thumbnail(input_path: Union[str, Path],
                           page_number: int,
-                          size: Tuple[int, int] = (200, 200)) -> Optional[Image.Image]:
+                          size: Tuple[int, int] = (200, 200),
+                          quality: str = "balanced",
+                          cache: Optional[ThumbnailCache] = None,
+                          use_embedded: bool = False) -> Optional[Image.Image]:
         """
         Generate a thumbnail image for a specific page of a PDF file.
 
@@ -23,69 +337,354 @@ class ThumbnailGenerator:
             input_path: Path to the PDF file
             page_number: Page number to generate thumbnail for (0-indexed)
             size: Tuple of (width, height) for the thumbnail size
+            quality: Speed/quality trade-off ("fast", "balanced" or "high")
+            cache: Optional thumbnail cache to read from and populate
+            use_embedded: Use the embedded page thumbnail when the PDF has one
 
         Returns:
             PIL.Image or None: Thumbnail image or None if generation failed
         """
+        thumbnails = ThumbnailGenerator.generate_thumbnails(
+            input_path, [page_number], size, quality, cache, use_embedded
+        )
+        return thumbnails[0] if thumbnails else None
+
+    @staticmethod
+    def _embedded_thumbnail(reader: PdfReader,
+                            page_number: int,
+                            size: Tuple[int, int]) -> Optional[Image.Image]:
+        """
+        Decode the thumbnail image embedded in a page (/Thumb), if any.
+
+        Handles the image types allowed for page thumbnails: 8-bit DeviceRGB,
+        DeviceGray or Indexed RGB pixel data, and JPEG/JPEG 2000 streams.
+        The image is shrunk to fit the requested size but never enlarged.
+
+        Args:
+            reader: Open pypdf reader
+            page_number: Page number (0-indexed)
+            size: Tuple of (width, height) for the thumbnail size
+
+        Returns:
+            PIL.Image or None: Decoded thumbnail, or None if the page has no
+            usable embedded thumbnail
+        """
+        page = reader.pages[page_number]
+        if "/Thumb" not in page:
+            return None
+
         try:
-            with pdfplumber.open(str(input_path)) as pdf:
-                if 0 <= page_number < len(pdf.pages):
-                    page = pdf.pages[page_number]
-                    
-                    # Convert the page to an image
-                    img = page.to_image()
-                    pil_img = img.original
-                    
-                    # Resize the image to the requested size while maintaining aspect ratio
-                    pil_img.thumbnail(size, Image.LANCZOS)
-                    
-                    return pil_img
-                return None
+            stream = page["/Thumb"].get_object()
+            filters = stream.get("/Filter", [])
+            if not isinstance(filters, list):
+                filters = [filters]
+            data = stream.get_data()
+
+            if filters and filters[-1] in ("/DCTDecode", "/JPXDecode"):
+                # pypdf leaves JPEG data encoded; PIL decodes it
+                image = Image.open(io.BytesIO(data))
+                image.load()
+            else:
+                if stream.get("/BitsPerComponent", 8) != 8:
+                    return None
+                width, height = stream["/Width"], stream["/Height"]
+                color_space = stream.get("/ColorSpace", "/DeviceRGB")
+                if not isinstance(color_space, str):
+                    color_space = color_space.get_object()
+                if color_space in _THUMB_MODES:
+                    image = Image.frombytes(_THUMB_MODES[color_space], (width, height), data)
+                elif color_space[0] == "/Indexed" and color_space[1] == "/DeviceRGB":
+                    lookup = color_space[3].get_object()
+                    palette = lookup.get_data() if hasattr(lookup, "get_data") else bytes(lookup)
+                    image = Image.frombytes("P", (width, height), data)
+                    image.putpalette(palette)
+                else:
+                    return None
         except Exception as e:
-            print(f"Error generating thumbnail: {str(e)}")
+            print(f"Error decoding embedded thumbnail: {str(e)}")
             return None
 
+        image = image.convert("RGB")
+        image.thumbnail(size, Image.LANCZOS)
+        return image
+
+    @staticmethod
+    def iter_thumbnails(input_path: Union[str, Path],
+                        page_numbers: Optional[Iterable[int]] = None,
+                        size: Tuple[int, int] = (200, 200),
+                        quality: str = "balanced",
+                        cache: Optional[ThumbnailCache] = None,
+                        use_embedded: bool = False) -> Iterator[Tuple[int, Image.Image]]:
+        """
+        Lazily generate thumbnails, yielding each page as soon as it is ready.
+
+        The document is parsed once and every requested page is rendered from
+        that single handle. With a cache, pages already rendered earlier are
+        read back from disk and the document is only opened on a cache miss.
+        With use_embedded, thumbnails stored in the PDF itself (/Thumb) are
+        decoded instead of rendering the page when available. Pages that
+        cannot be rendered are skipped.
+
+        Each image records how it was produced in
+        ``image.info["thumbnail_source"]``: "cache", "embedded" or "rendered".
+
+        Args:
+            input_path: Path to the PDF file
+            page_numbers: Page numbers to generate thumbnails for (0-indexed)
+                          If None, generate thumbnails for all pages
+            size: Tuple of (width, height) for the thumbnail size
+            quality: Speed/quality trade-off ("fast", "balanced" or "high")
+            cache: Optional thumbnail cache to read from and populate
+            use_embedded: Use embedded page thumbnails when the PDF has them
+
+        Yields:
+            Tuple[int, PIL.Image]: (page number, thumbnail image)
+        """
+        pdf = None
+        reader = None
+
+        try:
+            # If no page numbers provided, generate thumbnails for all pages
+            if page_numbers is None:
+                pdf = pypdfium2.PdfDocument(str(input_path))
+                page_numbers = range(len(pdf))
+
+            # Generate thumbnail for each page
+            for page_num in page_numbers:
+                key = None
+                if cache is not None:
+                    key = cache.make_key(input_path, page_num, size, quality)
+                    cached = cache.get(key)
+                    if cached is not None:
+                        cached.info["thumbnail_source"] = SOURCE_CACHE
+                        yield page_num, cached
+                        continue
+
+                if use_embedded:
+                    if reader is None:
+                        reader = PdfReader(str(input_path))
+                    if not 0 <= page_num < len(reader.pages):
+                        continue
+                    thumbnail = ThumbnailGenerator._embedded_thumbnail(reader, page_num, size)
+                    if thumbnail is not None:
+                        thumbnail.info["thumbnail_source"] = SOURCE_EMBEDDED
+                        yield page_num, thumbnail
+                        continue
+
+                if pdf is None:
+                    pdf = pypdfium2.PdfDocument(str(input_path))
+                if not 0 <= page_num < len(pdf):
+                    continue
+
+                try:
+                    thumbnail = ThumbnailGenerator._render_page(pdf, page_num, size, quality)
+                except Exception as e:
+                    print(f"Error generating thumbnail: {str(e)}")
+                    continue
+
+                if key is not None:
+                    cache.put(key, thumbnail)
+                thumbnail.info["thumbnail_source"] = SOURCE_RENDERED
+                yield page_num, thumbnail
+        except Exception as e:
+            print(f"Error generating thumbnails: {str(e)}")
+        finally:
+            if pdf is not None:
+                pdf.close()
+
     @staticmethod
-    def generate_thumbnails(input_path: Union[str, Path], 
+    def _priority_order(page_numbers: List[int],
+                        priority: Optional[Callable[[], Iterable[int]]]) -> Iterator[int]:
+        """
+        Yield pages, asking before each one which pages are wanted first.
+
+        Args:
+            page_numbers: Pages to yield (each exactly once)
+            priority: Callable returning the pages to prefer right now
+                      (e.g. the ones on screen), or None for plain order
+
+        Yields:
+            int: Next page number
+        """
+        remaining = set(page_numbers)
+        next_index = 0
+        while remaining:
+            page_num = None
+            if priority is not None:
+                page_num = next((p for p in priority() if p in remaining), None)
+            if page_num is None:
+                while page_numbers[next_index] not in remaining:
+                    next_index += 1
+                page_num = page_numbers[next_index]
+            remaining.discard(page_num)
+            yield page_num
+
+    @staticmethod
+    def iter_thumbnail_levels(input_path: Union[str, Path],
+                              page_numbers: Optional[List[int]] = None,
+                              levels: Tuple[Tuple[Tuple[int, int], str], ...] = PYRAMID_LEVELS,
+                              cache: Optional[ThumbnailCache] = None,
+                              use_embedded: bool = True,
+                              priority: Optional[Callable[[], Iterable[int]]] = None
+                              ) -> Iterator[Tuple[int, int, Image.Image]]:
+        """
+        Generate thumbnails as a resolution pyramid, coarsest level first.
+
+        The first level is produced for every page before any finer level is
+        started, so a complete (if blurry) page list is available quickly.
+        Finer levels then process the pages that ``priority`` reports first,
+        e.g. the ones currently visible. Each level is cached separately.
+
+        Args:
+            input_path: Path to the PDF file
+            page_numbers: List of page numbers (0-indexed); None for all pages
+            levels: (size, quality) pairs from coarsest to finest
+            cache: Optional thumbnail cache to read from and populate
+            use_embedded: Use embedded page thumbnails for the first level
+            priority: Callable returning pages to render first; called from
+                      the generating thread before each page of finer levels
+
+        Yields:
+            Tuple[int, int, PIL.Image]: (level index, page number, thumbnail image)
+        """
+        if page_numbers is None:
+            try:
+                pdf = pypdfium2.PdfDocument(str(input_path))
+                try:
+                    page_numbers = list(range(len(pdf)))
+                finally:
+                    pdf.close()
+            except Exception as e:
+                print(f"Error generating thumbnails: {str(e)}")
+                return
+        page_numbers = list(dict.fromkeys(page_numbers))
+
+        for level, (size, quality) in enumerate(levels):
+            if level == 0:
+                order = page_numbers
+            else:
+                order = ThumbnailGenerator._priority_order(page_numbers, priority)
+            for page_num, thumbnail in ThumbnailGenerator.iter_thumbnails(
+                input_path, order, size, quality, cache, use_embedded and level == 0
+            ):
+                yield level, page_num, thumbnail
+
+    @staticmethod
+    def generate_thumbnails(input_path: Union[str, Path],
                            page_numbers: Optional[List[int]] = None,
-                           size: Tuple[int, int] = (200, 200)) -> List[Image.Image]:
+                           size: Tuple[int, int] = (200, 200),
+                           quality: str = "balanced",
+                           cache: Optional[ThumbnailCache] = None,
+                           use_embedded: bool = False) -> List[Image.Image]:
         """
         Generate thumbnail images for multiple pages of a PDF file.
 
+        Collects the output of iter_thumbnails into a list.
+
         Args:
             input_path: Path to the PDF file
             page_numbers: List of page numbers to generate thumbnails for (0-indexed)
                           If None, generate thumbnails for all pages
             size: Tuple of (width, height) for the thumbnail size
+            quality: Speed/quality trade-off ("fast", "balanced" or "high")
+            cache: Optional thumbnail cache to read from and populate
+            use_embedded: Use embedded page thumbnails when the PDF has them
 
         Returns:
             List[PIL.Image]: List of thumbnail images
         """
-        thumbnails = []
-        
+        return [
+            thumbnail for _, thumbnail in ThumbnailGenerator.iter_thumbnails(
+                input_path, page_numbers, size, quality, cache, use_embedded
+            )
+        ]
+
+    @staticmethod
+    def generate_thumbnails_parallel(input_path: Union[str, Path],
+                                    page_numbers: Optional[List[int]] = None,
+                                    size: Tuple[int, int] = (200, 200),
+                                    quality: str = "balanced",
+                                    cache: Optional[ThumbnailCache] = None,
+                                    workers: Optional[int] = None,
+                                    chunk_size: int = 16,
+                                    use_embedded: bool = False) -> List[Image.Image]:
+        """
+        Generate thumbnails using a pool of worker processes.
+
+        Uncached pages are split into runs of consecutive pages; each worker
+        opens the document once per run and sends back compact PNG bytes.
+        Results are returned in the requested page order, as with
+        generate_thumbnails.
+
+        Args:
+            input_path: Path to the PDF file
+            page_numbers: List of page numbers to generate thumbnails for (0-indexed)
+                          If None, generate thumbnails for all pages
+            size: Tuple of (width, height) for the thumbnail size
+            quality: Speed/quality trade-off ("fast", "balanced" or "high")
+            cache: Optional thumbnail cache to read from and populate
+            workers: Number of worker processes (defaults to the CPU count)
+            chunk_size: Number of pages handed to a worker at a time
+            use_embedded: Use embedded page thumbnails when the PDF has them
+
+        Returns:
+            List[PIL.Image]: List of thumbnail images
+        """
+        workers = default_workers(workers)
+        if workers == 1:
+            return ThumbnailGenerator.generate_thumbnails(
+                input_path, page_numbers, size, quality, cache, use_embedded
+            )
+
         try:
-            with pdfplumber.open(str(input_path)) as pdf:
-                # If no page numbers provided, generate thumbnails for all pages
-                if page_numbers is None:
-                    page_numbers = list(range(len(pdf.pages)))
-                
-                # Generate thumbnail for each page
-                for page_num in page_numbers:
-                    if 0 <= page_num < len(pdf.pages):
-                        thumbnail = ThumbnailGenerator.generate_thumbnail(
-                            input_path, page_num, size
-                        )
-                        if thumbnail:
-                            thumbnails.append(thumbnail)
-            
-            return thumbnails
+            if page_numbers is None:
+                pdf = pypdfium2.PdfDocument(str(input_path))
+                try:
+                    page_numbers = list(range(len(pdf)))
+                finally:
+                    pdf.close()
+
+            images = {}
+            keys = {}
+            missing = []
+            for page_num in dict.fromkeys(page_numbers):
+                if cache is not None:
+                    keys[page_num] = cache.make_key(input_path, page_num, size, quality)
+                    cached = cache.get(keys[page_num])
+                    if cached is not None:
+                        cached.info["thumbnail_source"] = SOURCE_CACHE
+                        images[page_num] = cached
+                        continue
+                missing.append(page_num)
+
+            if missing:
+                chunks = list(chunked(missing, chunk_size))
+                with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as executor:
+                    futures = [
+                        executor.submit(_render_chunk, str(input_path), chunk, size, quality,
+                                        use_embedded)
+                        for chunk in chunks
+                    ]
+                    for future in futures:
+                        for page_num, data, source in future.result():
+                            if data is None:
+                                continue
+                            with Image.open(io.BytesIO(data)) as img:
+                                img.load()
+                                image = img.convert("RGB")
+                            if cache is not None and source == SOURCE_RENDERED:
+                                cache.put(keys[page_num], image)
+                            image.info["thumbnail_source"] = source
+                            images[page_num] = image
+
+            return [images[page_num] for page_num in page_numbers if page_num in images]
         except Exception as e:
             print(f"Error generating thumbnails: {str(e)}")
-            return thumbnails
-            
+            return []
+
     @staticmethod
-    def save_thumbnail(image: Image.Image, 
-                      output_path: Union[str, Path], 
+    def save_thumbnail(image: Image.Image,
+                      output_path: Union[str, Path],
                       format: str = "PNG") -> bool:
         """
         Save a thumbnail image to disk.
@@ -103,4 +702,4 @@ class ThumbnailGenerator:
             return True
         except Exception as e:
             print(f"Error saving thumbnail: {str(e)}")
-            return False 
\ No newline at end of file
+            return False
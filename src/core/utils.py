@@ -0,0 +1,165 @@
+"""
+Shared helpers for the core PDF processing modules.
+"""
+import hashlib
+import os
+import sys
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Iterator, List, Optional, Sequence, Tuple, TypeVar, Union
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+T = TypeVar("T")
+
+# Size of the blocks read while hashing file contents
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# Maximum number of memoized content hashes
+_DIGEST_MEMO_SIZE = 1024
+
+_digest_memo = OrderedDict()
+_digest_lock = threading.Lock()
+
+
+def file_fingerprint(input_path: Union[str, Path]) -> Tuple[int, int, str]:
+    """
+    Identify a file by its size, modification time and content hash.
+
+    The SHA-256 content hash is memoized per (path, size, mtime), so asking
+    again for an unchanged file only costs a stat() call.
+
+    Args:
+        input_path: Path to the file
+
+    Returns:
+        Tuple[int, int, str]: (size in bytes, mtime in nanoseconds, hex digest)
+    """
+    path = os.path.abspath(str(input_path))
+    stat = os.stat(path)
+    memo_key = (path, stat.st_size, stat.st_mtime_ns)
+
+    with _digest_lock:
+        digest = _digest_memo.get(memo_key)
+        if digest is not None:
+            _digest_memo.move_to_end(memo_key)
+            return stat.st_size, stat.st_mtime_ns, digest
+
+    sha = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            sha.update(block)
+    digest = sha.hexdigest()
+
+    with _digest_lock:
+        _digest_memo[memo_key] = digest
+        while len(_digest_memo) > _DIGEST_MEMO_SIZE:
+            _digest_memo.popitem(last=False)
+
+    return stat.st_size, stat.st_mtime_ns, digest
+
+
+def default_cache_dir(name: str) -> Path:
+    """
+    Return the per-user cache directory for the application.
+
+    Args:
+        name: Name of the cache subdirectory (e.g. "thumbnails")
+
+    Returns:
+        Path: Directory path (not created)
+    """
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+        return Path(base) / "PDFOrganizer" / "Cache" / name
+    if sys.platform == "darwin":
+        return Path.home() / "Library" / "Caches" / "PDFOrganizer" / name
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base) / "pdf-organizer" / name
+
+
+def default_workers(workers: Optional[int] = None) -> int:
+    """
+    Resolve the number of worker processes to use.
+
+    Args:
+        workers: Requested worker count, or None to use every CPU
+
+    Returns:
+        int: Worker count, at least 1
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    return max(1, int(workers))
+
+
+def chunked(items: Sequence[T], chunk_size: int) -> Iterator[List[T]]:
+    """
+    Split a sequence into consecutive chunks.
+
+    Args:
+        items: Items to split
+        chunk_size: Maximum number of items per chunk
+
+    Yields:
+        List: Consecutive runs of at most chunk_size items
+    """
+    chunk_size = max(1, int(chunk_size))
+    for start in range(0, len(items), chunk_size):
+        yield list(items[start:start + chunk_size])
+
+
+def limit_memory(max_bytes: Optional[int]) -> bool:
+    """
+    Cap the address space of the current process.
+
+    Allocations beyond the limit raise MemoryError instead of exhausting
+    the machine. Only supported on POSIX systems.
+
+    Args:
+        max_bytes: Address space limit in bytes, or None for no limit
+
+    Returns:
+        bool: True if a limit was applied, False otherwise
+    """
+    if max_bytes is None or resource is None:
+        return False
+
+    _, hard = resource.getrlimit(resource.RLIMIT_AS)
+    if hard != resource.RLIM_INFINITY:
+        max_bytes = min(max_bytes, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (max_bytes, hard))
+    return True
+
+
+def peak_rss() -> Optional[int]:
+    """
+    Return the peak resident set size of the current process.
+
+    Returns:
+        Optional[int]: Peak RSS in bytes, or None where unsupported
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Reported in kilobytes on Linux and in bytes on macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def open_handle_count() -> Optional[int]:
+    """
+    Return the number of file descriptors open in the current process.
+
+    Returns:
+        Optional[int]: Open descriptor count, or None where unsupported
+    """
+    for fd_dir in ("/proc/self/fd", "/dev/fd"):
+        try:
+            return len(os.listdir(fd_dir))
+        except OSError:
+            continue
+    return None
@@ -0,0 +1,229 @@
+"""
+Module for compact storage of word positions extracted from PDF pages.
+"""
+import json
+import struct
+from array import array
+from typing import BinaryIO, Dict, Iterable, Iterator, List, NamedTuple, TextIO
+
+# Binary stream layout: MAGIC, then a sequence of records. A string record
+# (b"S", uint32 byte length, UTF-8 bytes) defines the next string id; a word
+# record (b"W", WORD_RECORD) refers to strings defined earlier by id.
+MAGIC = b"PDFWORDS\x01"
+STRING_LENGTH = struct.Struct("<I")
+WORD_RECORD = struct.Struct("<IIIfffff")
+
+# Decimal places kept for coordinates in NDJSON output
+NDJSON_PRECISION = 3
+
+
+class Word(NamedTuple):
+    """A word and its position on a page, in PDF points from the top left."""
+    page: int
+    text: str
+    x0: float
+    top: float
+    x1: float
+    bottom: float
+    size: float
+    font: str
+
+
+class WordTable:
+    """
+    Columnar table of words with their bounding boxes, font size and font.
+
+    Numbers are held in typed arrays (one per column) and word and font
+    names in an interned string table, so a word costs about 32 bytes
+    instead of a dictionary per word.
+    """
+
+    def __init__(self):
+        """Initialize an empty table."""
+        self.page = array("I")
+        self.x0 = array("f")
+        self.top = array("f")
+        self.x1 = array("f")
+        self.bottom = array("f")
+        self.size = array("f")
+        self.text = array("I")
+        self.font = array("I")
+        self.strings: List[str] = []
+        self._string_ids: Dict[str, int] = {}
+
+    def intern(self, value: str) -> int:
+        """
+        Return the string table id of a string, adding it if needed.
+
+        Args:
+            value: String to look up
+
+        Returns:
+            int: Index into self.strings
+        """
+        string_id = self._string_ids.get(value)
+        if string_id is None:
+            string_id = len(self.strings)
+            self.strings.append(value)
+            self._string_ids[value] = string_id
+        return string_id
+
+    def append(self, page: int, text: str, x0: float, top: float,
+               x1: float, bottom: float, size: float, font: str) -> None:
+        """Add one word to the table."""
+        self.page.append(page)
+        self.text.append(self.intern(text))
+        self.x0.append(x0)
+        self.top.append(top)
+        self.x1.append(x1)
+        self.bottom.append(bottom)
+        self.size.append(size)
+        self.font.append(self.intern(font))
+
+    def extend_words(self, page: int, words: Iterable[Dict]) -> None:
+        """
+        Add the words of a page as returned by pdfplumber's extract_words.
+
+        Args:
+            page: Page number (0-indexed)
+            words: Word dictionaries with text, x0, top, x1, bottom and
+                   optionally size and fontname
+        """
+        for word in words:
+            self.append(page, word["text"], word["x0"], word["top"], word["x1"],
+                        word["bottom"], word.get("size", 0.0), word.get("fontname", ""))
+
+    def __len__(self) -> int:
+        return len(self.page)
+
+    def __getitem__(self, index: int) -> Word:
+        return Word(
+            self.page[index],
+            self.strings[self.text[index]],
+            self.x0[index],
+            self.top[index],
+            self.x1[index],
+            self.bottom[index],
+            self.size[index],
+            self.strings[self.font[index]],
+        )
+
+    def __iter__(self) -> Iterator[Word]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def nbytes(self) -> int:
+        """
+        Return the memory held by the columns and the string table.
+
+        Returns:
+            int: Approximate size in bytes
+        """
+        columns = (self.page, self.x0, self.top, self.x1, self.bottom,
+                   self.size, self.text, self.font)
+        return (sum(column.itemsize * len(column) for column in columns)
+                + sum(len(value.encode("utf-8")) for value in self.strings))
+
+    def iter_ndjson(self) -> Iterator[str]:
+        """
+        Serialize the words as newline-delimited JSON.
+
+        Yields:
+            str: One JSON object per word, including the trailing newline
+        """
+        for word in self:
+            record = word._asdict()
+            for key in ("x0", "top", "x1", "bottom", "size"):
+                record[key] = round(record[key], NDJSON_PRECISION)
+            yield json.dumps(record, ensure_ascii=False) + "\n"
+
+    def write_ndjson(self, stream: TextIO) -> None:
+        """Write the words as newline-delimited JSON to a text stream."""
+        stream.writelines(self.iter_ndjson())
+
+    def write_binary(self, stream: BinaryIO) -> None:
+        """Write the table to a binary stream in the format read by read_binary."""
+        BinaryWordWriter(stream).write(self)
+
+    @classmethod
+    def read_binary(cls, stream: BinaryIO) -> "WordTable":
+        """
+        Read a table written by write_binary or BinaryWordWriter.
+
+        Args:
+            stream: Binary stream positioned at the start of the data
+
+        Returns:
+            WordTable: The words stored in the stream
+        """
+        if stream.read(len(MAGIC)) != MAGIC:
+            raise ValueError("Not a word table stream")
+
+        table = cls()
+        while True:
+            tag = stream.read(1)
+            if not tag:
+                return table
+            if tag == b"S":
+                (length,) = STRING_LENGTH.unpack(stream.read(STRING_LENGTH.size))
+                value = stream.read(length).decode("utf-8")
+                # Stream ids are dense, so they match the ids of this table
+                table.strings.append(value)
+                table._string_ids.setdefault(value, len(table.strings) - 1)
+            elif tag == b"W":
+                page, text, font, x0, top, x1, bottom, size = WORD_RECORD.unpack(
+                    stream.read(WORD_RECORD.size)
+                )
+                table.page.append(page)
+                table.text.append(text)
+                table.font.append(font)
+                table.x0.append(x0)
+                table.top.append(top)
+                table.x1.append(x1)
+                table.bottom.append(bottom)
+                table.size.append(size)
+            else:
+                raise ValueError(f"Unknown record type {tag!r}")
+
+
+class BinaryWordWriter:
+    """
+    Incremental writer of the binary word table format.
+
+    Tables can be written one page at a time; strings are defined the first
+    time they are used, so a stream of many page tables shares one string
+    table.
+    """
+
+    def __init__(self, stream: BinaryIO):
+        """
+        Initialize the writer and write the stream header.
+
+        Args:
+            stream: Binary stream to write to
+        """
+        self.stream = stream
+        self._string_ids: Dict[str, int] = {}
+        stream.write(MAGIC)
+
+    def _string_id(self, value: str) -> int:
+        """Return the stream id of a string, defining it if needed."""
+        string_id = self._string_ids.get(value)
+        if string_id is None:
+            string_id = len(self._string_ids)
+            self._string_ids[value] = string_id
+            data = value.encode("utf-8")
+            self.stream.write(b"S" + STRING_LENGTH.pack(len(data)) + data)
+        return string_id
+
+    def write(self, table: WordTable) -> None:
+        """Append the words of a table to the stream."""
+        strings = table.strings
+        for index in range(len(table)):
+            text = self._string_id(strings[table.text[index]])
+            font = self._string_id(strings[table.font[index]])
+            self.stream.write(b"W" + WORD_RECORD.pack(
+                table.page[index], text, font,
+                table.x0[index], table.top[index], table.x1[index],
+                table.bottom[index], table.size[index],
+            ))
@@ -7,6 +7,7 @@ from .split_frame import SplitFrame
 from .text_frame import TextFrame
 from .reorganize_frame import ReorganizeFrame
 from .security_frame import SecurityFrame
+from .search_frame import SearchFrame
 
 __all__ = [
     'PDFToolApp',
@@ -15,4 +16,5 @@ __all__ = [
     'TextFrame',
     'ReorganizeFrame',
     'SecurityFrame',
+    'SearchFrame',
 ] 
\ No newline at end of file
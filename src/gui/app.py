@@ -11,6 +11,8 @@ from gui.split_frame import SplitFrame
 from gui.text_frame import TextFrame
 from gui.reorganize_frame import ReorganizeFrame
 from gui.security_frame import SecurityFrame
+from gui.search_frame import SearchFrame
+from core.text_extractor import TextCache
 
 
 class PDFToolApp:
@@ -46,12 +48,16 @@ class PDFToolApp:
         self.notebook = ttk.Notebook(self.root)
         self.notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
+        # One text cache for all frames, so its size budget covers them all
+        self.text_cache = TextCache()
+
         # Create frames for each feature
         self.merge_frame = MergeFrame(self.notebook)
         self.split_frame = SplitFrame(self.notebook)
-        self.text_frame = TextFrame(self.notebook)
+        self.text_frame = TextFrame(self.notebook, text_cache=self.text_cache)
         self.reorganize_frame = ReorganizeFrame(self.notebook)
         self.security_frame = SecurityFrame(self.notebook)
+        self.search_frame = SearchFrame(self.notebook, text_cache=self.text_cache)
         
         # Add the frames to the notebook
         self.notebook.add(self.merge_frame, text="Merge PDFs")
@@ -59,6 +65,7 @@ class PDFToolApp:
         self.notebook.add(self.text_frame, text="Extract Text")
         self.notebook.add(self.reorganize_frame, text="Rearrange Pages")
         self.notebook.add(self.security_frame, text="Security")
+        self.notebook.add(self.search_frame, text="Search Library")
         
         # Add status bar
         self.status_var = tk.StringVar()
@@ -96,7 +103,8 @@ class PDFToolApp:
             "- Split PDFs by pages\n"
             "- Extract text\n"
             "- Rearrange pages\n"
-            "- Encrypt/decrypt PDFs"
+            "- Encrypt/decrypt PDFs\n"
+            "- Search a PDF library"
         )
     
     def set_status(self, message):
@@ -179,11 +179,13 @@ class MergeFrame(ttk.Frame):
             pass
         
         try:
-            result = PDFMerger.merge_pdfs(self.pdf_files, output_path)
+            stats = PDFMerger.merge_pdfs_streaming(self.pdf_files, output_path)
             
-            if result:
+            if stats is not None:
                 try:
-                    app.set_status("PDFs merged successfully.")
+                    app.set_status(
+                        f"PDFs merged successfully ({stats['pages']} pages from {stats['inputs']} files)."
+                    )
                 except (AttributeError, NameError):
                     pass
                 messagebox.showinfo("Success", f"PDFs merged successfully to:\n{output_path}")
@@ -2,15 +2,48 @@
 Frame for reorganizing pages in a PDF file.
 """
 import os
+import queue
+import threading
 import tkinter as tk
+from collections import OrderedDict
 from tkinter import ttk
 from tkinter import filedialog, messagebox
 from typing import List, Dict
-import io
+
+from PIL import Image, ImageTk
 
 from core.page_reorganizer import PageReorganizer
-from core.thumbnail import ThumbnailGenerator
-from pypdf import PdfReader
+from core.thumbnail import ThumbnailGenerator, ThumbnailCache
+from core.document_pool import page_count
+
+
+# Interval between polls of the thumbnail worker queue (milliseconds)
+POLL_INTERVAL_MS = 30
+
+# Maximum number of thumbnails taken from the worker queue per poll, so the
+# Tk mainloop keeps handling input while a document is loading
+THUMBNAILS_PER_POLL = 32
+
+# Size of the rendered page thumbnails
+THUMBNAIL_SIZE = (200, 200)
+
+# Placeholder previews rendered for every page before the full thumbnails
+PREVIEW_SIZE = (48, 48)
+THUMBNAIL_LEVELS = (
+    (PREVIEW_SIZE, "fast"),
+    (THUMBNAIL_SIZE, "balanced"),
+)
+
+# Fixed height of one page row (title label, thumbnail and padding), which
+# lets the view map scroll offsets to page positions without measuring widgets
+ROW_HEIGHT = THUMBNAIL_SIZE[1] + 40
+ROW_PADDING = 5
+
+# Rows kept alive above and below the viewport to hide recycling while scrolling
+OVERSCAN_ROWS = 2
+
+# Number of converted Tk images kept for pages that scrolled out of view
+PHOTO_CACHE_SIZE = 200
 
 
 class ReorganizeFrame(ttk.Frame):
@@ -27,8 +60,25 @@ class ReorganizeFrame(ttk.Frame):
         self.parent = parent
         self.input_file = None
         self.total_pages = 0
-        self.thumbnails = []
+        self.thumbnails = {}
         self.current_order = []
+        self.thumbnail_cache = ThumbnailCache()
+        self._load_queue = None
+        self._load_cancel = None
+        self._loaded_count = []
+        
+        # Virtualized view: only rows near the viewport exist as widgets.
+        # _rows maps a position in current_order to the row showing it;
+        # rows scrolled out of view are kept in _spare_rows for reuse.
+        self._rows = {}
+        self._spare_rows = []
+        
+        # Tk images of recently shown pages, least recently used first
+        self._photo_cache = OrderedDict()
+        
+        # Pages currently on screen; read by the loader thread to render
+        # them first, so only ever replaced (never mutated) from the Tk thread
+        self._visible_pages = ()
         
         self._setup_ui()
     
@@ -62,18 +112,13 @@ class ReorganizeFrame(ttk.Frame):
         thumbnails_frame.grid_rowconfigure(0, weight=1)
         
         # Canvas for thumbnails with scrollbar
-        self.canvas = tk.Canvas(thumbnails_frame)
-        scrollbar = ttk.Scrollbar(thumbnails_frame, orient=tk.VERTICAL, command=self.canvas.yview)
+        self.canvas = tk.Canvas(thumbnails_frame, yscrollincrement=ROW_HEIGHT // 4)
+        scrollbar = ttk.Scrollbar(thumbnails_frame, orient=tk.VERTICAL, command=self._on_scroll)
         self.canvas.configure(yscrollcommand=scrollbar.set)
         
         self.canvas.grid(row=0, column=0, sticky="nsew")
         scrollbar.grid(row=0, column=1, sticky="ns")
         
-        # Frame inside canvas for thumbnails
-        self.pages_frame = ttk.Frame(self.canvas)
-        self.canvas_window = self.canvas.create_window((0, 0), window=self.pages_frame, anchor="nw")
-        
-        self.pages_frame.bind("<Configure>", self._on_frame_configure)
         self.canvas.bind("<Configure>", self._on_canvas_configure)
         
         # Bind mouse wheel events for scrolling
@@ -105,13 +150,17 @@ class ReorganizeFrame(ttk.Frame):
         reset_button = ttk.Button(button_frame, text="Reset Order", command=self._reset_order)
         reset_button.pack(side=tk.LEFT, padx=5)
     
-    def _on_frame_configure(self, event):
-        """Configure the canvas scrollregion when the frame changes size."""
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-    
     def _on_canvas_configure(self, event):
-        """Resize the frame inside the canvas when the canvas changes size."""
-        self.canvas.itemconfig(self.canvas_window, width=event.width)
+        """Resize the rows and fill the viewport when the canvas changes size."""
+        self._update_scrollregion()
+        for row in list(self._rows.values()) + self._spare_rows:
+            self.canvas.itemconfig(row.window, width=self._row_width())
+        self._refresh_rows()
+    
+    def _on_scroll(self, *args):
+        """Scroll the canvas from the scrollbar and update the visible rows."""
+        self.canvas.yview(*args)
+        self._refresh_rows()
     
     def _on_mousewheel(self, event):
         """Handle mouse wheel scrolling."""
@@ -122,6 +171,7 @@ class ReorganizeFrame(ttk.Frame):
             self.canvas.yview_scroll(1, "units")
         else:  # Windows
             self.canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+        self._refresh_rows()
     
     def _browse_input(self):
         """Browse for input PDF file."""
@@ -159,99 +209,301 @@ class ReorganizeFrame(ttk.Frame):
             return
         
         try:
-            with open(self.input_file, 'rb') as f:
-                reader = PdfReader(f)
-                self.total_pages = len(reader.pages)
+            self.total_pages = page_count(self.input_file)
         except Exception as e:
             self.total_pages = 0
             print(f"Error reading PDF: {str(e)}")
     
     def _load_pages(self):
-        """Load PDF pages and display thumbnails for reordering."""
+        """Start loading PDF pages and display thumbnails as they are rendered."""
         input_path = self.input_var.get()
         if not input_path:
             messagebox.showwarning("No Input", "Please select an input PDF file.")
             return
         
-        # Get parent application to update status
-        try:
-            app = self.parent.master
-            app.set_status("Loading PDF pages...")
-        except AttributeError:
-            # If that fails, just continue without status updates
-            pass
+        # Stop a load that is still running
+        self._cancel_load()
         
+        self._set_status("Loading PDF pages...")
+        
+        self.input_file = input_path
+        self._update_page_info()
+        
+        # Every page gets a placeholder row right away; thumbnails fill in
+        self.thumbnails = {}
+        self._photo_cache.clear()
+        self.current_order = list(range(self.total_pages))
+        self.canvas.yview_moveto(0)
+        self._display_thumbnails()
+        
+        # Render in a background thread; results are handed over through a queue
+        # and added to the view from the Tk mainloop
+        self._load_queue = queue.Queue()
+        self._load_cancel = threading.Event()
+        self._loaded_count = [0] * len(THUMBNAIL_LEVELS)
+        worker = threading.Thread(
+            target=self._thumbnail_worker,
+            args=(input_path, self._load_queue, self._load_cancel),
+            daemon=True,
+        )
+        worker.start()
+        self.after(POLL_INTERVAL_MS, self._poll_thumbnails, self._load_queue)
+    
+    def _thumbnail_worker(self, input_path, results, cancel):
+        """
+        Render thumbnails in the background (runs outside the Tk thread).
+
+        A cheap low-resolution preview (or the embedded page thumbnail) is
+        produced for every page first; full thumbnails then replace them,
+        starting with the pages on screen.
+
+        Args:
+            input_path: Path to the PDF file
+            results: Queue receiving ("page", level, index, image), ("error", message) and ("done",)
+            cancel: Event set when the load is abandoned
+        """
         try:
-            # Clear existing thumbnails
-            for widget in self.pages_frame.winfo_children():
-                widget.destroy()
-            
-            self._update_page_info()
-            
-            # Generate thumbnails for all pages
-            self.thumbnails = ThumbnailGenerator.generate_thumbnails(input_path)
-            
-            # Initialize the current order
-            self.current_order = list(range(self.total_pages))
-            
-            # Display thumbnails
-            self._display_thumbnails()
-            
-            try:
-                app.set_status("PDF pages loaded successfully.")
-            except (AttributeError, NameError):
-                pass
+            for level, page_idx, thumbnail in ThumbnailGenerator.iter_thumbnail_levels(
+                input_path,
+                levels=THUMBNAIL_LEVELS,
+                cache=self.thumbnail_cache,
+                priority=lambda: self._visible_pages,
+            ):
+                if cancel.is_set():
+                    return
+                if level < len(THUMBNAIL_LEVELS) - 1:
+                    thumbnail = self._scale_preview(thumbnail)
+                results.put(("page", level, page_idx, thumbnail))
         except Exception as e:
-            try:
-                app.set_status("Error loading PDF pages.")
-            except (AttributeError, NameError):
-                pass
-            messagebox.showerror("Error", f"An error occurred while loading PDF pages:\n{str(e)}")
+            results.put(("error", str(e)))
+        results.put(("done",))
+    
+    def _poll_thumbnails(self, results):
+        """Add newly rendered thumbnails to the view in small batches."""
+        if results is not self._load_queue:
+            return  # A newer load replaced this one
         
+        for _ in range(THUMBNAILS_PER_POLL):
+            try:
+                message = results.get_nowait()
+            except queue.Empty:
+                break
+            
+            if message[0] == "page":
+                _, level, page_idx, thumbnail = message
+                self.thumbnails[page_idx] = thumbnail
+                self._photo_cache.pop(page_idx, None)
+                self._refresh_page(page_idx)
+                self._loaded_count[level] += 1
+                if level == 0:
+                    self._set_status(
+                        f"Loading page previews... ({self._loaded_count[0]}/{self.total_pages})"
+                    )
+                else:
+                    self._set_status(
+                        f"Rendering pages... ({self._loaded_count[level]}/{self.total_pages})"
+                    )
+            elif message[0] == "error":
+                self._finish_load()
+                self._set_status("Error loading PDF pages.")
+                messagebox.showerror("Error", f"An error occurred while loading PDF pages:\n{message[1]}")
+                self._set_status("Ready")
+                return
+            else:
+                self._finish_load()
+                # Pages that never arrived could not be rendered
+                for position, row in self._rows.items():
+                    if row.photo is None:
+                        self._bind_row(row, position)
+                self._set_status("Ready")
+                return
+        
+        self.after(POLL_INTERVAL_MS, self._poll_thumbnails, results)
+    
+    @staticmethod
+    def _scale_preview(image):
+        """
+        Enlarge a low-resolution preview to the thumbnail size.
+
+        Nearest-neighbour scaling keeps it cheap, and the full-size preview
+        stops rows from changing size when the real thumbnail arrives.
+        """
+        factor = min(THUMBNAIL_SIZE[0] / image.width, THUMBNAIL_SIZE[1] / image.height)
+        if factor <= 1:
+            return image
+        size = (max(1, int(image.width * factor)), max(1, int(image.height * factor)))
+        return image.resize(size, Image.NEAREST)
+    
+    def _cancel_load(self):
+        """Abandon a thumbnail load that is still in progress."""
+        if self._load_cancel is not None:
+            self._load_cancel.set()
+        self._finish_load()
+    
+    def _finish_load(self):
+        """Forget the state of the current thumbnail load."""
+        self._load_queue = None
+        self._load_cancel = None
+    
+    def _set_status(self, message):
+        """Update the application status bar, if available."""
         try:
-            app.set_status("Ready")
-        except (AttributeError, NameError):
+            self.parent.master.set_status(message)
+        except AttributeError:
             pass
     
     def _display_thumbnails(self):
         """Display the thumbnails in the current order."""
-        # Clear existing thumbnails
-        for widget in self.pages_frame.winfo_children():
-            widget.destroy()
+        # Recycle every row; the visible ones are rebound below
+        for position in list(self._rows):
+            self._release_row(position)
         
-        if not self.thumbnails:
-            return
+        self._update_scrollregion()
+        self._refresh_rows()
+    
+    def _row_width(self):
+        """Return the width available to a row inside the canvas."""
+        return max(1, self.canvas.winfo_width() - 2 * ROW_PADDING)
+    
+    def _update_scrollregion(self):
+        """Size the scrollable area for the full page list."""
+        height = len(self.current_order) * ROW_HEIGHT
+        self.canvas.configure(scrollregion=(0, 0, self.canvas.winfo_width(), height))
+    
+    def _visible_positions(self):
+        """
+        Return the range of page positions in or near the viewport.
+
+        Returns:
+            range: Positions of current_order that should have a row
+        """
+        top = self.canvas.canvasy(0)
+        bottom = self.canvas.canvasy(self.canvas.winfo_height())
+        first = max(0, int(top // ROW_HEIGHT) - OVERSCAN_ROWS)
+        last = min(len(self.current_order), int(bottom // ROW_HEIGHT) + 1 + OVERSCAN_ROWS)
+        return range(first, last)
+    
+    def _refresh_rows(self):
+        """Create, recycle and bind rows so exactly the visible positions are shown."""
+        visible = self._visible_positions()
         
-        # Display thumbnails in the current order
-        for i, page_idx in enumerate(self.current_order):
-            frame = ttk.Frame(self.pages_frame)
-            frame.grid(row=i, column=0, sticky="ew", padx=5, pady=5)
-            
-            # Convert thumbnail to PhotoImage for display
-            thumbnail = self.thumbnails[page_idx]
-            photo = tk.PhotoImage(data=self._pil_to_data(thumbnail))
-            
-            # Store the photo to prevent garbage collection
-            frame.photo = photo
-            
-            # Label for the page number
-            ttk.Label(frame, text=f"Page {page_idx + 1}").pack(side=tk.TOP)
-            
-            # Thumbnail display
-            label = ttk.Label(frame, image=photo)
-            label.pack(side=tk.TOP)
-            
-            # Make the frame draggable
-            label.bind("<ButtonPress-1>", lambda event, idx=i: self._on_drag_start(event, idx))
-            label.bind("<B1-Motion>", self._on_drag_motion)
-            label.bind("<ButtonRelease-1>", self._on_drag_release)
-    
-    def _pil_to_data(self, image):
-        """Convert PIL image to data for Tkinter PhotoImage."""
-        data = io.BytesIO()
-        image.save(data, format="PNG")
-        data.seek(0)
-        return data.read()
+        for position in [p for p in self._rows if p not in visible]:
+            self._release_row(position)
+        
+        for position in visible:
+            if position not in self._rows:
+                row = self._spare_rows.pop() if self._spare_rows else self._create_row()
+                self._rows[position] = row
+                self._bind_row(row, position)
+        
+        self._visible_pages = tuple(self.current_order[position] for position in visible)
+    
+    def _refresh_page(self, page_idx):
+        """Rebind the visible row showing a page, e.g. after its thumbnail arrived."""
+        for position, row in self._rows.items():
+            if row.page_idx == page_idx:
+                self._bind_row(row, position)
+    
+    def _create_row(self):
+        """
+        Create a reusable row widget placed on the canvas.
+
+        Returns:
+            ttk.Frame: Row with ``title`` and ``image_label`` child labels
+        """
+        row = ttk.Frame(self.canvas)
+        row.title = ttk.Label(row)
+        row.title.pack(side=tk.TOP)
+        row.image_label = ttk.Label(row)
+        row.image_label.pack(side=tk.TOP)
+        row.photo = None
+        row.page_idx = None
+        row.position = None
+        row.window = self.canvas.create_window(
+            ROW_PADDING, 0, window=row, anchor="nw",
+            width=self._row_width(), height=ROW_HEIGHT - 2 * ROW_PADDING
+        )
+        
+        # Make the row draggable; the position is looked up when the drag starts
+        row.image_label.bind("<ButtonPress-1>", lambda event, r=row: self._on_drag_start(event, r.position))
+        row.image_label.bind("<B1-Motion>", self._on_drag_motion)
+        row.image_label.bind("<ButtonRelease-1>", self._on_drag_release)
+        
+        # Rows cover the canvas, so they have to forward wheel events as well
+        for widget in (row, row.title, row.image_label):
+            widget.bind("<MouseWheel>", self._on_mousewheel)
+            widget.bind("<Button-4>", self._on_mousewheel)
+            widget.bind("<Button-5>", self._on_mousewheel)
+        
+        return row
+    
+    def _bind_row(self, row, position):
+        """
+        Show the page at a position of the current order in a row.
+
+        Args:
+            row: Row widget created by _create_row
+            position: Index into current_order
+        """
+        page_idx = self.current_order[position]
+        row.page_idx = page_idx
+        row.title.configure(text=f"Page {page_idx + 1}")
+        
+        photo = self._get_photo(page_idx)
+        if photo is not None:
+            # The row keeps the reference to prevent garbage collection
+            row.photo = photo
+            row.image_label.configure(image=row.photo, text="")
+        else:
+            row.photo = None
+            row.image_label.configure(image="", text="Loading..." if self._load_queue else "(preview unavailable)")
+        
+        self._place_row(row, position)
+        self.canvas.itemconfig(row.window, state="normal")
+    
+    def _place_row(self, row, position):
+        """Move a row widget to a position on the canvas."""
+        row.position = position
+        self.canvas.coords(row.window, ROW_PADDING, position * ROW_HEIGHT + ROW_PADDING)
+    
+    def _release_row(self, position):
+        """Hide the row at a position and keep it for reuse."""
+        row = self._rows.pop(position)
+        self.canvas.itemconfig(row.window, state="hidden")
+        row.image_label.configure(image="")
+        row.photo = None
+        row.page_idx = None
+        row.position = None
+        self._spare_rows.append(row)
+    
+    def _get_photo(self, page_idx):
+        """
+        Return the Tk image for a page, converting its thumbnail at most once.
+
+        Args:
+            page_idx: Page number (0-indexed)
+
+        Returns:
+            ImageTk.PhotoImage or None: Image, or None if no thumbnail is available
+        """
+        photo = self._photo_cache.get(page_idx)
+        if photo is not None:
+            self._photo_cache.move_to_end(page_idx)
+            return photo
+        
+        thumbnail = self.thumbnails.get(page_idx)
+        if thumbnail is None:
+            return None
+        
+        photo = self._pil_to_photo(thumbnail)
+        self._photo_cache[page_idx] = photo
+        while len(self._photo_cache) > PHOTO_CACHE_SIZE:
+            self._photo_cache.popitem(last=False)
+        return photo
+    
+    def _pil_to_photo(self, image):
+        """Convert PIL image to a Tk image by copying its pixels directly."""
+        return ImageTk.PhotoImage(image, master=self)
     
     def _on_drag_start(self, event, idx):
         """Start dragging a thumbnail."""
@@ -271,31 +523,17 @@ class ReorganizeFrame(ttk.Frame):
         if not hasattr(self, '_drag_data'):
             return
         
-        # Calculate the new position based on the y-coordinate
-        y = event.y_root
+        # Calculate the new position from the y-coordinate on the canvas;
+        # rows have a fixed height so no widget has to be inspected
+        y = self.canvas.canvasy(event.y_root - self.canvas.winfo_rooty())
         new_idx = None
         
-        for i, frame in enumerate(self.pages_frame.winfo_children()):
-            frame_y = frame.winfo_rooty()
-            frame_height = frame.winfo_height()
-            
-            if frame_y <= y <= frame_y + frame_height:
-                new_idx = i
-                break
+        if 0 <= y < len(self.current_order) * ROW_HEIGHT:
+            new_idx = int(y // ROW_HEIGHT)
         
         # If dropped at a valid position, update the order
         if new_idx is not None and new_idx != self._drag_data['idx']:
-            idx = self._drag_data['idx']
-            page_idx = self.current_order[idx]
-            
-            # Remove the page from its current position
-            self.current_order.pop(idx)
-            
-            # Insert it at the new position
-            self.current_order.insert(new_idx, page_idx)
-            
-            # Redisplay the thumbnails
-            self._display_thumbnails()
+            self._move_page(self._drag_data['idx'], new_idx)
         
         # Remove highlight from the selected frame
         event.widget.configure(style="TLabel")
@@ -303,6 +541,34 @@ class ReorganizeFrame(ttk.Frame):
         # Clear drag data
         del self._drag_data
     
+    def _move_page(self, old_idx, new_idx):
+        """
+        Move a page to a new position, updating only the shifted rows.
+
+        Rows keep showing the same page (and PhotoImage); the ones between
+        the two positions are just moved one slot up or down on the canvas.
+
+        Args:
+            old_idx: Current position of the page in current_order
+            new_idx: Position to move the page to
+        """
+        page_idx = self.current_order.pop(old_idx)
+        self.current_order.insert(new_idx, page_idx)
+        
+        low, high = min(old_idx, new_idx), max(old_idx, new_idx)
+        shift = -1 if new_idx > old_idx else 1
+        moved = {}
+        for position in [p for p in self._rows if low <= p <= high]:
+            target = new_idx if position == old_idx else position + shift
+            moved[target] = self._rows.pop(position)
+        
+        for position, row in moved.items():
+            self._place_row(row, position)
+        self._rows.update(moved)
+        
+        # Fill a slot left empty if the dragged page came from outside the view
+        self._refresh_rows()
+    
     def _reset_order(self):
         """Reset the page order to the original order."""
         self.current_order = list(range(self.total_pages))
@@ -0,0 +1,239 @@
+"""
+Library search frame for the PDF Tool application.
+"""
+import os
+import queue
+import subprocess
+import sys
+import threading
+import tkinter as tk
+from tkinter import ttk
+from tkinter import filedialog, messagebox
+
+from core.library_index import LibraryIndex
+from core.text_extractor import TextCache
+
+# Delay between checks for indexing progress from the worker thread
+POLL_INTERVAL_MS = 100
+
+# Maximum number of hits shown for a query
+MAX_RESULTS = 200
+
+
+class SearchFrame(ttk.Frame):
+    """Frame for the Library Search functionality."""
+
+    def __init__(self, parent, text_cache=None):
+        """
+        Initialize the Library Search frame.
+
+        Args:
+            parent: The parent widget
+            text_cache: TextCache shared with the other frames (a new one
+                        is created if omitted)
+        """
+        super().__init__(parent, padding=10)
+        self.parent = parent
+        self.index = LibraryIndex(text_cache=text_cache if text_cache is not None else TextCache())
+        self._index_queue = None
+        self._index_cancel = None
+
+        self._setup_ui()
+
+    def _setup_ui(self):
+        """Set up the user interface components."""
+        # Create layout
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(2, weight=1)
+
+        # Library folder selection
+        folder_frame = ttk.LabelFrame(self, text="PDF Library")
+        folder_frame.grid(row=0, column=0, sticky="ew", padx=5, pady=5)
+        folder_frame.grid_columnconfigure(1, weight=1)
+
+        ttk.Label(folder_frame, text="Folder:").grid(row=0, column=0, padx=5, pady=5, sticky="w")
+
+        self.folder_var = tk.StringVar()
+        folder_entry = ttk.Entry(folder_frame, textvariable=self.folder_var, width=50)
+        folder_entry.grid(row=0, column=1, padx=5, pady=5, sticky="ew")
+
+        browse_button = ttk.Button(folder_frame, text="Browse", command=self._browse_folder)
+        browse_button.grid(row=0, column=2, padx=5, pady=5)
+
+        self.index_button = ttk.Button(folder_frame, text="Update Index", command=self._update_index)
+        self.index_button.grid(row=0, column=3, padx=5, pady=5)
+
+        self.index_info_var = tk.StringVar()
+        ttk.Label(folder_frame, textvariable=self.index_info_var).grid(
+            row=1, column=1, columnspan=3, padx=5, pady=5, sticky="w"
+        )
+
+        # Query entry
+        query_frame = ttk.LabelFrame(self, text="Search")
+        query_frame.grid(row=1, column=0, sticky="ew", padx=5, pady=5)
+        query_frame.grid_columnconfigure(0, weight=1)
+
+        self.query_var = tk.StringVar()
+        query_entry = ttk.Entry(query_frame, textvariable=self.query_var)
+        query_entry.grid(row=0, column=0, padx=5, pady=5, sticky="ew")
+        query_entry.bind("<Return>", lambda event: self._search())
+
+        search_button = ttk.Button(query_frame, text="Search", command=self._search)
+        search_button.grid(row=0, column=1, padx=5, pady=5)
+
+        # Results list
+        results_frame = ttk.LabelFrame(self, text="Results (double-click to open)")
+        results_frame.grid(row=2, column=0, sticky="nsew", padx=5, pady=5)
+        results_frame.grid_columnconfigure(0, weight=1)
+        results_frame.grid_rowconfigure(0, weight=1)
+
+        self.results_tree = ttk.Treeview(
+            results_frame, columns=("file", "page", "snippet"), show="headings"
+        )
+        self.results_tree.heading("file", text="File")
+        self.results_tree.heading("page", text="Page")
+        self.results_tree.heading("snippet", text="Match")
+        self.results_tree.column("file", width=200)
+        self.results_tree.column("page", width=50, anchor=tk.CENTER, stretch=False)
+        self.results_tree.column("snippet", width=450)
+        self.results_tree.grid(row=0, column=0, sticky="nsew")
+        self.results_tree.bind("<Double-1>", self._open_result)
+
+        scrollbar = ttk.Scrollbar(results_frame, orient=tk.VERTICAL, command=self.results_tree.yview)
+        scrollbar.grid(row=0, column=1, sticky="ns")
+        self.results_tree.configure(yscrollcommand=scrollbar.set)
+
+        self._hits = {}
+        self._update_index_info()
+
+    def _browse_folder(self):
+        """Browse for the library folder."""
+        folder = filedialog.askdirectory(title="Select PDF Library Folder")
+        if folder:
+            self.folder_var.set(folder)
+
+    def _update_index_info(self):
+        """Show the size of the index."""
+        try:
+            stats = self.index.stats()
+            self.index_info_var.set(f"Indexed: {stats['files']} files, {stats['pages']} pages")
+        except Exception as e:
+            self.index_info_var.set("Error reading index")
+            print(f"Error reading index: {str(e)}")
+
+    def _update_index(self):
+        """Index new and changed files in the selected folder in the background."""
+        if self._index_cancel is not None:
+            # A running update doubles as the cancel button
+            self._index_cancel.set()
+            return
+
+        folder = self.folder_var.get()
+        if not folder or not os.path.isdir(folder):
+            messagebox.showwarning("No Folder", "Please select a folder containing PDF files.")
+            return
+
+        self._index_queue = queue.Queue()
+        self._index_cancel = threading.Event()
+        self.index_button.configure(text="Stop Indexing")
+        self._set_status("Indexing library...")
+
+        worker = threading.Thread(
+            target=self._index_worker,
+            args=(folder, self._index_queue, self._index_cancel),
+            daemon=True,
+        )
+        worker.start()
+        self.after(POLL_INTERVAL_MS, self._poll_index, self._index_queue)
+
+    def _index_worker(self, folder, results, cancel):
+        """Update the index (runs outside the Tk thread)."""
+        try:
+            summary = self.index.update(
+                folder,
+                progress=lambda done, total, path: results.put(("progress", done, total, path)),
+                cancel=cancel,
+            )
+            results.put(("done", summary))
+        except Exception as e:
+            results.put(("error", str(e)))
+
+    def _poll_index(self, results):
+        """Report indexing progress from the worker thread."""
+        message = None
+        try:
+            # Only the latest progress report matters
+            while True:
+                message = results.get_nowait()
+                if message[0] != "progress":
+                    break
+        except queue.Empty:
+            pass
+
+        if message is None or message[0] == "progress":
+            if message is not None:
+                _, done, total, path = message
+                self._set_status(f"Indexing {os.path.basename(path)}... ({done}/{total})")
+            self.after(POLL_INTERVAL_MS, self._poll_index, results)
+            return
+
+        cancelled = self._index_cancel.is_set()
+        self._index_queue = None
+        self._index_cancel = None
+        self.index_button.configure(text="Update Index")
+        self._update_index_info()
+
+        if message[0] == "error":
+            self._set_status("Error indexing library.")
+            messagebox.showerror("Error", f"An error occurred while indexing:\n{message[1]}")
+            self._set_status("Ready")
+            return
+
+        summary = message[1]
+        self._set_status(
+            f"{'Indexing stopped' if cancelled else 'Index updated'}: "
+            f"{summary['indexed']} indexed, {summary['unchanged']} unchanged, "
+            f"{summary['removed']} removed, {summary['failed']} failed"
+        )
+
+    def _search(self):
+        """Run the query and list the matching pages."""
+        query = self.query_var.get().strip()
+        if not query:
+            return
+
+        self.results_tree.delete(*self.results_tree.get_children())
+        self._hits = {}
+
+        hits = self.index.search(query, limit=MAX_RESULTS)
+        for hit in hits:
+            item = self.results_tree.insert(
+                "", tk.END,
+                values=(os.path.basename(hit.file), hit.page + 1, " ".join(hit.snippet.split()))
+            )
+            self._hits[item] = hit
+
+        self._set_status(f"{len(hits)} matching page(s)")
+
+    def _open_result(self, event):
+        """Open the PDF of the double-clicked result with the system viewer."""
+        hit = self._hits.get(self.results_tree.focus())
+        if hit is None:
+            return
+
+        try:
+            if sys.platform == "win32":
+                os.startfile(hit.file)
+            elif sys.platform == "darwin":
+                subprocess.Popen(["open", hit.file])
+            else:
+                subprocess.Popen(["xdg-open", hit.file])
+        except Exception as e:
+            messagebox.showerror("Error", f"Could not open {hit.file}:\n{str(e)}")
+
+    def _set_status(self, message):
+        """Update the application status bar, if available."""
+        try:
+            self.parent.master.set_status(message)
+        except AttributeError:
+            pass
@@ -7,7 +7,7 @@ from tkinter import ttk
 from tkinter import filedialog, messagebox
 
 from core.security import PDFSecurity
-from pypdf import PdfReader
+from core.document_pool import get_reader
 
 
 class SecurityFrame(ttk.Frame):
@@ -226,10 +226,8 @@ class SecurityFrame(ttk.Frame):
             # Check if the file is encrypted if needed
             if check_encrypted:
                 try:
-                    with open(file_path, 'rb') as f:
-                        reader = PdfReader(f)
-                        if not reader.is_encrypted:
-                            messagebox.showwarning("Not Encrypted", "The selected PDF is not encrypted.")
+                    if not get_reader(file_path).is_encrypted:
+                        messagebox.showwarning("Not Encrypted", "The selected PDF is not encrypted.")
                 except Exception as e:
                     messagebox.showerror("Error", f"Error reading PDF: {str(e)}")
             
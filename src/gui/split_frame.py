@@ -9,7 +9,7 @@ import re
 from typing import List, Tuple, Union
 
 from core.pdf_splitter import PDFSplitter
-from pypdf import PdfReader
+from core.document_pool import page_count
 
 
 class SplitFrame(ttk.Frame):
@@ -128,10 +128,8 @@ class SplitFrame(ttk.Frame):
             return
         
         try:
-            with open(self.input_file, 'rb') as f:
-                reader = PdfReader(f)
-                self.total_pages = len(reader.pages)
-                self.page_info_var.set(f"Total pages: {self.total_pages}")
+            self.total_pages = page_count(self.input_file)
+            self.page_info_var.set(f"Total pages: {self.total_pages}")
         except Exception as e:
             self.page_info_var.set("Error reading PDF")
             self.total_pages = 0
@@ -2,29 +2,51 @@
 Frame for extracting text from PDF files.
 """
 import os
+import queue
+import threading
 import tkinter as tk
+from collections import deque
 from tkinter import ttk
 from tkinter import filedialog, messagebox, scrolledtext
 from typing import List, Dict
 
-from core.text_extractor import TextExtractor
-from pypdf import PdfReader
+from core.text_extractor import TextExtractor, TextCache, ENGINES
+from core.document_pool import page_count
+
+# Delay between transfers of extracted text from the worker thread
+POLL_INTERVAL_MS = 30
+
+# Maximum number of characters inserted into the text area per transfer
+INSERT_CHUNK_CHARS = 32 * 1024
+
+# Maximum number of extracted pages waiting to be displayed
+MAX_QUEUED_PAGES = 64
 
 
 class TextFrame(ttk.Frame):
     """Frame for the Extract Text functionality."""
 
-    def __init__(self, parent):
+    def __init__(self, parent, text_cache=None):
         """
         Initialize the Extract Text frame.
 
         Args:
             parent: The parent widget
+            text_cache: TextCache shared with the other frames (a new one
+                        is created if omitted)
         """
         super().__init__(parent, padding=10)
         self.parent = parent
         self.input_file = None
         self.total_pages = 0
+        self.text_cache = text_cache if text_cache is not None else TextCache()
+        
+        # State of the running extraction
+        self._extract_queue = None
+        self._extract_cancel = None
+        self._pending_text = deque()
+        self._pages_done = 0
+        self._pages_total = 0
         
         self._setup_ui()
     
@@ -71,12 +93,32 @@ class TextFrame(ttk.Frame):
         page_info_label = ttk.Label(pages_frame, textvariable=self.page_info_var)
         page_info_label.grid(row=2, column=1, padx=5, pady=5, sticky="w")
         
+        # Extraction engine
+        ttk.Label(pages_frame, text="Engine:").grid(row=3, column=0, padx=5, pady=5, sticky="w")
+        
+        self.engine_var = tk.StringVar(value="pdfplumber")
+        engine_combo = ttk.Combobox(
+            pages_frame, textvariable=self.engine_var, values=ENGINES, state="readonly", width=12
+        )
+        engine_combo.grid(row=3, column=1, padx=5, pady=5, sticky="w")
+        
+        ttk.Label(
+            pages_frame, 
+            text="pdfplumber: best layout, pypdf: fastest, auto: choose per document",
+            font=("", 8, "italic")
+        ).grid(row=4, column=1, padx=5, sticky="w")
+        
         # Action buttons
         button_frame = ttk.Frame(self)
         button_frame.grid(row=2, column=0, sticky="ew", padx=5, pady=5)
         
-        extract_button = ttk.Button(button_frame, text="Extract Text", command=self._extract_text)
-        extract_button.pack(side=tk.LEFT, padx=5)
+        self.extract_button = ttk.Button(button_frame, text="Extract Text", command=self._extract_text)
+        self.extract_button.pack(side=tk.LEFT, padx=5)
+        
+        self.cancel_button = ttk.Button(
+            button_frame, text="Cancel", command=self._cancel_extraction, state=tk.DISABLED
+        )
+        self.cancel_button.pack(side=tk.LEFT, padx=5)
         
         save_button = ttk.Button(button_frame, text="Save to File", command=self._save_text)
         save_button.pack(side=tk.LEFT, padx=5)
@@ -113,10 +155,8 @@ class TextFrame(ttk.Frame):
             return
         
         try:
-            with open(self.input_file, 'rb') as f:
-                reader = PdfReader(f)
-                self.total_pages = len(reader.pages)
-                self.page_info_var.set(f"Total pages: {self.total_pages}")
+            self.total_pages = page_count(self.input_file)
+            self.page_info_var.set(f"Total pages: {self.total_pages}")
         except Exception as e:
             self.page_info_var.set("Error reading PDF")
             self.total_pages = 0
@@ -185,7 +225,7 @@ class TextFrame(ttk.Frame):
         return page_indices
     
     def _extract_text(self):
-        """Extract text from the PDF based on the selected pages."""
+        """Start extracting text from the PDF based on the selected pages."""
         input_path = self.input_var.get()
         if not input_path:
             messagebox.showwarning("No Input", "Please select an input PDF file.")
@@ -197,48 +237,125 @@ class TextFrame(ttk.Frame):
         # Empty list means there was an error, None means all pages
         if page_indices == []:
             return
+        if page_indices is not None:
+            page_indices = sorted(set(page_indices))
         
-        # Get parent application to update status
-        try:
-            app = self.parent.master
-            app.set_status("Extracting text...")
-        except AttributeError:
-            # If that fails, just continue without status updates
-            pass
+        self._cancel_extraction()
+        self.text_area.delete(1.0, tk.END)
+        self._pending_text.clear()
+        self._pages_done = 0
+        self._pages_total = self.total_pages if page_indices is None else len(page_indices)
+        self._set_status("Extracting text...")
+        
+        # Extract in a background thread; pages are handed over through a
+        # bounded queue and inserted from the Tk mainloop in small chunks
+        self._extract_queue = queue.Queue(maxsize=MAX_QUEUED_PAGES)
+        self._extract_cancel = threading.Event()
+        worker = threading.Thread(
+            target=self._extraction_worker,
+            args=(input_path, page_indices, self.engine_var.get(),
+                  self._extract_queue, self._extract_cancel),
+            daemon=True,
+        )
+        worker.start()
+        
+        self.extract_button.configure(state=tk.DISABLED)
+        self.cancel_button.configure(state=tk.NORMAL)
+        self.after(POLL_INTERVAL_MS, self._poll_extraction, self._extract_queue)
+    
+    def _extraction_worker(self, input_path, page_indices, engine, results, cancel):
+        """Extract text page by page (runs outside the Tk thread)."""
+        def put(message):
+            # Wait for the UI to catch up, but give up once cancelled
+            while not cancel.is_set():
+                try:
+                    results.put(message, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
         
         try:
-            # Clear the text area
-            self.text_area.delete(1.0, tk.END)
-            
-            if page_indices is None:
-                # Extract all text
-                text = TextExtractor.extract_all_text(input_path)
-                self.text_area.insert(tk.END, text)
-            else:
-                # Extract text from specified pages
-                text_dict = TextExtractor.extract_text_from_pages(input_path, page_indices)
-                
-                # Display the extracted text
-                for page_num in sorted(text_dict.keys()):
+            pages = TextExtractor.iter_text(
+                input_path, page_indices, engine, cache=self.text_cache
+            )
+            for page_num, text in pages:
+                if page_indices is None:
+                    message = ("page", text + "\n\n")
+                else:
                     # Convert back to 1-indexed for display
-                    self.text_area.insert(tk.END, f"Page {page_num + 1}:\n")
-                    self.text_area.insert(tk.END, text_dict[page_num])
-                    self.text_area.insert(tk.END, "\n\n")
-            
-            try:
-                app.set_status("Text extracted successfully.")
-            except (AttributeError, NameError):
-                pass
+                    message = ("page", f"Page {page_num + 1}:\n{text}\n\n")
+                if not put(message):
+                    pages.close()
+                    return
+            put(("done",))
         except Exception as e:
-            try:
-                app.set_status("Error extracting text.")
-            except (AttributeError, NameError):
-                pass
-            messagebox.showerror("Error", f"An error occurred while extracting text:\n{str(e)}")
+            put(("error", str(e)))
+    
+    def _poll_extraction(self, results):
+        """Move extracted text into the text area, a bounded chunk at a time."""
+        if results is not self._extract_queue:
+            return  # Cancelled, or a newer extraction replaced this one
         
+        budget = INSERT_CHUNK_CHARS
+        while budget > 0:
+            if not self._pending_text:
+                # Messages are only taken once earlier text has been shown,
+                # so "done" arrives after the last page is in the text area
+                try:
+                    message = results.get_nowait()
+                except queue.Empty:
+                    break
+                
+                if message[0] == "page":
+                    self._pending_text.append(message[1])
+                    self._pages_done += 1
+                    continue
+                
+                self._finish_extraction()
+                if message[0] == "error":
+                    self._set_status("Error extracting text.")
+                    messagebox.showerror(
+                        "Error", f"An error occurred while extracting text:\n{message[1]}"
+                    )
+                    self._set_status("Ready")
+                else:
+                    self._set_status("Text extracted successfully.")
+                return
+            
+            piece = self._pending_text.popleft()
+            if len(piece) > budget:
+                # Leave the rest of a large page for the next transfer
+                self._pending_text.appendleft(piece[budget:])
+                piece = piece[:budget]
+            self.text_area.insert(tk.END, piece)
+            budget -= len(piece)
+        
+        self._set_status(f"Extracting text... ({self._pages_done}/{self._pages_total} pages)")
+        self.after(POLL_INTERVAL_MS, self._poll_extraction, results)
+    
+    def _cancel_extraction(self):
+        """Stop the running extraction, keeping the text shown so far."""
+        if self._extract_cancel is None:
+            return
+        
+        self._extract_cancel.set()
+        self._finish_extraction()
+        self._pending_text.clear()
+        self._set_status("Text extraction cancelled.")
+    
+    def _finish_extraction(self):
+        """Reset the extraction state and buttons."""
+        self._extract_queue = None
+        self._extract_cancel = None
+        self.extract_button.configure(state=tk.NORMAL)
+        self.cancel_button.configure(state=tk.DISABLED)
+    
+    def _set_status(self, message):
+        """Update the application status bar, if available."""
         try:
-            app.set_status("Ready")
-        except (AttributeError, NameError):
+            self.parent.master.set_status(message)
+        except AttributeError:
             pass
     
     def _save_text(self):
@@ -263,4 +380,5 @@ class TextFrame(ttk.Frame):
     
     def _clear_text(self):
         """Clear the text area."""
+        self._cancel_extraction()
         self.text_area.delete(1.0, tk.END) 
\ No newline at end of file
@@ -4,6 +4,7 @@ PDF Organizer & Merger - Main Application Entry Point
 
 A desktop application for managing and manipulating PDF files.
 """
+import multiprocessing
 import os
 import sys
 from pathlib import Path
@@ -15,4 +16,6 @@ from src.gui.app import main
 
 
 if __name__ == "__main__":
+    # Required for process pools in the frozen (PyInstaller) executable
+    multiprocessing.freeze_support()
     main() 
\ No newline at end of file
@@ -0,0 +1,43 @@
+"""
+Shared fixtures for the PDF Tool tests.
+"""
+import pytest
+
+from pypdf import PdfWriter
+from pypdf.generic import DecodedStreamObject, DictionaryObject, NameObject
+
+
+def _write_text_pdf(path, texts, page_size=(612, 792)):
+    """Write a PDF with one line of Helvetica text per page."""
+    writer = PdfWriter()
+    font = writer._add_object(DictionaryObject({
+        NameObject("/Type"): NameObject("/Font"),
+        NameObject("/Subtype"): NameObject("/Type1"),
+        NameObject("/BaseFont"): NameObject("/Helvetica"),
+    }))
+
+    for text in texts:
+        page = writer.add_blank_page(*page_size)
+        page[NameObject("/Resources")] = DictionaryObject({
+            NameObject("/Font"): DictionaryObject({NameObject("/F1"): font}),
+        })
+        content = DecodedStreamObject()
+        content.set_data(f"BT /F1 24 Tf 72 {page_size[1] - 72} Td ({text}) Tj ET".encode("latin-1"))
+        page[NameObject("/Contents")] = writer._add_object(content)
+
+    with open(str(path), 'wb') as output_file:
+        writer.write(output_file)
+    return path
+
+
+@pytest.fixture
+def make_pdf(tmp_path):
+    """
+    Factory fixture creating small text PDFs inside ``tmp_path``.
+
+    Usage: ``make_pdf("name.pdf", ["page one", "page two"])``
+    """
+    def factory(name="input.pdf", texts=("Page 1", "Page 2", "Page 3"), page_size=(612, 792)):
+        return _write_text_pdf(tmp_path / name, list(texts), page_size)
+
+    return factory
@@ -0,0 +1,78 @@
+"""
+Unit tests for the document pool module.
+"""
+import os
+
+import pytest
+
+from src.core.document_pool import DocumentPool
+
+
+class TestDocumentPool:
+    """Test cases for the DocumentPool class."""
+
+    def test_reader_is_reused(self, make_pdf):
+        """Test that an unchanged file is parsed once."""
+        input_path = make_pdf(texts=["One", "Two"])
+        pool = DocumentPool()
+
+        reader = pool.get_reader(input_path)
+
+        assert pool.get_reader(str(input_path)) is reader
+        assert pool.page_count(input_path) == 2
+        assert pool.stats()["hits"] == 2
+        assert pool.stats()["misses"] == 1
+
+    def test_changed_file_is_reparsed(self, make_pdf):
+        """Test that a new size or mtime invalidates the pooled reader."""
+        input_path = make_pdf(texts=["One", "Two"])
+        pool = DocumentPool()
+        reader = pool.get_reader(input_path)
+
+        make_pdf(texts=["One", "Two", "Three"])
+        os.utime(input_path, ns=(1, 1))
+
+        assert pool.get_reader(input_path) is not reader
+        assert pool.page_count(input_path) == 3
+
+    def test_lru_bounds(self, make_pdf):
+        """Test that the least recently used documents are dropped."""
+        paths = [make_pdf(f"doc{i}.pdf", [f"Doc {i}"]) for i in range(3)]
+        pool = DocumentPool(max_documents=2)
+
+        first = pool.get_reader(paths[0])
+        pool.get_reader(paths[1])
+        pool.get_reader(paths[0])
+        pool.get_reader(paths[2])
+
+        assert pool.stats()["documents"] == 2
+        assert pool.get_reader(paths[0]) is first
+        assert pool.stats()["misses"] == 3
+
+        pool.get_reader(paths[1])
+        assert pool.stats()["misses"] == 4
+
+    def test_byte_budget(self, make_pdf):
+        """Test that files over the byte budget are not pooled."""
+        input_path = make_pdf()
+        pool = DocumentPool(max_bytes=10)
+
+        reader = pool.get_reader(input_path)
+
+        assert len(reader.pages) == 3
+        assert pool.stats()["documents"] == 0
+        assert pool.get_reader(input_path) is not reader
+
+    def test_invalidate_and_errors(self, make_pdf, tmp_path):
+        """Test dropping documents and reporting unreadable files."""
+        input_path = make_pdf()
+        pool = DocumentPool()
+        reader = pool.get_reader(input_path)
+
+        pool.invalidate(input_path)
+        assert pool.get_reader(input_path) is not reader
+        pool.invalidate()
+        assert pool.stats()["documents"] == 0
+
+        with pytest.raises(FileNotFoundError):
+            pool.get_reader(tmp_path / "missing.pdf")
@@ -0,0 +1,122 @@
+"""
+Unit tests for the library index module.
+"""
+import os
+import sqlite3
+
+from src.core.library_index import LibraryIndex
+from src.core.text_extractor import TextExtractor
+
+
+class TestLibraryIndex:
+    """Test cases for the LibraryIndex class."""
+
+    def _make_library(self, make_pdf, tmp_path):
+        """Create a small library with a nested folder."""
+        (tmp_path / "reports").mkdir()
+        make_pdf("reports/annual.pdf", ["Annual revenue summary", "Quarterly growth figures"])
+        make_pdf("notes.pdf", ["Meeting notes about revenue"])
+        return tmp_path
+
+    def test_index_and_search(self, make_pdf, tmp_path):
+        """Test that indexed pages can be found by their words."""
+        library = self._make_library(make_pdf, tmp_path)
+        index = LibraryIndex(tmp_path / "index.sqlite3")
+
+        summary = index.update(library)
+
+        assert summary["indexed"] == 2
+        assert summary["pages"] == 3
+        hits = index.search("quarterly growth")
+        assert len(hits) == 1
+        assert os.path.basename(hits[0].file) == "annual.pdf"
+        assert hits[0].page == 1
+        assert "[Quarterly]" in hits[0].snippet
+        assert {os.path.basename(hit.file) for hit in index.search("revenue")} == {
+            "annual.pdf", "notes.pdf"
+        }
+
+    def test_unchanged_files_not_reindexed(self, make_pdf, tmp_path, monkeypatch):
+        """Test that only new and changed files are extracted again."""
+        library = self._make_library(make_pdf, tmp_path)
+        index = LibraryIndex(tmp_path / "index.sqlite3")
+        index.update(library)
+
+        changed = make_pdf("notes.pdf", ["Rewritten minutes"])
+        os.utime(changed, ns=(1, 1))
+        extracted = []
+        original = TextExtractor.iter_text
+
+        def tracking(path, *args, **kwargs):
+            extracted.append(os.path.basename(path))
+            return original(path, *args, **kwargs)
+
+        monkeypatch.setattr(TextExtractor, "iter_text", staticmethod(tracking))
+        summary = index.update(library)
+
+        assert extracted == ["notes.pdf"]
+        assert summary["unchanged"] == 1
+        assert index.search("meeting") == []
+        assert len(index.search("minutes")) == 1
+
+    def test_removed_files_dropped(self, make_pdf, tmp_path):
+        """Test that deleted files disappear from the index."""
+        library = self._make_library(make_pdf, tmp_path)
+        index = LibraryIndex(tmp_path / "index.sqlite3")
+        index.update(library)
+
+        os.remove(library / "notes.pdf")
+        summary = index.update(library)
+
+        assert summary["removed"] == 1
+        assert index.stats() == {"files": 1, "pages": 2}
+        assert all(os.path.basename(hit.file) == "annual.pdf" for hit in index.search("revenue"))
+
+    def test_pages_deleted_by_rowid(self, make_pdf, tmp_path):
+        """Test that new files skip the delete and changed files delete by rowid range."""
+        library = self._make_library(make_pdf, tmp_path)
+        index = LibraryIndex(tmp_path / "index.sqlite3")
+        statements = []
+        index._connect().set_trace_callback(statements.append)
+
+        index.update(library)
+        assert not [sql for sql in statements if sql.startswith("DELETE")]
+
+        changed = make_pdf("notes.pdf", ["Rewritten minutes"])
+        os.utime(changed, ns=(1, 1))
+        index.update(library)
+
+        deletes = [sql for sql in statements if sql.startswith("DELETE FROM pages")]
+        assert len(deletes) == 1
+        assert "rowid BETWEEN" in deletes[0]
+        assert index.search("meeting") == []
+        assert len(index.search("minutes")) == 1
+        assert len(index.search("quarterly")) == 1
+
+    def test_old_layout_rebuilt(self, make_pdf, tmp_path):
+        """Test that an index file with an older table layout is rebuilt."""
+        library = self._make_library(make_pdf, tmp_path)
+        conn = sqlite3.connect(str(tmp_path / "index.sqlite3"))
+        conn.execute("CREATE TABLE files (path TEXT PRIMARY KEY, size INTEGER NOT NULL)")
+        conn.close()
+        index = LibraryIndex(tmp_path / "index.sqlite3")
+
+        assert index.update(library)["indexed"] == 2
+        assert index.stats() == {"files": 2, "pages": 3}
+
+    def test_query_syntax_is_literal(self, make_pdf, tmp_path):
+        """Test that plain queries with FTS operators do not fail."""
+        library = self._make_library(make_pdf, tmp_path)
+        index = LibraryIndex(tmp_path / "index.sqlite3")
+        index.update(library)
+
+        assert index.search('revenue "AND') == []
+        assert index.search("") == []
+        assert len(index.search("revenu*", raw=True)) == 2
+
+    def test_stats_do_not_create_index(self, tmp_path):
+        """Test that an unused index leaves no file behind."""
+        index = LibraryIndex(tmp_path / "cache" / "index.sqlite3")
+
+        assert index.stats() == {"files": 0, "pages": 0}
+        assert not (tmp_path / "cache").exists()
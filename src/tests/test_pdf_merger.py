@@ -1,10 +1,13 @@
 """
 Unit tests for the PDF merger module.
 """
+import multiprocessing
 import os
 import pytest
+import time
 from pathlib import Path
 
+from src.core import pdf_merger
 from src.core.pdf_merger import PDFMerger
 from pypdf import PdfReader
 
@@ -20,59 +23,48 @@ class TestPDFMerger:
         assert result is False
         assert not output_path.exists()
     
-    def test_merge_pdfs(self, tmp_path, monkeypatch):
+    def test_merge_pdfs(self, make_pdf, tmp_path):
         """Test merging PDFs successfully."""
-        # Mock the PdfMerger class
-        class MockPdfMerger:
-            def __init__(self):
-                self.files = []
-            
-            def append(self, file_path):
-                self.files.append(file_path)
-            
-            def write(self, output_file):
-                pass
-            
-            def close(self):
-                pass
-        
-        # Mock the open function
-        class MockFile:
-            def __init__(self, path, mode):
-                self.path = path
-                self.mode = mode
-            
-            def __enter__(self):
-                return self
-            
-            def __exit__(self, exc_type, exc_val, exc_tb):
-                pass
-        
-        # Create test files
-        input_files = [tmp_path / f"input{i}.pdf" for i in range(3)]
-        for file_path in input_files:
-            file_path.touch()
-        
+        input_files = [
+            make_pdf(f"input{i}.pdf", [f"File {i} page 1", f"File {i} page 2"]) for i in range(3)
+        ]
         output_path = tmp_path / "output.pdf"
         
-        # Apply mocks
-        mock_merger = MockPdfMerger()
+        # Test the merge function
+        result = PDFMerger.merge_pdfs(input_files, output_path)
         
-        def mock_pdf_merger():
-            return mock_merger
+        assert result is True
+        reader = PdfReader(str(output_path))
+        assert len(reader.pages) == 6
+        assert [page.extract_text() for page in reader.pages[::2]] == [
+            "File 0 page 1", "File 1 page 1", "File 2 page 1"
+        ]
+    
+    def test_merge_pdfs_streaming_releases_inputs(self, make_pdf, tmp_path, monkeypatch):
+        """Test that every input reader is released once it has been copied."""
+        import gc
+        import weakref
+        from src.core import pdf_merger
         
-        def mock_open(path, mode):
-            return MockFile(path, mode)
+        readers = []
+        original = pdf_merger.PdfReader
         
-        monkeypatch.setattr("pypdf.PdfMerger", mock_pdf_merger)
-        monkeypatch.setattr("builtins.open", mock_open)
+        def tracking_reader(*args, **kwargs):
+            reader = original(*args, **kwargs)
+            readers.append(weakref.ref(reader))
+            return reader
         
-        # Test the merge function
-        result = PDFMerger.merge_pdfs(input_files, output_path)
+        monkeypatch.setattr(pdf_merger, "PdfReader", tracking_reader)
+        input_files = [make_pdf(f"input{i}.pdf", [f"File {i}"]) for i in range(20)]
+        output_path = tmp_path / "output.pdf"
         
-        assert result is True
-        assert len(mock_merger.files) == 3
-        assert mock_merger.files == [str(file) for file in input_files]
+        stats = PDFMerger.merge_pdfs_streaming(input_files, output_path)
+        gc.collect()
+        
+        assert stats["inputs"] == 20
+        assert stats["pages"] == 20
+        assert all(reader() is None for reader in readers)
+        assert PdfReader(str(output_path)).pages[19].extract_text() == "File 19"
     
     def test_merge_pdfs_exception(self, tmp_path, monkeypatch):
         """Test merging PDFs with an exception."""
@@ -83,13 +75,394 @@ class TestPDFMerger:
         
         output_path = tmp_path / "output.pdf"
         
-        # Mock the PdfMerger to raise an exception
-        def mock_pdf_merger():
+        # Mock the PdfWriter to raise an exception
+        def mock_pdf_writer():
             raise Exception("Test exception")
         
-        monkeypatch.setattr("pypdf.PdfMerger", mock_pdf_merger)
+        monkeypatch.setattr("src.core.pdf_merger.PdfWriter", mock_pdf_writer)
         
         # Test the merge function
         result = PDFMerger.merge_pdfs(input_files, output_path)
         
-        assert result is False 
\ No newline at end of file
+        assert result is False 
+
+class TestParallelMerge:
+    """Test cases for merging batches across processes."""
+
+    def _add_outline(self, path, titles):
+        """Give a PDF one top-level outline item per page."""
+        from pypdf import PdfWriter
+
+        writer = PdfWriter(clone_from=PdfReader(str(path)))
+        for page_num, title in enumerate(titles):
+            item = writer.add_outline_item(title, page_num)
+            writer.add_outline_item(f"{title} detail", page_num, parent=item)
+        with open(str(path), 'wb') as output_file:
+            writer.write(output_file)
+        return path
+
+    def test_merge_pdfs_parallel_keeps_order(self, make_pdf, tmp_path):
+        """Test that batches are combined in input order."""
+        input_files = [make_pdf(f"input{i}.pdf", [f"File {i}", f"File {i} end"]) for i in range(10)]
+        output_path = tmp_path / "output.pdf"
+        work_dir = tmp_path / "work"
+        work_dir.mkdir()
+
+        stats = PDFMerger.merge_pdfs_parallel(
+            input_files, output_path, workers=2, batch_size=3, temp_dir=work_dir
+        )
+
+        reader = PdfReader(str(output_path), strict=True)
+        assert [page.extract_text() for page in reader.pages[::2]] == [f"File {i}" for i in range(10)]
+        assert stats["inputs"] == 10
+        assert stats["pages"] == 20
+        assert stats["batches"] == 4
+        assert stats["duplicates_removed"] == 6
+        assert list(work_dir.iterdir()) == []
+
+    def test_merge_pdfs_parallel_chains_outlines(self, make_pdf, tmp_path):
+        """Test that the outlines of all batches form one outline."""
+        input_files = [
+            self._add_outline(make_pdf(f"input{i}.pdf", [f"File {i}"]), [f"Chapter {i}"])
+            for i in range(5)
+        ]
+        input_files.insert(2, make_pdf("plain.pdf", ["No outline"]))
+        output_path = tmp_path / "output.pdf"
+
+        PDFMerger.merge_pdfs_parallel(input_files, output_path, workers=2, batch_size=2)
+
+        reader = PdfReader(str(output_path), strict=True)
+        top_level = [item for item in reader.outline if not isinstance(item, list)]
+        assert [item.title for item in top_level] == [f"Chapter {i}" for i in range(5)]
+        assert [reader.get_destination_page_number(item) for item in top_level] == [0, 1, 3, 4, 5]
+        assert reader.outline[1][0].title == "Chapter 0 detail"
+
+    def test_merge_pdfs_parallel_empty_outlines(self, make_pdf, tmp_path):
+        """Test that empty outline roots do not leave objects without a body."""
+        from pypdf import PdfWriter
+        from pypdf.generic import DictionaryObject, NameObject, NumberObject
+
+        input_files = []
+        for i in range(6):
+            path = make_pdf(f"input{i}.pdf", [f"File {i}"])
+            writer = PdfWriter(clone_from=PdfReader(str(path)))
+            writer._root_object[NameObject("/Outlines")] = writer._add_object(DictionaryObject({
+                NameObject("/Type"): NameObject("/Outlines"),
+                NameObject("/Count"): NumberObject(0),
+            }))
+            with open(str(path), 'wb') as output_file:
+                writer.write(output_file)
+            input_files.append(path)
+        output_path = tmp_path / "output.pdf"
+
+        stats = PDFMerger.merge_pdfs_parallel(input_files, output_path, workers=2, batch_size=2)
+
+        assert stats["batches"] == 3
+        assert b" 0 obj\n\nendobj" not in output_path.read_bytes()
+        reader = PdfReader(str(output_path), strict=True)
+        assert [page.extract_text() for page in reader.pages] == [f"File {i}" for i in range(6)]
+        assert reader.outline == []
+
+    def test_merge_pdfs_parallel_small_input(self, make_pdf, tmp_path):
+        """Test that few inputs are merged directly."""
+        input_files = [make_pdf(f"input{i}.pdf", [f"File {i}"]) for i in range(2)]
+
+        stats = PDFMerger.merge_pdfs_parallel(input_files, tmp_path / "output.pdf", workers=2)
+
+        assert stats["batches"] == 1
+        assert stats["combine_seconds"] == 0
+
+    def _add_form(self, path):
+        """Give a PDF an (empty) interactive form."""
+        from pypdf import PdfWriter
+        from pypdf.generic import ArrayObject, DictionaryObject, NameObject
+
+        writer = PdfWriter(clone_from=PdfReader(str(path)))
+        writer._root_object[NameObject("/AcroForm")] = DictionaryObject({
+            NameObject("/Fields"): ArrayObject(),
+        })
+        with open(str(path), 'wb') as output_file:
+            writer.write(output_file)
+        return path
+
+    def test_merge_pdfs_parallel_form_falls_back(self, make_pdf, tmp_path):
+        """Test that inputs with catalog entries the combine cannot join are merged sequentially."""
+        input_files = [make_pdf(f"input{i}.pdf", [f"File {i}"]) for i in range(4)]
+        self._add_form(input_files[3])
+        output_path = tmp_path / "output.pdf"
+
+        stats = PDFMerger.merge_pdfs_parallel(input_files, output_path, workers=2, batch_size=2)
+
+        reader = PdfReader(str(output_path))
+        assert stats["batches"] == 1
+        assert [page.extract_text() for page in reader.pages] == [f"File {i}" for i in range(4)]
+        assert "/AcroForm" in reader.trailer["/Root"]
+
+    def test_merge_pdfs_parallel_named_destinations_checked_first(self, make_pdf, tmp_path, monkeypatch):
+        """Test that named destinations send the merge to the sequential path before any batch runs."""
+        from pypdf import PdfWriter
+
+        input_files = [make_pdf(f"input{i}.pdf", [f"File {i}"]) for i in range(4)]
+        writer = PdfWriter(clone_from=PdfReader(str(input_files[1])))
+        writer.add_named_destination("Intro", 0)
+        with open(str(input_files[1]), 'wb') as output_file:
+            writer.write(output_file)
+
+        def no_pool(*args, **kwargs):
+            raise AssertionError("no batch should be started")
+
+        monkeypatch.setattr(pdf_merger, "ProcessPoolExecutor", no_pool)
+        output_path = tmp_path / "output.pdf"
+
+        stats = PDFMerger.merge_pdfs_parallel(input_files, output_path, workers=2, batch_size=2)
+
+        reader = PdfReader(str(output_path))
+        assert stats["batches"] == 1
+        assert [page.extract_text() for page in reader.pages] == [f"File {i}" for i in range(4)]
+        assert "Intro" in reader.named_destinations
+
+    @pytest.mark.skipif(
+        multiprocessing.get_start_method() != "fork",
+        reason="workers must inherit the patched merge",
+    )
+    def test_merge_pdfs_parallel_stops_at_unsupported_part(self, make_pdf, tmp_path, monkeypatch):
+        """Test that a batch that cannot be combined cancels the batches not yet started."""
+        input_files = [make_pdf(f"input{i}.pdf", [f"File {i}"]) for i in range(20)]
+        self._add_form(input_files[0])
+        log_path = tmp_path / "batches.log"
+        original = PDFMerger._merge_into_writer
+
+        def logged_merge(input_paths, *args, **kwargs):
+            with open(log_path, 'a') as log:
+                log.write(f"{os.path.basename(input_paths[0])}\n")
+            if os.path.basename(input_paths[0]) != "input0.pdf":
+                time.sleep(0.2)
+            return original(input_paths, *args, **kwargs)
+
+        monkeypatch.setattr(PDFMerger, "_needs_sequential_merge", staticmethod(lambda input_paths: False))
+        monkeypatch.setattr(PDFMerger, "_merge_into_writer", staticmethod(logged_merge))
+        output_path = tmp_path / "output.pdf"
+
+        stats = PDFMerger.merge_pdfs_parallel(input_files, output_path, workers=2, batch_size=1)
+
+        reader = PdfReader(str(output_path))
+        merged_batches = log_path.read_text().split()
+        assert "input0.pdf" in merged_batches
+        assert len(merged_batches) < 10
+        assert stats["batches"] == 1
+        assert [page.extract_text() for page in reader.pages] == [f"File {i}" for i in range(20)]
+        assert "/AcroForm" in reader.trailer["/Root"]
+
+    def test_merge_pdfs_parallel_failure(self, make_pdf, tmp_path):
+        """Test that a broken input fails the merge and cleans up."""
+        input_files = [make_pdf(f"input{i}.pdf", [f"File {i}"]) for i in range(5)]
+        input_files[3].write_bytes(b"not a pdf")
+        work_dir = tmp_path / "work"
+        work_dir.mkdir()
+
+        stats = PDFMerger.merge_pdfs_parallel(
+            input_files, tmp_path / "output.pdf", workers=2, batch_size=2, temp_dir=work_dir
+        )
+
+        assert stats is None
+        assert list(work_dir.iterdir()) == []
+
+
+class TestResourceDeduplication:
+    """Test cases for sharing identical resources while merging."""
+
+    def _add_logo(self, path):
+        """Give every page of a PDF its own copy of the same form XObject."""
+        from pypdf import PdfWriter
+        from pypdf.generic import ArrayObject, DecodedStreamObject, DictionaryObject, FloatObject, NameObject
+
+        reader = PdfReader(str(path))
+        writer = PdfWriter(clone_from=reader)
+        for page in writer.pages:
+            logo = DecodedStreamObject()
+            logo.set_data(b"0 0 m 100 100 l S " * 200)
+            logo.update({
+                NameObject("/Type"): NameObject("/XObject"),
+                NameObject("/Subtype"): NameObject("/Form"),
+                NameObject("/BBox"): ArrayObject([FloatObject(0)] * 2 + [FloatObject(100)] * 2),
+            })
+            page[NameObject("/Resources")][NameObject("/XObject")] = DictionaryObject({
+                NameObject("/Logo"): writer._add_object(logo),
+            })
+        with open(str(path), 'wb') as output_file:
+            writer.write(output_file)
+        return path
+
+    def test_template_resources_are_shared(self, make_pdf, tmp_path):
+        """Test that identical fonts and XObjects are written once."""
+        input_files = [self._add_logo(make_pdf(f"input{i}.pdf", [f"Statement {i}"])) for i in range(5)]
+        shared_path = tmp_path / "shared.pdf"
+        copied_path = tmp_path / "copied.pdf"
+
+        stats = PDFMerger.merge_pdfs_streaming(input_files, shared_path)
+        PDFMerger.merge_pdfs_streaming(input_files, copied_path, deduplicate=False)
+
+        # Four duplicate fonts and four duplicate logos
+        assert stats["duplicates_removed"] == 8
+        assert stats["bytes_saved"] > 4 * 3600
+        assert shared_path.stat().st_size < copied_path.stat().st_size - stats["bytes_saved"] / 2
+
+        reader = PdfReader(str(shared_path))
+        assert [page.extract_text() for page in reader.pages] == [f"Statement {i}" for i in range(5)]
+        logos = {page["/Resources"]["/XObject"].raw_get("/Logo").idnum for page in reader.pages}
+        fonts = {page["/Resources"]["/Font"].raw_get("/F1").idnum for page in reader.pages}
+        assert len(logos) == 1
+        assert len(fonts) == 1
+
+    def test_different_resources_are_kept(self, make_pdf, tmp_path):
+        """Test that page contents and distinct resources are not merged."""
+        # Distinct files (page sizes differ) whose content streams are identical
+        input_files = [
+            make_pdf(f"input{i}.pdf", ["Same text"], page_size=(612, 792 + i)) for i in range(3)
+        ]
+        output_path = tmp_path / "output.pdf"
+
+        stats = PDFMerger.merge_pdfs_streaming(input_files, output_path)
+
+        reader = PdfReader(str(output_path))
+        assert stats["repeated_inputs"] == 0
+        contents = {page.raw_get("/Contents").idnum for page in reader.pages}
+        assert len(contents) == 3
+        assert stats["duplicates_removed"] == 2
+
+    def test_contents_arrays_are_kept(self, make_pdf, tmp_path):
+        """Test that streams listed in an indirect /Contents array are not merged."""
+        from pypdf import PdfWriter
+        from pypdf.generic import ArrayObject, DecodedStreamObject, NameObject
+
+        input_files = []
+        for i in range(2):
+            path = make_pdf(f"input{i}.pdf", ["Same text"], page_size=(612, 792 + i))
+            writer = PdfWriter(clone_from=PdfReader(str(path)))
+            page = writer.pages[0]
+            trailer = DecodedStreamObject()
+            trailer.set_data(b"BT /F1 12 Tf 72 72 Td (Footer) Tj ET")
+            page[NameObject("/Contents")] = writer._add_object(ArrayObject([
+                page.raw_get("/Contents"), writer._add_object(trailer)
+            ]))
+            with open(str(path), 'wb') as output_file:
+                writer.write(output_file)
+            input_files.append(path)
+        output_path = tmp_path / "output.pdf"
+
+        PDFMerger.merge_pdfs_streaming(input_files, output_path)
+
+        reader = PdfReader(str(output_path))
+        streams = [
+            ref.idnum for page in reader.pages for ref in page.raw_get("/Contents").get_object()
+        ]
+        assert len(set(streams)) == 4
+        assert all(page.extract_text().startswith("Same text") for page in reader.pages)
+
+    def test_duplicates_dropped_during_merge(self, make_pdf, tmp_path, monkeypatch):
+        """Test that duplicates are emptied as each input is added."""
+        from pypdf.generic import StreamObject
+
+        input_files = [self._add_logo(make_pdf(f"input{i}.pdf", [f"Statement {i}"])) for i in range(5)]
+        logos_alive = []
+        original = PDFMerger.deduplicate_resources
+
+        def tracking(writer, *args):
+            summary = original(writer, *args)
+            logos_alive.append(sum(
+                isinstance(obj, StreamObject) and obj.get("/Subtype") == "/Form"
+                for obj in writer._objects
+            ))
+            return summary
+
+        monkeypatch.setattr(PDFMerger, "deduplicate_resources", staticmethod(tracking))
+        PDFMerger.merge_pdfs_streaming(input_files, tmp_path / "output.pdf")
+
+        assert logos_alive == [1] * 5
+
+
+class TestRepeatedInputs:
+    """Test cases for merging lists that repeat the same document."""
+
+    def _contents(self, reader):
+        """Return the object number of each page's content stream."""
+        return [page.raw_get("/Contents").idnum for page in reader.pages]
+
+    def test_repeated_path_shares_pages(self, make_pdf, tmp_path):
+        """Test that a repeated input is parsed once and its pages are shared."""
+        cover = make_pdf("cover.pdf", ["Cover"])
+        body = make_pdf("body.pdf", ["Body 1", "Body 2"])
+        shared_path = tmp_path / "shared.pdf"
+        single_path = tmp_path / "single.pdf"
+
+        stats = PDFMerger.merge_pdfs_streaming([cover, body, cover, body, cover], shared_path)
+        PDFMerger.merge_pdfs_streaming([cover, body], single_path)
+
+        assert stats["repeated_inputs"] == 3
+        reader = PdfReader(str(shared_path))
+        assert [page.extract_text() for page in reader.pages] == [
+            "Cover", "Body 1", "Body 2", "Cover", "Body 1", "Body 2", "Cover"
+        ]
+        contents = self._contents(reader)
+        assert contents[3:6] == contents[:3]
+        assert contents[6] == contents[0]
+        assert shared_path.stat().st_size < 2 * single_path.stat().st_size
+
+    def test_identical_content_under_other_path(self, make_pdf, tmp_path):
+        """Test that a copy of an input under another name is detected."""
+        original = make_pdf("original.pdf", ["Terms"])
+        copy = tmp_path / "copy.pdf"
+        copy.write_bytes(original.read_bytes())
+        output_path = tmp_path / "output.pdf"
+
+        stats = PDFMerger.merge_pdfs_streaming([original, copy], output_path)
+
+        assert stats["repeated_inputs"] == 1
+        reader = PdfReader(str(output_path))
+        assert len(set(self._contents(reader))) == 1
+        assert [page.extract_text() for page in reader.pages] == ["Terms", "Terms"]
+
+    def test_annotated_input_is_copied(self, make_pdf, tmp_path):
+        """Test that pages with annotations are copied instead of shared."""
+        from pypdf import PdfWriter
+        from pypdf.annotations import Link
+
+        plain = make_pdf("plain.pdf", ["Linked"])
+        writer = PdfWriter(clone_from=PdfReader(str(plain)))
+        writer.add_annotation(0, Link(rect=(50, 50, 150, 80), url="https://example.com"))
+        annotated = tmp_path / "annotated.pdf"
+        with open(str(annotated), 'wb') as output_file:
+            writer.write(output_file)
+        output_path = tmp_path / "output.pdf"
+
+        stats = PDFMerger.merge_pdfs_streaming([annotated, annotated], output_path)
+
+        assert stats["repeated_inputs"] == 0
+        reader = PdfReader(str(output_path))
+        annotations = [page["/Annots"][0].idnum for page in reader.pages]
+        assert len(set(annotations)) == 2
+
+    def test_only_equal_sizes_are_hashed(self, make_pdf, tmp_path, monkeypatch):
+        """Test that inputs are hashed only when another input has their size."""
+        from src.core import pdf_merger
+
+        hashed = []
+        original = pdf_merger.file_fingerprint
+
+        def tracking(path):
+            hashed.append(os.path.basename(path))
+            return original(path)
+
+        monkeypatch.setattr(pdf_merger, "file_fingerprint", tracking)
+        short = make_pdf("short.pdf", ["Short"])
+        longer = make_pdf("longer.pdf", ["A somewhat longer page"])
+        copy = tmp_path / "copy.pdf"
+        copy.write_bytes(longer.read_bytes())
+
+        stats = PDFMerger.merge_pdfs_streaming([short, longer, short], tmp_path / "first.pdf")
+        assert stats["repeated_inputs"] == 1
+        assert hashed == []
+
+        stats = PDFMerger.merge_pdfs_streaming([short, longer, copy], tmp_path / "second.pdf")
+        assert stats["repeated_inputs"] == 1
+        assert sorted(hashed) == ["copy.pdf", "longer.pdf"]
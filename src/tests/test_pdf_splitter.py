@@ -5,6 +5,7 @@ import os
 import pytest
 from pathlib import Path
 
+from src.core.document_pool import DocumentPool
 from src.core.pdf_splitter import PDFSplitter
 from pypdf import PdfReader, PdfWriter
 
@@ -76,8 +77,10 @@ class TestPDFSplitter:
         def mock_open(path, mode):
             return MockFile(path, mode)
         
-        monkeypatch.setattr("pypdf.PdfReader", mock_pdf_reader)
-        monkeypatch.setattr("pypdf.PdfWriter", mock_pdf_writer)
+        # Readers come from the shared document pool
+        monkeypatch.setattr("src.core.document_pool.default_pool", DocumentPool())
+        monkeypatch.setattr("src.core.document_pool.PdfReader", mock_pdf_reader)
+        monkeypatch.setattr("src.core.pdf_splitter.PdfWriter", mock_pdf_writer)
         monkeypatch.setattr("builtins.open", mock_open)
         
         # Test the split function with a mix of single pages and ranges
@@ -0,0 +1,141 @@
+"""
+Unit tests for the table extractor module.
+"""
+import csv
+import io
+import json
+import multiprocessing
+import os
+
+import pdfplumber
+import pytest
+from pypdf import PdfWriter
+from pypdf.generic import DecodedStreamObject, DictionaryObject, NameObject
+
+from src.core.table_extractor import TableExtractor
+
+
+def _write_table_pdf(path, pages):
+    """Write a PDF with one ruled table per page; an empty list means no table."""
+    writer = PdfWriter()
+    font = writer._add_object(DictionaryObject({
+        NameObject("/Type"): NameObject("/Font"),
+        NameObject("/Subtype"): NameObject("/Type1"),
+        NameObject("/BaseFont"): NameObject("/Helvetica"),
+    }))
+
+    for rows in pages:
+        page = writer.add_blank_page(612, 792)
+        page[NameObject("/Resources")] = DictionaryObject({
+            NameObject("/Font"): DictionaryObject({NameObject("/F1"): font}),
+        })
+        ops = []
+        for r, row in enumerate(rows):
+            for c, cell in enumerate(row):
+                x, y = 72 + c * 100, 700 - r * 30
+                ops.append(f"{x} {y} 100 30 re S")
+                ops.append(f"BT /F1 12 Tf {x + 5} {y + 10} Td ({cell}) Tj ET")
+        content = DecodedStreamObject()
+        content.set_data("\n".join(ops).encode("latin-1"))
+        page[NameObject("/Contents")] = writer._add_object(content)
+
+    with open(str(path), 'wb') as output_file:
+        writer.write(output_file)
+    return path
+
+
+STATEMENT = [
+    [["Date", "Amount"], ["Jan", "10"]],
+    [],
+    [["Date", "Amount"], ["Feb", "20"], ["Mar", "30"]],
+]
+
+
+class TestTableExtractor:
+    """Test cases for the TableExtractor class."""
+
+    def test_iter_tables(self, tmp_path):
+        """Test extracting the tables of every page."""
+        input_path = _write_table_pdf(tmp_path / "statement.pdf", STATEMENT)
+
+        pages = list(TableExtractor.iter_tables(input_path))
+
+        assert pages == [
+            (0, [[["Date", "Amount"], ["Jan", "10"]]]),
+            (1, []),
+            (2, [[["Date", "Amount"], ["Feb", "20"], ["Mar", "30"]]]),
+        ]
+
+    def test_parallel_matches_sequential(self, tmp_path):
+        """Test that the process pool keeps page order and results."""
+        input_path = _write_table_pdf(tmp_path / "statement.pdf", STATEMENT * 3)
+
+        sequential = list(TableExtractor.iter_tables(input_path))
+        parallel = list(TableExtractor.iter_tables(input_path, workers=2, chunk_size=1))
+
+        assert parallel == sequential
+
+    @pytest.mark.skipif(
+        multiprocessing.get_start_method() != "fork",
+        reason="workers must inherit the patched pdfplumber.open",
+    )
+    def test_parallel_opens_document_once_per_worker(self, tmp_path, monkeypatch):
+        """Test that every worker reads all of its chunks from one open document."""
+        input_path = _write_table_pdf(tmp_path / "statement.pdf", STATEMENT * 4)
+        log_path = tmp_path / "opens.log"
+        original = pdfplumber.open
+
+        def counting_open(*args, **kwargs):
+            with open(log_path, 'a') as log:
+                log.write(f"{os.getpid()}\n")
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(pdfplumber, "open", counting_open)
+
+        pages = list(TableExtractor.iter_tables(input_path, workers=2, chunk_size=1))
+
+        opens = log_path.read_text().split()
+        assert len(pages) == 12
+        assert os.getpid() not in map(int, opens)
+        assert all(opens.count(pid) == 1 for pid in opens)
+        assert len(set(opens)) <= 2
+
+    def test_write_csv(self, tmp_path):
+        """Test streaming tables to CSV with a per-page summary."""
+        input_path = _write_table_pdf(tmp_path / "statement.pdf", STATEMENT)
+        output_path = tmp_path / "tables.csv"
+
+        summary = TableExtractor.write_tables(input_path, output_path, workers=2, chunk_size=1)
+
+        with open(output_path, newline='', encoding='utf-8') as f:
+            rows = list(csv.reader(f))
+        assert rows[0] == ["0", "0", "Date", "Amount"]
+        assert rows[-1] == ["2", "0", "Mar", "30"]
+        assert summary == {
+            0: {"tables": 1, "rows": 2},
+            1: {"tables": 0, "rows": 0},
+            2: {"tables": 1, "rows": 3},
+        }
+
+    def test_write_ndjson(self, tmp_path):
+        """Test streaming tables to NDJSON with custom table settings."""
+        input_path = _write_table_pdf(tmp_path / "statement.pdf", STATEMENT)
+        stream = io.StringIO()
+
+        summary = TableExtractor.write_tables(
+            input_path, stream, page_numbers=[2], fmt="ndjson", workers=1,
+            table_settings={"snap_tolerance": 2},
+        )
+
+        records = [json.loads(line) for line in stream.getvalue().splitlines()]
+        assert records == [{"page": 2, "table": 0, "rows": [["Date", "Amount"], ["Feb", "20"], ["Mar", "30"]]}]
+        assert summary == {2: {"tables": 1, "rows": 3}}
+
+    def test_write_tables_errors(self, tmp_path):
+        """Test that bad formats and settings fail cleanly."""
+        input_path = _write_table_pdf(tmp_path / "statement.pdf", STATEMENT)
+
+        assert TableExtractor.write_tables(input_path, io.StringIO(), fmt="xlsx") == {}
+        assert TableExtractor.write_tables(
+            input_path, io.StringIO(), workers=1, table_settings={"no_such_setting": 1}
+        ) == {}
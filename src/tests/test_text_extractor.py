@@ -0,0 +1,532 @@
+"""
+Unit tests for the text extractor module.
+"""
+import io
+import json
+import multiprocessing
+import os
+import time
+
+import pdfplumber
+import pypdf
+import pytest
+
+from src.core.text_extractor import SearchHit, TextCache, TextExtractor
+from src.core.word_table import WordTable
+
+fork_only = pytest.mark.skipif(
+    multiprocessing.get_start_method() != "fork",
+    reason="workers must inherit the patched pdfplumber.open",
+)
+
+
+@pytest.fixture
+def pdfplumber_opens(tmp_path, monkeypatch):
+    """Record the process id of every pdfplumber.open call, workers included."""
+    log_path = tmp_path / "opens.log"
+    original = pdfplumber.open
+
+    def counting_open(*args, **kwargs):
+        with open(log_path, 'a') as log:
+            log.write(f"{os.getpid()}\n")
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(pdfplumber, "open", counting_open)
+    return lambda: [int(pid) for pid in log_path.read_text().split()] if log_path.exists() else []
+
+
+class TestTextExtractor:
+    """Test cases for the TextExtractor class."""
+
+    def test_extract_text_from_pages(self, make_pdf):
+        """Test extracting text from selected pages."""
+        input_path = make_pdf(texts=["Alpha", "Beta", "Gamma"])
+
+        result = TextExtractor.extract_text_from_pages(input_path, [2, 0, 9])
+
+        assert result == {2: "Gamma", 0: "Alpha"}
+
+    def test_extract_all_text(self, make_pdf):
+        """Test extracting the text of the whole document."""
+        input_path = make_pdf(texts=["Alpha", "Beta"])
+
+        assert TextExtractor.extract_all_text(input_path) == "Alpha\n\nBeta\n\n"
+
+    def test_extract_all_text_exception(self, tmp_path):
+        """Test extracting text from an invalid file."""
+        input_path = tmp_path / "input.pdf"
+        input_path.touch()
+
+        assert TextExtractor.extract_all_text(input_path) == ""
+
+    def test_iter_page_text_flushes_page_caches(self, make_pdf, monkeypatch):
+        """Test that each page's parsed objects are released after extraction."""
+        input_path = make_pdf(texts=["Alpha", "Beta"])
+        flushed = []
+
+        import pdfplumber.page
+        original = pdfplumber.page.Page.flush_cache
+
+        def recording_flush(page, *args, **kwargs):
+            flushed.append(page.page_number)
+            return original(page, *args, **kwargs)
+
+        monkeypatch.setattr(pdfplumber.page.Page, "flush_cache", recording_flush)
+
+        pages = []
+        for page_num, text in TextExtractor.iter_page_text(input_path):
+            pages.append((page_num, text))
+            assert flushed[-1] == page_num + 1
+
+        assert pages == [(0, "Alpha"), (1, "Beta")]
+
+    def test_write_text_to_stream(self, make_pdf):
+        """Test streaming extracted text to a file-like object."""
+        input_path = make_pdf(texts=["Alpha", "Beta"])
+        output = io.StringIO()
+
+        assert TextExtractor.write_text(input_path, output) is True
+        assert output.getvalue() == "Alpha\n\nBeta\n\n"
+
+    def test_write_text_to_path(self, make_pdf, tmp_path):
+        """Test streaming extracted text to a file path."""
+        input_path = make_pdf(texts=["Alpha", "Beta"])
+        output_path = tmp_path / "output.txt"
+
+        assert TextExtractor.write_text(input_path, output_path, [1]) is True
+        assert output_path.read_text(encoding="utf-8") == "Beta\n\n"
+
+    def test_write_text_exception(self, tmp_path):
+        """Test writing text from an invalid file."""
+        input_path = tmp_path / "input.pdf"
+        input_path.touch()
+
+        assert TextExtractor.write_text(input_path, io.StringIO()) is False
+
+    def test_extract_text_parallel(self, make_pdf):
+        """Test that parallel extraction matches serial extraction and order."""
+        input_path = make_pdf(texts=[f"Text {i}" for i in range(9)])
+        page_numbers = [8, 1, 4, 4, 0, 7, 20]
+
+        result = TextExtractor.extract_text_parallel(input_path, page_numbers, workers=3, chunk_size=2)
+
+        assert result == TextExtractor.extract_text_from_pages(input_path, page_numbers)
+        assert list(result) == [8, 1, 4, 0, 7]
+
+    def test_extract_text_parallel_all_pages(self, make_pdf):
+        """Test parallel extraction of every page."""
+        input_path = make_pdf(texts=["Alpha", "Beta", "Gamma"])
+
+        result = TextExtractor.extract_text_parallel(input_path, workers=2, chunk_size=1)
+
+        assert result == {0: "Alpha", 1: "Beta", 2: "Gamma"}
+
+    @fork_only
+    def test_extract_text_parallel_opens_once_per_worker(self, make_pdf, pdfplumber_opens):
+        """Test that every worker extracts all of its chunks from one open document."""
+        input_path = make_pdf(texts=[f"Text {i}" for i in range(12)])
+
+        result = TextExtractor.extract_text_parallel(input_path, workers=2, chunk_size=1)
+
+        opens = pdfplumber_opens()
+        assert len(result) == 12
+        assert os.getpid() not in opens
+        assert all(opens.count(pid) == 1 for pid in opens)
+
+
+class TestTextEngines:
+    """Test cases for selectable text extraction engines."""
+
+    def test_pypdf_engine(self, make_pdf):
+        """Test extracting text with the pypdf engine."""
+        input_path = make_pdf(texts=["Alpha one", "Beta two"])
+
+        result = TextExtractor.extract_text_from_pages(input_path, engine="pypdf")
+
+        assert result == {0: "Alpha one", 1: "Beta two"}
+
+    def test_auto_engine_prefers_pypdf_for_clean_text(self, make_pdf):
+        """Test that auto picks the fast engine when the sample text is clean."""
+        input_path = make_pdf(texts=["The quick brown fox jumps over the lazy dog"])
+
+        assert TextExtractor.choose_engine(input_path) == "pypdf"
+
+    def test_auto_engine_falls_back_without_text(self, tmp_path):
+        """Test that auto picks pdfplumber when pypdf finds no text."""
+        from pypdf import PdfWriter
+
+        input_path = tmp_path / "blank.pdf"
+        writer = PdfWriter()
+        writer.add_blank_page(612, 792)
+        with open(input_path, 'wb') as output_file:
+            writer.write(output_file)
+
+        assert TextExtractor.choose_engine(input_path) == "pdfplumber"
+
+    def test_unknown_engine(self, make_pdf):
+        """Test that an unknown engine fails cleanly."""
+        input_path = make_pdf()
+
+        with pytest.raises(ValueError):
+            TextExtractor.choose_engine(input_path, "tesseract")
+        assert TextExtractor.extract_text_from_pages(input_path, engine="tesseract") == {}
+
+    def test_parallel_with_engine(self, make_pdf):
+        """Test that workers use the selected engine."""
+        input_path = make_pdf(texts=["Alpha", "Beta", "Gamma"])
+
+        result = TextExtractor.extract_text_parallel(input_path, workers=2, chunk_size=1, engine="pypdf")
+
+        assert result == {0: "Alpha", 1: "Beta", 2: "Gamma"}
+
+    def test_benchmark_engines(self, make_pdf):
+        """Test the engine comparison report."""
+        input_path = make_pdf(texts=["Alpha", "Beta"])
+
+        report = TextExtractor.benchmark_engines([input_path, input_path])
+
+        assert set(report) == {"pdfplumber", "pypdf"}
+        for stats in report.values():
+            assert stats["pages"] == 4
+            assert stats["similarity"] == pytest.approx(1.0)
+            assert stats["pages_differing"] == 0
+            assert stats["pages_per_second"] > 0
+
+
+class TestTextCache:
+    """Test cases for the persistent page text cache."""
+
+    def test_warm_cache_skips_extraction(self, make_pdf, tmp_path, monkeypatch):
+        """Test that cached pages are served without opening the PDF."""
+        input_path = make_pdf(texts=["Alpha", "Beta"])
+        cache = TextCache(tmp_path / "cache" / "text.sqlite3")
+
+        first = TextExtractor.extract_text_from_pages(input_path, cache=cache)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("PDF should not be opened")
+
+        monkeypatch.setattr(TextExtractor, "_open_document", staticmethod(fail))
+        second = TextExtractor.extract_text_from_pages(input_path, cache=cache)
+
+        assert second == first == {0: "Alpha", 1: "Beta"}
+        assert TextExtractor.extract_all_text(input_path, cache=cache) == "Alpha\n\nBeta\n\n"
+        assert cache.stats()["hits"] >= 4
+
+    def test_only_missing_pages_extracted(self, make_pdf, tmp_path, monkeypatch):
+        """Test that a partially warm cache extracts only the missing pages."""
+        input_path = make_pdf(texts=["Alpha", "Beta", "Gamma"])
+        cache = TextCache(tmp_path / "text.sqlite3")
+        TextExtractor.extract_text_from_pages(input_path, [1], cache=cache)
+
+        requested = []
+        original = TextExtractor._iter_document_pages
+
+        def tracking(document, page_numbers, engine):
+            requested.append(list(page_numbers))
+            return original(document, page_numbers, engine)
+
+        monkeypatch.setattr(TextExtractor, "_iter_document_pages", staticmethod(tracking))
+        result = TextExtractor.extract_text_from_pages(input_path, [2, 1, 0], cache=cache)
+
+        assert requested == [[2, 0]]
+        assert list(result.items()) == [(2, "Gamma"), (1, "Beta"), (0, "Alpha")]
+
+    def test_cold_cache_opens_document_once(self, make_pdf, tmp_path, monkeypatch, pdfplumber_opens):
+        """Test that the page count comes from the extractor's document, not the shared pool."""
+        from src.core import document_pool
+
+        def fail(*args, **kwargs):
+            raise AssertionError("the shared pool should not be used")
+
+        monkeypatch.setattr(document_pool.default_pool, "page_count", fail)
+        monkeypatch.setattr(document_pool.default_pool, "get_reader", fail)
+        input_path = make_pdf(texts=["Alpha", "Beta"])
+        cache = TextCache(tmp_path / "text.sqlite3")
+
+        result = TextExtractor.extract_text_from_pages(input_path, cache=cache)
+
+        assert result == {0: "Alpha", 1: "Beta"}
+        assert len(pdfplumber_opens()) == 1
+
+    def test_engine_is_part_of_key(self, make_pdf, tmp_path):
+        """Test that text cached by one engine is not reused by another."""
+        input_path = make_pdf(texts=["Alpha"])
+        cache = TextCache(tmp_path / "text.sqlite3")
+
+        TextExtractor.extract_text_from_pages(input_path, engine="pypdf", cache=cache)
+        TextExtractor.extract_text_from_pages(input_path, engine="pdfplumber", cache=cache)
+
+        assert cache.stats()["entries"] == 2
+        assert cache.stats()["hits"] == 0
+
+    def test_eviction_respects_budget(self, tmp_path):
+        """Test that least recently used pages are evicted over budget."""
+        cache = TextCache(tmp_path / "text.sqlite3", max_bytes=10)
+
+        cache.put_many("doc", "params", {0: "12345"})
+        cache.put_many("doc", "params", {1: "67890"})
+        cache.get_many("doc", "params", [0])
+        cache.put_many("doc", "params", {2: "abcde"})
+
+        stats = cache.stats()
+        assert stats["bytes"] <= 10
+        assert stats["evictions"] == 1
+        assert set(cache.get_many("doc", "params", [0, 1, 2])) == {0, 2}
+
+    def test_budget_shared_between_instances(self, tmp_path):
+        """Test that two caches on the same file respect one byte budget."""
+        first = TextCache(tmp_path / "text.sqlite3", max_bytes=10)
+        second = TextCache(tmp_path / "text.sqlite3", max_bytes=10)
+
+        first.put_many("doc", "params", {0: "12345"})
+        second.put_many("doc", "params", {1: "67890"})
+        first.put_many("doc", "params", {2: "abcde"})
+
+        assert first.stats()["bytes"] <= 10
+        assert set(second.get_many("doc", "params", [0, 1, 2])) == {1, 2}
+
+    def test_parallel_uses_cache(self, make_pdf, tmp_path):
+        """Test that parallel extraction reads and fills the cache."""
+        input_path = make_pdf(texts=["Alpha", "Beta", "Gamma"])
+        cache = TextCache(tmp_path / "text.sqlite3")
+        TextExtractor.extract_text_from_pages(input_path, [0], engine="pypdf", cache=cache)
+
+        result = TextExtractor.extract_text_parallel(
+            input_path, workers=2, chunk_size=1, engine="pypdf", cache=cache
+        )
+
+        assert result == {0: "Alpha", 1: "Beta", 2: "Gamma"}
+        assert cache.stats()["entries"] == 3
+
+
+class TestTextSearch:
+    """Test cases for searching text inside a document."""
+
+    def test_search_yields_hits_with_bbox(self, make_pdf):
+        """Test that hits report the page, offset and position of a match."""
+        input_path = make_pdf(texts=["Invoice 12345 paid", "Nothing here", "Invoice 12345 copy"])
+
+        hits = list(TextExtractor.search(input_path, "invoice 12345"))
+
+        assert [hit.page for hit in hits] == [0, 2]
+        assert all(isinstance(hit, SearchHit) for hit in hits)
+        assert hits[0].offset == 0
+        assert hits[0].text == "Invoice 12345"
+        x0, top, x1, bottom = hits[0].bbox
+        assert x0 == pytest.approx(72, abs=1)
+        assert x1 > x0 and bottom > top
+
+    def test_search_stops_early(self, make_pdf, monkeypatch):
+        """Test that max_hits stops scanning once enough hits were found."""
+        from src.core import text_extractor
+
+        input_path = make_pdf(texts=["match", "match", "match"])
+        scanned = []
+        original = text_extractor._release_page
+
+        def tracking(page):
+            scanned.append(page.page_number)
+            original(page)
+
+        monkeypatch.setattr(text_extractor, "_release_page", tracking)
+        hits = list(TextExtractor.search(input_path, "match", max_hits=1))
+
+        assert [hit.page for hit in hits] == [0]
+        assert scanned == [1]
+
+    def test_search_options(self, make_pdf):
+        """Test case sensitivity, regular expressions and page selection."""
+        input_path = make_pdf(texts=["Order A-17", "order B-42"])
+
+        assert [hit.page for hit in TextExtractor.search(input_path, "Order", case_sensitive=True)] == [0]
+        assert [hit.text for hit in TextExtractor.search(input_path, r"[A-Z]-\d+", regex=True)] == ["A-17", "B-42"]
+        assert [hit.page for hit in TextExtractor.search(input_path, "order", page_numbers=[1])] == [1]
+        assert list(TextExtractor.search(input_path, "   ")) == []
+
+    def test_parallel_search(self, make_pdf):
+        """Test that parallel search returns hits in page order and honours max_hits."""
+        input_path = make_pdf(texts=["Alpha", "Beta", "Alpha", "Alpha"])
+
+        hits = list(TextExtractor.search(input_path, "alpha", workers=2, chunk_size=1))
+        limited = list(TextExtractor.search(input_path, "alpha", workers=2, chunk_size=1, max_hits=2))
+
+        assert [hit.page for hit in hits] == [0, 2, 3]
+        assert [hit.page for hit in limited] == [0, 2]
+        assert hits[:2] == limited
+
+    @fork_only
+    def test_parallel_search_opens_once_per_worker(self, make_pdf, pdfplumber_opens):
+        """Test that every search worker scans all of its chunks from one open document."""
+        input_path = make_pdf(texts=["Alpha", "Beta"] * 6)
+
+        hits = list(TextExtractor.search(input_path, "alpha", workers=2, chunk_size=1))
+
+        opens = pdfplumber_opens()
+        assert [hit.page for hit in hits] == list(range(0, 12, 2))
+        assert os.getpid() not in opens
+        assert all(opens.count(pid) == 1 for pid in opens)
+
+
+@pytest.mark.skipif(
+    multiprocessing.get_start_method() != "fork",
+    reason="workers must inherit the patched extractor",
+)
+class TestIsolatedExtraction:
+    """Test cases for extraction with per-page budgets."""
+
+    @pytest.fixture
+    def pathological(self, monkeypatch):
+        """Make pdfplumber misbehave on pages whose text names a failure."""
+        original = pdfplumber.page.Page.extract_text
+
+        def extract_text(page, **kwargs):
+            text = original(page, **kwargs)
+            if "slow" in text:
+                time.sleep(30)
+            elif "huge" in text:
+                raise MemoryError()
+            elif "crash" in text:
+                os._exit(1)
+            return text
+
+        monkeypatch.setattr(pdfplumber.page.Page, "extract_text", extract_text)
+
+    def test_clean_document(self, make_pdf):
+        """Test that a normal document is extracted without degradation."""
+        input_path = make_pdf(texts=["Alpha", "Beta", "Gamma"])
+
+        result, degraded = TextExtractor.extract_text_isolated(input_path, [2, 0, 1, 7], workers=2)
+
+        assert list(result.items()) == [(2, "Gamma"), (0, "Alpha"), (1, "Beta")]
+        assert degraded == {}
+
+    def test_degraded_pages_fall_back(self, make_pdf, pathological):
+        """Test that slow, oversized and crashing pages fall back to pypdf."""
+        input_path = make_pdf(texts=["Alpha", "slow page", "huge page", "crash page", "Omega"])
+
+        start = time.monotonic()
+        result, degraded = TextExtractor.extract_text_isolated(
+            input_path, workers=2, page_timeout=1.0
+        )
+
+        assert time.monotonic() - start < 10
+        assert degraded == {1: "timeout", 2: "memory", 3: "crashed"}
+        assert result == {0: "Alpha", 1: "slow page", 2: "huge page", 3: "crash page", 4: "Omega"}
+
+    def test_degraded_pages_skipped(self, make_pdf, pathological):
+        """Test that degraded pages are left out without a fallback."""
+        input_path = make_pdf(texts=["Alpha", "slow page", "Omega"])
+
+        result, degraded = TextExtractor.extract_text_isolated(
+            input_path, workers=1, page_timeout=0.5, fallback=None
+        )
+
+        assert result == {0: "Alpha", 2: "Omega"}
+        assert degraded == {1: "timeout"}
+
+    def test_fallback_held_to_budget(self, make_pdf, pathological, monkeypatch):
+        """Test that the fallback engine runs under the same page timeout."""
+        original = pypdf.PageObject.extract_text
+
+        def extract_text(page, *args, **kwargs):
+            text = original(page, *args, **kwargs)
+            if "slow" in text:
+                time.sleep(30)
+            return text
+
+        monkeypatch.setattr(pypdf.PageObject, "extract_text", extract_text)
+        input_path = make_pdf(texts=["Alpha", "slow page", "Omega"])
+
+        start = time.monotonic()
+        result, degraded = TextExtractor.extract_text_isolated(
+            input_path, workers=2, page_timeout=0.5
+        )
+
+        assert time.monotonic() - start < 10
+        assert result == {0: "Alpha", 2: "Omega"}
+        assert degraded == {1: "timeout"}
+
+    def test_no_retry_with_failed_engine(self, make_pdf, monkeypatch):
+        """Test that pages are not retried with the engine that failed."""
+        from src.core import text_extractor
+
+        runs = []
+
+        def time_out_everything(input_path, page_numbers, engine, *args):
+            runs.append(engine)
+            return {}, {page_num: "timeout" for page_num in page_numbers}
+
+        monkeypatch.setattr(text_extractor, "_run_page_workers", time_out_everything)
+        input_path = make_pdf(texts=["Alpha"])
+
+        result, degraded = TextExtractor.extract_text_isolated(input_path, engine="pypdf")
+
+        assert runs == ["pypdf"]
+        assert result == {}
+        assert degraded == {0: "timeout"}
+
+    def test_open_time_not_charged_to_pages(self, make_pdf, monkeypatch):
+        """Test that a slow document open does not time out the first pages."""
+        from src.core import text_extractor
+
+        original = text_extractor.PdfReader
+
+        def slow_reader(*args, **kwargs):
+            time.sleep(1.0)
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(text_extractor, "PdfReader", slow_reader)
+        input_path = make_pdf(texts=["Alpha", "Beta", "Gamma", "Delta"])
+
+        result, degraded = TextExtractor.extract_text_isolated(
+            input_path, engine="pypdf", workers=2, page_timeout=0.5, fallback=None
+        )
+
+        assert degraded == {}
+        assert result == {0: "Alpha", 1: "Beta", 2: "Gamma", 3: "Delta"}
+
+
+class TestWordExport:
+    """Test cases for word-level extraction."""
+
+    def test_extract_words(self, make_pdf):
+        """Test that words come back with positions and fonts."""
+        input_path = make_pdf(texts=["Hello world", "Second page"])
+
+        words = TextExtractor.extract_words(input_path)
+
+        assert [(word.page, word.text) for word in words] == [
+            (0, "Hello"), (0, "world"), (1, "Second"), (1, "page")
+        ]
+        assert words[0].x0 == pytest.approx(72, abs=0.01)
+        assert words[0].top == pytest.approx(72 - 24 * 0.718, abs=3)
+        assert words[0].size == pytest.approx(24)
+        assert words[0].font == "Helvetica"
+
+    def test_write_words_ndjson(self, make_pdf, tmp_path):
+        """Test streaming words to an NDJSON file."""
+        input_path = make_pdf(texts=["Hello world", "Second page"])
+        output_path = tmp_path / "words.ndjson"
+
+        assert TextExtractor.write_words(input_path, output_path, page_numbers=[1])
+
+        records = [json.loads(line) for line in output_path.read_text(encoding="utf-8").splitlines()]
+        assert [record["text"] for record in records] == ["Second", "page"]
+        assert all(record["page"] == 1 for record in records)
+
+    def test_write_words_binary(self, make_pdf, tmp_path):
+        """Test that the binary export matches extract_words."""
+        input_path = make_pdf(texts=["Hello world", "Second page"])
+        output_path = tmp_path / "words.bin"
+
+        assert TextExtractor.write_words(input_path, output_path, fmt="binary")
+
+        with open(output_path, 'rb') as f:
+            assert list(WordTable.read_binary(f)) == list(TextExtractor.extract_words(input_path))
+
+    def test_write_words_unknown_format(self, make_pdf, tmp_path):
+        """Test that an unknown format fails cleanly."""
+        input_path = make_pdf()
+
+        assert not TextExtractor.write_words(input_path, tmp_path / "words.xml", fmt="xml")
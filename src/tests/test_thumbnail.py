@@ -0,0 +1,328 @@
+"""
+Unit tests for the thumbnail generator module.
+"""
+import io
+
+import pytest
+from PIL import Image
+
+from src.core.thumbnail import ThumbnailGenerator, ThumbnailCache
+
+
+class TestThumbnailGenerator:
+    """Test cases for the ThumbnailGenerator class."""
+
+    def test_generate_thumbnail(self, make_pdf):
+        """Test generating a thumbnail for a single page."""
+        input_path = make_pdf()
+
+        thumbnail = ThumbnailGenerator.generate_thumbnail(input_path, 0, (100, 100))
+
+        assert thumbnail is not None
+        assert max(thumbnail.size) == 100
+
+    def test_generate_thumbnail_out_of_range(self, make_pdf):
+        """Test generating a thumbnail for a page that does not exist."""
+        input_path = make_pdf()
+
+        assert ThumbnailGenerator.generate_thumbnail(input_path, 10) is None
+
+    def test_generate_thumbnails_opens_document_once(self, make_pdf, monkeypatch):
+        """Test that batch generation parses the document a single time."""
+        input_path = make_pdf(texts=[f"Page {i}" for i in range(5)])
+
+        import pypdfium2
+        opened = []
+        original = pypdfium2.PdfDocument
+
+        def counting_document(*args, **kwargs):
+            opened.append(args)
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr("src.core.thumbnail.pypdfium2.PdfDocument", counting_document)
+
+        thumbnails = ThumbnailGenerator.generate_thumbnails(input_path, [0, 2, 4, 9])
+
+        assert len(thumbnails) == 3
+        assert len(opened) == 1
+
+    def test_generate_thumbnail_renders_at_target_scale(self, make_pdf, monkeypatch):
+        """Test that pages are rasterized near the thumbnail size, not full size."""
+        input_path = make_pdf(texts=["Page 1"])
+
+        import pypdfium2
+        scales = []
+        original = pypdfium2.PdfPage.render
+
+        def recording_render(page, **kwargs):
+            scales.append(kwargs["scale"])
+            return original(page, **kwargs)
+
+        monkeypatch.setattr(pypdfium2.PdfPage, "render", recording_render)
+
+        thumbnail = ThumbnailGenerator.generate_thumbnail(input_path, 0, (100, 100), quality="fast")
+
+        assert scales == [pytest.approx(100 / 792)]
+        assert thumbnail.size[1] == 100
+
+    @pytest.mark.parametrize("quality", ["fast", "balanced", "high"])
+    def test_generate_thumbnail_quality(self, make_pdf, quality):
+        """Test every quality preset fits the requested box."""
+        input_path = make_pdf(texts=["Page 1"], page_size=(792, 612))
+
+        thumbnail = ThumbnailGenerator.generate_thumbnail(input_path, 0, (120, 120), quality=quality)
+
+        assert thumbnail.size[0] == 120 and thumbnail.size[1] <= 120
+
+    def test_generate_thumbnail_unknown_quality(self, make_pdf):
+        """Test that an unknown quality preset fails cleanly."""
+        input_path = make_pdf()
+
+        assert ThumbnailGenerator.generate_thumbnail(input_path, 0, quality="ultra") is None
+
+    def test_generate_thumbnails_exception(self, tmp_path):
+        """Test generating thumbnails from an invalid file."""
+        input_path = tmp_path / "input.pdf"
+        input_path.touch()
+
+        assert ThumbnailGenerator.generate_thumbnails(input_path) == []
+
+
+class TestThumbnailCache:
+    """Test cases for the ThumbnailCache class."""
+
+    def test_cache_hit_skips_rendering(self, make_pdf, tmp_path, monkeypatch):
+        """Test that a warm cache serves thumbnails without opening the PDF."""
+        input_path = make_pdf()
+        cache = ThumbnailCache(tmp_path / "cache")
+
+        cold = ThumbnailGenerator.generate_thumbnails(input_path, [0, 1, 2], cache=cache)
+
+        def fail_open(*args, **kwargs):
+            raise AssertionError("document should not be opened")
+
+        monkeypatch.setattr("src.core.thumbnail.pypdfium2.PdfDocument", fail_open)
+        warm = ThumbnailGenerator.generate_thumbnails(input_path, [0, 1, 2], cache=cache)
+
+        assert [img.size for img in warm] == [img.size for img in cold]
+        assert [img.tobytes() for img in warm] == [img.tobytes() for img in cold]
+        stats = cache.stats()
+        assert stats["hits"] == 3
+        assert stats["misses"] == 3
+        assert stats["entries"] == 3
+
+    def test_cache_persists_across_instances(self, make_pdf, tmp_path):
+        """Test that entries are found again by a new cache instance."""
+        input_path = make_pdf()
+        ThumbnailGenerator.generate_thumbnails(input_path, [0], cache=ThumbnailCache(tmp_path / "cache"))
+
+        cache = ThumbnailCache(tmp_path / "cache")
+        ThumbnailGenerator.generate_thumbnails(input_path, [0], cache=cache)
+
+        assert cache.stats()["hits"] == 1
+
+    def test_cache_key_changes_with_render_parameters(self, make_pdf, tmp_path):
+        """Test that size, page and file content all take part in the key."""
+        input_path = make_pdf()
+        key = ThumbnailCache.make_key(input_path, 0, (200, 200))
+
+        assert key != ThumbnailCache.make_key(input_path, 1, (200, 200))
+        assert key != ThumbnailCache.make_key(input_path, 0, (100, 100))
+        assert key != ThumbnailCache.make_key(input_path, 0, (200, 200), quality="fast")
+
+        make_pdf(texts=["Changed"])
+        assert key != ThumbnailCache.make_key(input_path, 0, (200, 200))
+
+    def test_cache_evicts_least_recently_used(self, make_pdf, tmp_path):
+        """Test that the byte budget evicts the oldest entries first."""
+        input_path = make_pdf()
+        cache = ThumbnailCache(tmp_path / "cache")
+        ThumbnailGenerator.generate_thumbnails(input_path, [0, 1, 2], cache=cache)
+        entry_size = cache.stats()["bytes"] // 3
+
+        # Touch page 0 so page 1 becomes the oldest entry
+        cache.get(cache.make_key(input_path, 0, (200, 200)))
+        cache.max_bytes = entry_size * 2 + entry_size // 2
+        ThumbnailGenerator.generate_thumbnails(input_path, [0], size=(50, 50), cache=cache)
+
+        stats = cache.stats()
+        assert stats["bytes"] <= cache.max_bytes
+        assert stats["evictions"] >= 1
+        assert cache.get(cache.make_key(input_path, 1, (200, 200))) is None
+        assert cache.get(cache.make_key(input_path, 0, (200, 200))) is not None
+
+
+class TestParallelThumbnails:
+    """Test cases for process-pool thumbnail generation."""
+
+    def test_parallel_matches_serial_order(self, make_pdf):
+        """Test that parallel rendering returns the same images in request order."""
+        input_path = make_pdf(texts=[f"Page {i}" for i in range(7)])
+        page_numbers = [6, 0, 3, 3, 1, 5]
+
+        serial = ThumbnailGenerator.generate_thumbnails(input_path, page_numbers)
+        parallel = ThumbnailGenerator.generate_thumbnails_parallel(
+            input_path, page_numbers, workers=2, chunk_size=2
+        )
+
+        assert [img.tobytes() for img in parallel] == [img.tobytes() for img in serial]
+
+    def test_parallel_populates_cache(self, make_pdf, tmp_path):
+        """Test that pages rendered by workers are stored in the cache."""
+        input_path = make_pdf()
+        cache = ThumbnailCache(tmp_path / "cache")
+
+        ThumbnailGenerator.generate_thumbnails_parallel(input_path, cache=cache, workers=2, chunk_size=1)
+        thumbnails = ThumbnailGenerator.generate_thumbnails_parallel(input_path, cache=cache, workers=2)
+
+        assert len(thumbnails) == 3
+        assert cache.stats()["hits"] == 3
+
+    def test_parallel_skips_invalid_pages(self, make_pdf):
+        """Test that out-of-range pages are skipped like in serial mode."""
+        input_path = make_pdf()
+
+        thumbnails = ThumbnailGenerator.generate_thumbnails_parallel(input_path, [0, 42], workers=2)
+
+        assert len(thumbnails) == 1
+
+
+class TestIterThumbnails:
+    """Test cases for the streaming thumbnail API."""
+
+    def test_iter_thumbnails_yields_page_indices(self, make_pdf):
+        """Test that pages are yielded with their indices in request order."""
+        input_path = make_pdf()
+
+        pages = [page for page, _ in ThumbnailGenerator.iter_thumbnails(input_path, [2, 0, 7])]
+
+        assert pages == [2, 0]
+
+    def test_iter_thumbnails_is_lazy(self, make_pdf, monkeypatch):
+        """Test that the first page is available before later pages are rendered."""
+        input_path = make_pdf()
+        rendered = []
+        original = ThumbnailGenerator._render_page
+
+        def recording_render(pdf, page_number, size, quality):
+            rendered.append(page_number)
+            return original(pdf, page_number, size, quality)
+
+        monkeypatch.setattr(ThumbnailGenerator, "_render_page", staticmethod(recording_render))
+
+        iterator = ThumbnailGenerator.iter_thumbnails(input_path)
+        page, image = next(iterator)
+        iterator.close()
+
+        assert page == 0
+        assert image is not None
+        assert rendered == [0]
+
+
+def _add_embedded_thumbnails(input_path, jpeg=False):
+    """Attach a solid red /Thumb image to every page of a PDF."""
+    from pypdf import PdfReader, PdfWriter
+    from pypdf.generic import DecodedStreamObject, NameObject, NumberObject
+
+    reader = PdfReader(str(input_path))
+    writer = PdfWriter()
+    red = Image.new("RGB", (40, 52), (255, 0, 0))
+
+    for page in reader.pages:
+        page = writer.add_page(page)
+        thumb = DecodedStreamObject()
+        if jpeg:
+            data = io.BytesIO()
+            red.save(data, format="JPEG")
+            thumb._data = data.getvalue()
+            thumb[NameObject("/Filter")] = NameObject("/DCTDecode")
+        else:
+            thumb.set_data(red.tobytes())
+        thumb[NameObject("/Width")] = NumberObject(40)
+        thumb[NameObject("/Height")] = NumberObject(52)
+        thumb[NameObject("/ColorSpace")] = NameObject("/DeviceRGB")
+        thumb[NameObject("/BitsPerComponent")] = NumberObject(8)
+        page[NameObject("/Thumb")] = writer._add_object(thumb)
+
+    with open(str(input_path), 'wb') as output_file:
+        writer.write(output_file)
+
+
+class TestEmbeddedThumbnails:
+    """Test cases for the embedded /Thumb fast path."""
+
+    @pytest.mark.parametrize("jpeg", [False, True])
+    def test_embedded_thumbnail_used(self, make_pdf, monkeypatch, jpeg):
+        """Test that embedded thumbnails are decoded instead of rendering pages."""
+        input_path = make_pdf()
+        _add_embedded_thumbnails(input_path, jpeg=jpeg)
+
+        def fail_render(*args, **kwargs):
+            raise AssertionError("page should not be rendered")
+
+        monkeypatch.setattr(ThumbnailGenerator, "_render_page", staticmethod(fail_render))
+
+        thumbnails = list(ThumbnailGenerator.iter_thumbnails(input_path, use_embedded=True))
+
+        assert [page for page, _ in thumbnails] == [0, 1, 2]
+        for _, image in thumbnails:
+            assert image.info["thumbnail_source"] == "embedded"
+            assert image.size == (40, 52)
+            red, green, blue = image.getpixel((20, 26))
+            assert red > 240 and green < 15 and blue < 15
+
+    def test_embedded_thumbnail_fallback(self, make_pdf):
+        """Test that pages without /Thumb are rendered."""
+        input_path = make_pdf()
+
+        thumbnails = ThumbnailGenerator.generate_thumbnails(input_path, use_embedded=True)
+
+        assert [img.info["thumbnail_source"] for img in thumbnails] == ["rendered"] * 3
+
+    def test_embedded_thumbnail_ignored_by_default(self, make_pdf):
+        """Test that embedded thumbnails are only used when requested."""
+        input_path = make_pdf()
+        _add_embedded_thumbnails(input_path)
+
+        thumbnail = ThumbnailGenerator.generate_thumbnail(input_path, 0)
+
+        assert thumbnail.info["thumbnail_source"] == "rendered"
+
+
+class TestThumbnailLevels:
+    """Test cases for multi-resolution thumbnail generation."""
+
+    def test_levels_coarse_pass_completes_first(self, make_pdf):
+        """Test that every page gets a preview before any full thumbnail."""
+        input_path = make_pdf()
+        levels = (((30, 30), "fast"), ((120, 120), "balanced"))
+
+        results = list(ThumbnailGenerator.iter_thumbnail_levels(input_path, levels=levels))
+
+        assert [(level, page) for level, page, _ in results] == [
+            (0, 0), (0, 1), (0, 2), (1, 0), (1, 1), (1, 2)
+        ]
+        assert max(results[0][2].size) == 30
+        assert max(results[-1][2].size) == 120
+
+    def test_levels_priority_pages_first(self, make_pdf):
+        """Test that finer levels start with the pages reported by priority."""
+        input_path = make_pdf(texts=[f"Page {i}" for i in range(5)])
+        levels = (((30, 30), "fast"), ((60, 60), "fast"))
+
+        results = list(ThumbnailGenerator.iter_thumbnail_levels(
+            input_path, levels=levels, priority=lambda: [3, 4]
+        ))
+
+        assert [page for level, page, _ in results if level == 1] == [3, 4, 0, 1, 2]
+
+    def test_levels_cached_separately(self, make_pdf, tmp_path):
+        """Test that each level is stored in the cache."""
+        input_path = make_pdf()
+        cache = ThumbnailCache(tmp_path / "cache")
+
+        list(ThumbnailGenerator.iter_thumbnail_levels(input_path, cache=cache))
+        results = list(ThumbnailGenerator.iter_thumbnail_levels(input_path, cache=cache))
+
+        assert {image.info["thumbnail_source"] for _, _, image in results} == {"cache"}
+        assert cache.stats()["entries"] == 6
@@ -0,0 +1,81 @@
+"""
+Unit tests for the word table module.
+"""
+import io
+import json
+
+import pytest
+
+from src.core.word_table import BinaryWordWriter, Word, WordTable
+
+
+def _make_table(page=0):
+    """Build a table with a repeated word and font."""
+    table = WordTable()
+    table.append(page, "Hello", 72.0, 50.5, 110.25, 74.5, 24.0, "Helvetica")
+    table.append(page, "world", 115.0, 50.5, 170.0, 74.5, 24.0, "Helvetica")
+    table.append(page, "Hello", 72.0, 90.0, 110.25, 114.0, 12.0, "Courier")
+    return table
+
+
+class TestWordTable:
+    """Test cases for the WordTable class."""
+
+    def test_append_and_read_back(self):
+        """Test that rows come back as Word tuples."""
+        table = _make_table()
+
+        assert len(table) == 3
+        assert table[1] == Word(0, "world", 115.0, 50.5, 170.0, 74.5, 24.0, "Helvetica")
+        assert [word.text for word in table] == ["Hello", "world", "Hello"]
+
+    def test_strings_are_interned(self):
+        """Test that repeated words and fonts are stored once."""
+        table = _make_table()
+
+        assert table.strings == ["Hello", "Helvetica", "world", "Courier"]
+        assert table.nbytes() == 3 * 32 + len("HelloHelveticaworldCourier")
+
+    def test_extend_words(self):
+        """Test adding pdfplumber word dictionaries."""
+        table = WordTable()
+        table.extend_words(2, [{"text": "Hi", "x0": 1, "top": 2, "x1": 3, "bottom": 4,
+                                "fontname": "Helvetica", "size": 10, "upright": True}])
+
+        assert table[0] == Word(2, "Hi", 1.0, 2.0, 3.0, 4.0, 10.0, "Helvetica")
+
+    def test_ndjson(self):
+        """Test newline-delimited JSON output."""
+        stream = io.StringIO()
+        _make_table().write_ndjson(stream)
+
+        records = [json.loads(line) for line in stream.getvalue().splitlines()]
+        assert len(records) == 3
+        assert records[0] == {"page": 0, "text": "Hello", "x0": 72.0, "top": 50.5, "x1": 110.25,
+                              "bottom": 74.5, "size": 24.0, "font": "Helvetica"}
+
+    def test_binary_round_trip(self):
+        """Test that the binary format restores the table."""
+        stream = io.BytesIO()
+        _make_table().write_binary(stream)
+        stream.seek(0)
+
+        assert list(WordTable.read_binary(stream)) == list(_make_table())
+
+    def test_binary_writer_shares_strings(self):
+        """Test writing several tables to one stream."""
+        stream = io.BytesIO()
+        writer = BinaryWordWriter(stream)
+        writer.write(_make_table(0))
+        writer.write(_make_table(1))
+        stream.seek(0)
+
+        table = WordTable.read_binary(stream)
+        assert len(table) == 6
+        assert list(table.page) == [0, 0, 0, 1, 1, 1]
+        assert stream.getvalue().count(b"Helvetica") == 1
+
+    def test_read_binary_rejects_other_data(self):
+        """Test that foreign data is refused."""
+        with pytest.raises(ValueError):
+            WordTable.read_binary(io.BytesIO(b"not words"))